@@ -1,8 +1,10 @@
+import math
 import pygame
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 from utils.config import config
 from utils.constants import BLINK_PRESETS
+from utils.frame_clock import frame_clock
 from animation.easing import lerp, Easing
 
 class BlinkController:
@@ -44,7 +46,7 @@ class BlinkController:
                 self.is_blinking = False
     
     def get_blink_ratio(self, current_time: int) -> float:
-        """現在のまばたき比率を計算し、最も近いプリセット値に丸める
+        """現在のまばたき比率を計算し、最も近い段階に丸める
         
         Args:
             current_time: 現在時刻（ミリ秒）
@@ -69,11 +71,43 @@ class BlinkController:
         
         ratio = max(blink_height_ratio, min(1.0, ratio))
         
-        # 最も近いプリセット値に丸める
-        return min(BLINK_PRESETS, key=lambda x: abs(x - ratio))
+        return self.quantize_ratio(ratio)
+    
+    def get_ratio_steps(self) -> list:
+        """まばたき中に取り得る比率の一覧を取得"""
+        steps = self.animation_config['blink_steps']
+        if steps <= 1:
+            return list(BLINK_PRESETS)
+        
+        low = self.animation_config['blink_height_ratio']
+        return [low + (1.0 - low) * step / (steps - 1) for step in range(steps)]
+    
+    def quantize_ratio(self, ratio: float) -> float:
+        """まばたき比率をblink_steps段階に丸める（0以下の場合は最も近いプリセット値）
+        
+        段階数を有限にすることで、テクスチャのキャッシュと差分描画の判定が効くようにする。
+        """
+        steps = self.animation_config['blink_steps']
+        if steps <= 1:
+            return min(BLINK_PRESETS, key=lambda x: abs(x - ratio))
+        
+        low = self.animation_config['blink_height_ratio']
+        step = round((ratio - low) / (1.0 - low) * (steps - 1))
+        return low + (1.0 - low) * step / (steps - 1)
 
 class EyeMovementController:
-    """目の動きを制御するクラス"""
+    """目の動きを制御するクラス
+    
+    ターゲットへの移動は前回の更新からの経過時間で進めるため、フレームレートが
+    変わっても動きの速さは変わらない。移動の仕方はanimation.move_profileで選ぶ:
+        smooth:  指数関数的に近づく（move_half_life_msごとに残りの距離が半分になる）
+        saccade: 速度と加速度に上限を設け、加速→最高速→減速してターゲットで止まる
+    """
+    
+    # saccadeの積分の刻み（ミリ秒）。刻みを固定することで、フレームレートによらず同じ軌跡になる
+    SACCADE_STEP_MS = 4
+    # 1回の更新で進める時間の上限（ミリ秒、長い停止の後に大量の刻みを積分しないように）
+    MAX_UPDATE_MS = 1000
     
     def __init__(self, eye_width: int, eye_height: int):
         self.eye_width = eye_width
@@ -85,12 +119,23 @@ class EyeMovementController:
         """目の動きの状態をリセット"""
         self.eye_offset = pygame.math.Vector2(0, 0)
         self.target_offset = pygame.math.Vector2(0, 0)
+        self.velocity = pygame.math.Vector2(0, 0)  # saccadeの速度（ピクセル/秒）
+        self.pending_ms = 0  # saccadeでまだ積分していない時間（ミリ秒）
         self.last_look_time = 0
+        self.last_update_time = 0
         self.next_look_interval = random.randint(
             self.animation_config['look_interval_min'],
             self.animation_config['look_interval_max']
         )
     
+    def get_max_offset(self) -> Tuple[float, float]:
+        """目の移動範囲（中心からのオフセットの上限）を取得
+        
+        Returns:
+            (xの上限, yの上限)
+        """
+        return self.eye_width // 1.5, self.eye_height // 2.5
+    
     def get_new_target(self) -> pygame.math.Vector2:
         """新しい視線ターゲットを生成
         
@@ -98,8 +143,7 @@ class EyeMovementController:
             新しいターゲット座標
         """
         # 目の移動範囲を制限
-        max_x = self.eye_width // 1.5
-        max_y = self.eye_height // 2.5
+        max_x, max_y = self.get_max_offset()
         
         x = random.uniform(-max_x, max_x)
         y = random.uniform(-max_y, max_y)
@@ -111,7 +155,9 @@ class EyeMovementController:
         Args:
             current_time: 現在時刻（ミリ秒）
         """
-        # 視線の移動
+        self._advance(current_time)
+        
+        # 視線の移動（新しいターゲットへは次の更新から移動する）
         if current_time - self.last_look_time > self.next_look_interval:
             self.target_offset = self.get_new_target()
             self.last_look_time = current_time
@@ -119,10 +165,74 @@ class EyeMovementController:
                 self.animation_config['look_interval_min'],
                 self.animation_config['look_interval_max']
             )
+    
+    def _advance(self, current_time: int):
+        """前回の更新から現在時刻までの移動を進める
         
-        # 滑らかな移動
-        move_speed = self.animation_config['move_speed']
-        self.eye_offset = self.eye_offset.lerp(self.target_offset, move_speed)
+        この間は前回までのターゲットへ向かっていたものとする。同じ時刻で2回呼び出した
+        場合、2回目は何もしない。
+        
+        Args:
+            current_time: 現在時刻（ミリ秒）
+        """
+        elapsed_ms = min(max(0, current_time - self.last_update_time), self.MAX_UPDATE_MS)
+        self.last_update_time = current_time
+        
+        if self.animation_config['move_profile'] == 'saccade':
+            self._move_saccade(elapsed_ms)
+        else:
+            self._move_smooth(elapsed_ms)
+    
+    def _move_smooth(self, elapsed_ms: int):
+        """指数関数的にターゲットへ近づける
+        
+        Args:
+            elapsed_ms: 前回の更新からの経過時間（ミリ秒）
+        """
+        half_life = self.animation_config['move_half_life_ms']
+        if half_life <= 0:
+            self.eye_offset = pygame.math.Vector2(self.target_offset)
+            return
+        ratio = 1.0 - 0.5 ** (elapsed_ms / half_life)
+        self.eye_offset = self.eye_offset.lerp(self.target_offset, ratio)
+    
+    def _move_saccade(self, elapsed_ms: int):
+        """速度と加速度の上限付きでターゲットへ移動（台形の速度プロファイル）
+        
+        各刻みで、ターゲットまでの距離で止まれる速度（v^2 = 2ad）と最高速度の小さい方を
+        目標の速度とし、加速度の上限の範囲で速度を近づける。
+        
+        Args:
+            elapsed_ms: 前回の更新からの経過時間（ミリ秒）
+        """
+        max_speed = self.animation_config['saccade_max_speed']
+        max_accel = self.animation_config['saccade_max_accel']
+        step = self.SACCADE_STEP_MS / 1000.0
+        
+        self.pending_ms += elapsed_ms
+        while self.pending_ms >= self.SACCADE_STEP_MS:
+            self.pending_ms -= self.SACCADE_STEP_MS
+            
+            to_target = self.target_offset - self.eye_offset
+            distance = to_target.length()
+            if distance == 0:
+                self.velocity = pygame.math.Vector2(0, 0)
+                continue
+            
+            desired_speed = min(max_speed, math.sqrt(2.0 * max_accel * distance))
+            change = to_target * (desired_speed / distance) - self.velocity
+            max_change = max_accel * step
+            if change.length() > max_change:
+                change.scale_to_length(max_change)
+            self.velocity += change
+            
+            movement = self.velocity * step
+            if movement.length() >= distance:
+                # この刻みでターゲットに到達
+                self.eye_offset = pygame.math.Vector2(self.target_offset)
+                self.velocity = pygame.math.Vector2(0, 0)
+            else:
+                self.eye_offset += movement
     
     def get_current_offset(self) -> pygame.math.Vector2:
         """現在の目のオフセットを取得
@@ -132,13 +242,36 @@ class EyeMovementController:
         """
         return self.eye_offset
     
-    def set_target(self, target: pygame.math.Vector2):
-        """手動でターゲットを設定
+    def is_moving(self, threshold: float = 1.0) -> bool:
+        """視線がターゲットに向かって移動中かどうか
         
         Args:
-            target: 新しいターゲット座標
+            threshold: 移動中とみなす残り距離（ピクセル）
+            
+        Returns:
+            ターゲットまでの距離がthreshold以上ならTrue
+        """
+        return self.eye_offset.distance_to(self.target_offset) >= threshold
+    
+    def set_target(self, target: pygame.math.Vector2, current_time: Optional[int] = None):
+        """手動でターゲットを設定（次のランダムな視線移動は1間隔分延期される）
+        
+        コマンドはフレームのupdate()より前に適用されるため、先に現在時刻までの移動を
+        元のターゲットへ向けて進め、新しいターゲットへは現在時刻から移動する。
+        こうしないと、前のフレームからの経過時間（低いフレームレートほど長い）の分だけ
+        新しいターゲットへ早く移動してしまう。
+        
+        Args:
+            target: 新しいターゲット座標（目の移動範囲に制限される）
+            current_time: 現在時刻（ミリ秒、Noneの場合はframe_clock.now）
         """
-        self.target_offset = target
+        self._advance(frame_clock.now if current_time is None else current_time)
+        max_x, max_y = self.get_max_offset()
+        self.target_offset = pygame.math.Vector2(
+            max(-max_x, min(max_x, target.x)),
+            max(-max_y, min(max_y, target.y))
+        )
+        self.last_look_time = self.last_update_time
 
 class AnimationController:
     """アニメーション全体を制御するメインクラス"""
@@ -176,6 +309,10 @@ class AnimationController:
             'is_blinking': self.blink_controller.is_blinking
         }
     
+    def is_animating(self) -> bool:
+        """まばたきまたは視線移動が進行中かどうか"""
+        return self.blink_controller.is_blinking or self.eye_movement_controller.is_moving()
+    
     def set_eye_target(self, target: pygame.math.Vector2):
         """目のターゲットを手動設定
         
@@ -186,6 +323,6 @@ class AnimationController:
     
     def force_blink(self):
         """強制的にまばたきを開始"""
-        current_time = pygame.time.get_ticks()
+        current_time = frame_clock.now
         self.blink_controller.is_blinking = True
         self.blink_controller.blink_start_time = current_time
\ No newline at end of file
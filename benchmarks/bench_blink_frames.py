@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""まばたきの各段階の描画コストと、縮小で作ったテクスチャの見た目を確認するベンチマーク
+
+    描画コスト: 全段階について目1つの描画時間を計測し、開いた目と比べる
+    見た目:     プリセット間の段階について、実際に生成したテクスチャとの差を、
+                縮小したテクスチャと最も近いプリセットに丸めた場合（従来）で比較する
+
+使用方法:
+    python benchmarks/bench_blink_frames.py [描画回数]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from animation.controller import BlinkController
+from renderers.eye_renderer import EyeRenderer
+from utils.config import config
+
+
+def visible_pixels(texture: pygame.Surface, size: tuple) -> np.ndarray:
+    """実際の描画と同じく黒背景の中央へ加算合成した結果を取得"""
+    canvas = pygame.Surface(size)
+    canvas.fill((0, 0, 0))
+    position = ((size[0] - texture.get_width()) // 2, (size[1] - texture.get_height()) // 2)
+    canvas.blit(texture, position, special_flags=pygame.BLEND_ADD)
+    return pygame.surfarray.array3d(canvas).astype(int)
+
+
+def mean_diff(a: np.ndarray, b: np.ndarray) -> float:
+    """画素ごとの最大チャンネル差の平均"""
+    return float(np.abs(a - b).max(axis=2).mean())
+
+
+def main() -> int:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    pygame.init()
+    display_config = config.get_display_config()
+    screen = pygame.display.set_mode((display_config['width'], display_config['height']))
+
+    eye_config = config.get_eye_config()
+    width, height = eye_config['width'], eye_config['height']
+    ratios = BlinkController().get_ratio_steps()
+
+    renderer = EyeRenderer()
+    start = time.perf_counter()
+    renderer.preload_all_textures(width, height, ratios)
+    print(f"事前読み込み: {(time.perf_counter() - start) * 1000:.1f}ms（{len(ratios)}段階）")
+
+    center = screen.get_rect().center
+    offset = pygame.math.Vector2(0, 0)
+    costs = []
+    for ratio in ratios:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            renderer.draw_eye(screen, center, offset, width, height, ratio)
+        costs.append((time.perf_counter() - start) / repeat * 1e6)
+    open_cost = costs[-1]
+    print(f"描画コスト: 開いた目 {open_cost:.1f}us  全段階 平均 {sum(costs) / len(costs):.1f}us "
+          f"最大 {max(costs):.1f}us（{max(costs) / open_cost:.2f}倍）")
+
+    derived_diffs = []
+    snapped_diffs = []
+    for ratio in ratios:
+        if renderer.get_glow_key(width, int(height * ratio)) in renderer.atlas or int(height * ratio) <= 5:
+            continue
+        generated_texture = renderer.create_glow_texture(width, height, ratio)
+        size = (generated_texture.get_width() * 2, generated_texture.get_height() * 2)
+        generated = visible_pixels(generated_texture, size)
+        derived = visible_pixels(renderer.get_blink_frame(width, height, ratio), size)
+        snapped = visible_pixels(renderer.get_or_create_glow_texture(width, height, ratio), size)
+        derived_diffs.append(mean_diff(derived, generated))
+        snapped_diffs.append(mean_diff(snapped, generated))
+    print(f"生成したテクスチャとの差（画素平均/255）: 縮小 平均 {sum(derived_diffs) / len(derived_diffs):.2f} "
+          f"最悪 {max(derived_diffs):.2f}  プリセットに丸め 平均 {sum(snapped_diffs) / len(snapped_diffs):.2f} "
+          f"最悪 {max(snapped_diffs):.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""受信しないクライアントが混ざった状態でのブロードキャスト遅延を計測するベンチマーク
+
+通常のクライアント数台と、まったく受信しない（TCPの受信ウィンドウが埋まる）
+クライアント1台を接続し、broadcast_messageの所要時間と、通常クライアントに
+届くまでの遅延を計測する。各ポリシーでの停止クライアントの送信キュー統計も表示する。
+
+使用方法:
+    python benchmarks/bench_broadcast.py [メッセージ数] [通常クライアント数]
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.client_sender import ClientSender
+from core.command_interface import CommandInterface
+from utils.stats import RollingStats
+
+PAYLOAD = 'x' * 4096  # 停止クライアントの受信ウィンドウを早く埋めるための詰め物
+
+
+async def run_policy(policy: str, count: int, client_count: int):
+    interface = CommandInterface()
+    interface.host = '127.0.0.1'
+    interface.port = 0  # 空いているポートを使用
+    interface.binary_port = None
+    interface.udp_port = None
+    interface.send_queue_policy = policy
+    server_task = asyncio.create_task(interface.start_server())
+    while interface.server is None or not interface.server.sockets:
+        await asyncio.sleep(0.01)
+    port = interface.server.sockets[0].getsockname()[1]
+
+    # 受信しないクライアント（ブロッキングソケットを開いたまま読まない）
+    stalled = socket.socket()
+    stalled.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    stalled.connect(('127.0.0.1', port))
+
+    readers = []
+    for _ in range(client_count):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        readers.append((reader, writer))
+    while len(interface.clients) < client_count + 1:
+        await asyncio.sleep(0.01)
+    stalled_writer = next(w for w in interface.clients if w.get_extra_info('peername')[1] == stalled.getsockname()[1])
+    stalled_sender = interface.clients[stalled_writer]
+    # ループバックの大きな送信バッファで詰まりが隠れないよう、サーバー側も小さくする
+    stalled_writer.get_extra_info('socket').setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+    stalled_writer.transport.set_write_buffer_limits(high=16384)
+
+    broadcast_times = RollingStats(count)
+    delivery_times = RollingStats(count * client_count)
+    for i in range(count):
+        sent_at = time.perf_counter()
+        await interface.broadcast_message({'seq': i, 'sent_at': sent_at, 'pad': PAYLOAD})
+        broadcast_times.add((time.perf_counter() - sent_at) * 1000.0)
+        for reader, _ in readers:
+            message = json.loads(await reader.readline())
+            delivery_times.add((time.perf_counter() - message['sent_at']) * 1000.0)
+
+    broadcast = broadcast_times.summary()
+    delivery = delivery_times.summary()
+    print(f"{policy:12s}: broadcast p50 {broadcast['p50']:.3f}ms 最大 {broadcast['max']:.3f}ms  "
+          f"配信 p50 {delivery['p50']:.3f}ms p99 {delivery['p99']:.3f}ms")
+    print(f"{'':12s}  停止クライアント: {stalled_sender.get_stats()}"
+          f"{'（切断済み）' if stalled_sender.closed else ''}")
+
+    stalled.close()
+    for _, writer in readers:
+        writer.close()
+    await interface.stop_server()
+    server_task.cancel()
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    client_count = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    for policy in ClientSender.POLICIES:
+        asyncio.run(run_policy(policy, count, client_count))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
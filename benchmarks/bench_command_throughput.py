@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""コマンドインターフェースのスループット（コマンド/秒）を計測するベンチマーク
+
+1接続あたりのスループットを2つの送信方式で比較する:
+    roundtrip: 1コマンド送信ごとに応答を待つ（チャンク単位で1コマンドを仮定していた
+               従来のフレーミングで唯一安全だった方式）
+    pipelined: 改行区切りのコマンドを応答を待たずにまとめて送信し、応答をまとめて受信
+
+使用方法:
+    python benchmarks/bench_command_throughput.py [コマンド数]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.command_interface import CommandInterface
+
+COMMANDS = [
+    {'command': 'set_parameter', 'parameters': {'intensity': 0.8}},
+    {'command': 'ping'},
+]
+
+
+def build_payloads(count: int) -> list:
+    """送信するコマンド（改行区切りJSON）を生成"""
+    return [(json.dumps(COMMANDS[i % len(COMMANDS)]) + '\n').encode('utf-8') for i in range(count)]
+
+
+async def run_roundtrip(host: str, port: int, payloads: list) -> float:
+    """1コマンドごとに応答を待つ方式で送信し、所要時間（秒）を返す"""
+    reader, writer = await asyncio.open_connection(host, port)
+    start = time.perf_counter()
+    for payload in payloads:
+        writer.write(payload)
+        await writer.drain()
+        await reader.readline()
+    elapsed = time.perf_counter() - start
+    writer.close()
+    await writer.wait_closed()
+    return elapsed
+
+
+async def run_pipelined(host: str, port: int, payloads: list) -> float:
+    """応答を待たずに全コマンドを送信し、所要時間（秒）を返す"""
+    reader, writer = await asyncio.open_connection(host, port)
+    start = time.perf_counter()
+
+    async def send_all():
+        for payload in payloads:
+            writer.write(payload)
+        await writer.drain()
+
+    sender = asyncio.create_task(send_all())
+    for _ in payloads:
+        await reader.readline()
+    await sender
+    elapsed = time.perf_counter() - start
+    writer.close()
+    await writer.wait_closed()
+    return elapsed
+
+
+async def main_async(count: int):
+    interface = CommandInterface()
+    interface.host = '127.0.0.1'
+    interface.port = 0  # 空いているポートを使用
+    server_task = asyncio.create_task(interface.start_server())
+    while interface.server is None or not interface.server.sockets:
+        await asyncio.sleep(0.01)
+    port = interface.server.sockets[0].getsockname()[1]
+
+    payloads = build_payloads(count)
+    results = {}
+    for name, runner in (('roundtrip', run_roundtrip), ('pipelined', run_pipelined)):
+        elapsed = await runner('127.0.0.1', port, payloads)
+        results[name] = count / elapsed
+        print(f"{name:10s}: {count}コマンド {elapsed * 1000:8.1f}ms  {results[name]:10.0f} コマンド/秒")
+
+    print(f"pipelined / roundtrip: {results['pipelined'] / results['roundtrip']:.1f}倍")
+
+    await interface.stop_server()
+    server_task.cancel()
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    asyncio.run(main_async(count))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""グローテクスチャ生成方式（legacy / vectorized）の速度と画素差を比較するベンチマーク
+
+使用方法:
+    python benchmarks/bench_glow_generator.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from renderers.eye_renderer import EyeRenderer
+from utils.config import config
+from utils.constants import BLINK_PRESETS
+
+# 境界ピクセルで許容する差（隣接レイヤー1段分）と、差が出てよい画素の割合
+MAX_CHANNEL_DIFF = 80
+MAX_DIFF_PIXEL_RATIO = 0.03
+
+
+def visible_pixels(texture: pygame.Surface) -> np.ndarray:
+    """実際の描画と同じく黒背景へ加算合成した結果を取得"""
+    canvas = pygame.Surface(texture.get_size())
+    canvas.fill((0, 0, 0))
+    canvas.blit(texture, (0, 0), special_flags=pygame.BLEND_ADD)
+    return pygame.surfarray.array3d(canvas).astype(int)
+
+
+def compare(legacy: pygame.Surface, vectorized: pygame.Surface) -> tuple:
+    """2つのテクスチャの見た目の差分を計算
+
+    Returns:
+        (差がある画素の割合, 最大チャンネル差)
+    """
+    diff = np.abs(visible_pixels(legacy) - visible_pixels(vectorized)).max(axis=2)
+    return float((diff > 0).mean()), int(diff.max())
+
+
+def main() -> int:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    eye_config = config.get_eye_config()
+    width, height = eye_config['width'], eye_config['height']
+    renderer = EyeRenderer()
+
+    ok = True
+    legacy_total = 0.0
+    vectorized_total = 0.0
+    for ratio in BLINK_PRESETS:
+        start = time.perf_counter()
+        legacy = renderer.create_glow_texture_legacy(width, height, ratio)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        vectorized = renderer.create_glow_texture_vectorized(width, height, ratio)
+        vectorized_time = time.perf_counter() - start
+
+        legacy_total += legacy_time
+        vectorized_total += vectorized_time
+
+        if legacy.get_size() != vectorized.get_size():
+            print(f"ratio={ratio}: サイズ不一致 {legacy.get_size()} != {vectorized.get_size()}")
+            ok = False
+            continue
+
+        diff_ratio, max_diff = compare(legacy, vectorized)
+        within = diff_ratio <= MAX_DIFF_PIXEL_RATIO and max_diff <= MAX_CHANNEL_DIFF
+        ok = ok and within
+        print(f"ratio={ratio:.1f} legacy={legacy_time * 1000:7.2f}ms "
+              f"vectorized={vectorized_time * 1000:7.2f}ms "
+              f"差分画素={diff_ratio * 100:.2f}% 最大差={max_diff} {'OK' if within else 'NG'}")
+
+    print(f"合計: legacy={legacy_total * 1000:.2f}ms vectorized={vectorized_total * 1000:.2f}ms")
+    pygame.quit()
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""JSONとバイナリプロトコルのエンコード・デコード・処理コストを比較するマイクロベンチマーク
+
+高頻度で送られる視線ターゲットとリップシンク強度について、1メッセージあたりの
+時間を計測する（ソケットI/Oは含まない）。
+    codec:    クライアントでのエンコード + サーバーでのデコード
+    dispatch: デコード + _process_command（共通のハンドラーテーブル）
+
+使用方法:
+    python benchmarks/bench_protocol_codec.py [メッセージ数]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import binary_protocol
+from core.command_interface import CommandInterface
+
+
+def json_gaze(i: int) -> bytes:
+    return (json.dumps({'command': 'set_gaze_target', 'x': i % 40 - 20.5, 'y': 3.25}) + '\n').encode('utf-8')
+
+
+def json_lip(i: int) -> bytes:
+    return (json.dumps({'command': 'lip_sync_sample', 'intensity': (i % 10) / 10.0}) + '\n').encode('utf-8')
+
+
+def binary_gaze(i: int) -> bytes:
+    return binary_protocol.encode_set_gaze_target(i % 40 - 20.5, 3.25)
+
+
+def binary_lip(i: int) -> bytes:
+    return binary_protocol.encode_lip_sync_sample((i % 10) / 10.0)
+
+
+def decode_json(frame: bytes) -> dict:
+    return json.loads(frame.decode('utf-8').strip())
+
+
+def decode_binary(frame: bytes) -> dict:
+    return binary_protocol.decode_command(frame[binary_protocol.HEADER.size:])[0]
+
+
+def bench_codec(encode, decode, count: int) -> float:
+    """エンコード＋デコードの1メッセージあたりの時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for i in range(count):
+        decode(encode(i))
+    return (time.perf_counter() - start) / count * 1e6
+
+
+async def bench_dispatch(interface: CommandInterface, frames: list, decode) -> float:
+    """デコード＋コマンド処理の1メッセージあたりの時間（マイクロ秒）"""
+    start = time.perf_counter()
+    for frame in frames:
+        await interface._process_command(decode(frame))
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main() -> int:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    interface = CommandInterface()
+
+    cases = [
+        ('set_gaze_target', json_gaze, binary_gaze),
+        ('lip_sync_sample', json_lip, binary_lip),
+    ]
+    for name, json_encode, binary_encode in cases:
+        json_codec = bench_codec(json_encode, decode_json, count)
+        binary_codec = bench_codec(binary_encode, decode_binary, count)
+
+        json_frames = [json_encode(i) for i in range(count)]
+        binary_frames = [binary_encode(i) for i in range(count)]
+        json_dispatch = asyncio.run(bench_dispatch(interface, json_frames, decode_json))
+        binary_dispatch = asyncio.run(bench_dispatch(interface, binary_frames, decode_binary))
+
+        print(f"{name}: フレーム長 JSON={len(json_frames[0])}B バイナリ={len(binary_frames[0])}B")
+        print(f"  codec   : JSON {json_codec:6.2f}us  バイナリ {binary_codec:6.2f}us  ({json_codec / binary_codec:.1f}倍)")
+        print(f"  dispatch: JSON {json_dispatch:6.2f}us  バイナリ {binary_dispatch:6.2f}us  ({json_dispatch / binary_dispatch:.1f}倍)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""テクスチャキャッシュの形式（PNG / raw）ごとの読み込み時間を比較するベンチマーク
+
+アトラスに含まれる全テクスチャと、起動時に実際に読み込むアトラスそのものについて、
+キャッシュからの読み込み＋最初の描画までの時間を計測する。rawはmmapしたページを
+描画時に読むため、描画までを含めて比較する。
+    ページキャッシュあり: 直前に読んだファイル（再起動直後ではない起動に相当）
+    ページキャッシュなし: posix_fadviseでページキャッシュから追い出した後（電源投入直後の起動に相当）
+
+キャッシュディレクトリと同じファイルシステム上に一時ディレクトリを作って計測する。
+
+使用方法:
+    python benchmarks/bench_texture_cache.py [計測回数]
+"""
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+
+from renderers.eye_renderer import EyeRenderer
+from renderers.texture_atlas import TextureAtlas
+from renderers.texture_cache import TextureCache
+from utils.config import config
+
+
+def drop_page_cache(directory: str) -> bool:
+    """ディレクトリ内のファイルをページキャッシュから追い出す（できない環境ではFalse）"""
+    if not hasattr(os, 'posix_fadvise'):
+        return False
+    for name in os.listdir(directory):
+        fd = os.open(os.path.join(directory, name), os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+def measure_load(cache: TextureCache, prefix: str, params: dict, screen: pygame.Surface, repeat: int, cold: bool) -> float:
+    """読み込み＋最初の描画の時間の中央値（ms）"""
+    times = []
+    for _ in range(repeat):
+        if cold:
+            drop_page_cache(cache.directory)
+        start = time.perf_counter()
+        surface, _ = cache.load(prefix, params)
+        screen.blit(surface, (0, 0), special_flags=pygame.BLEND_ADD)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def same_pixels(a: pygame.Surface, b: pygame.Surface) -> bool:
+    return (np.array_equal(pygame.surfarray.array3d(a), pygame.surfarray.array3d(b))
+            and np.array_equal(pygame.surfarray.array_alpha(a), pygame.surfarray.array_alpha(b)))
+
+
+def main() -> int:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    pygame.init()
+    display_config = config.get_display_config()
+    screen = pygame.display.set_mode((display_config['width'], display_config['height']))
+
+    eye_config = config.get_eye_config()
+    width, height = eye_config['width'], eye_config['height']
+    renderer = EyeRenderer()
+
+    # 計測対象: アトラスの各テクスチャと、アトラスそのもの
+    textures = renderer.create_atlas_textures(width, height)
+    textures = {key: texture.convert_alpha() for key, texture in textures.items()}
+    atlas = TextureAtlas.build(textures)
+    entries = [(key, {'texture': key}, texture) for key, texture in textures.items()]
+    entries.append(('atlas', renderer.get_atlas_cache_params(width, height), atlas.surface))
+
+    directory = tempfile.mkdtemp(prefix='bench_', dir=renderer.cache_config['directory'])
+    can_drop = drop_page_cache(directory)
+    try:
+        caches = {}
+        for image_format in TextureCache.FORMATS:
+            caches[image_format] = TextureCache(os.path.join(directory, image_format), 1 << 30, image_format)
+            for prefix, params, texture in entries:
+                caches[image_format].save(prefix, params, texture)
+
+        print(f"{'テクスチャ':24s} {'サイズ':>9s}  {'ファイル png/raw':>16s}  "
+              f"{'キャッシュあり png/raw':>22s}  {'キャッシュなし png/raw':>22s}  一致")
+        totals = {key: 0.0 for key in ('png_hot', 'raw_hot', 'png_cold', 'raw_cold')}
+        for prefix, params, texture in entries:
+            results = {}
+            for image_format, cache in caches.items():
+                results[f'{image_format}_hot'] = measure_load(cache, prefix, params, screen, repeat, cold=False)
+                results[f'{image_format}_cold'] = measure_load(cache, prefix, params, screen, repeat, cold=True)
+            if prefix != 'atlas':
+                for key in totals:
+                    totals[key] += results[key]
+
+            file_sizes = [os.path.getsize(cache.get_path(prefix, params)) // 1024 for cache in caches.values()]
+            identical = all(same_pixels(cache.load(prefix, params)[0], texture) for cache in caches.values())
+            size = '{}x{}'.format(*texture.get_size())
+            print(f"{prefix:24s} {size:>9s}  {file_sizes[0]:>6d}KB/{file_sizes[1]:>5d}KB  "
+                  f"{results['png_hot']:>9.3f}/{results['raw_hot']:.3f}ms  "
+                  f"{results['png_cold']:>9.3f}/{results['raw_cold']:.3f}ms  {'OK' if identical else 'NG'}")
+
+        print(f"{'個別テクスチャの合計':24s} {'':>9s}  {'':>16s}  "
+              f"{totals['png_hot']:>9.3f}/{totals['raw_hot']:.3f}ms  "
+              f"{totals['png_cold']:>9.3f}/{totals['raw_cold']:.3f}ms")
+        if not can_drop:
+            print("※ posix_fadviseが使えないため、キャッシュなしの計測もページキャッシュありと同じ条件です")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""定常状態のフレームでログ出力（標準出力・標準エラーへの書き込み）が発生しないことを確認する
+
+tests/test_frame_logging.pyをpytestで実行する（失敗時は終了コード1）。
+状態ごとのフレーム数を指定した場合は、その数だけフレームを進めて確認する。
+
+使用方法:
+    python benchmarks/check_frame_logging.py [状態ごとのフレーム数]
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> int:
+    if len(sys.argv) > 1:
+        os.environ['CHECK_FRAME_LOGGING_FRAMES'] = str(int(sys.argv[1]))
+    return int(pytest.main(['-q', '-p', 'no:cacheprovider', os.path.join(ROOT, 'tests', 'test_frame_logging.py')]))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""視線移動の速さがフレームレートに依存しないことを確認する
+
+移動の仕方（smooth / saccade）ごとに、同じ視線ターゲットの列を複数のフレームレートで
+再生し、共通の時刻（200ミリ秒ごと）での目の位置を60FPSの結果と比べる。
+ターゲットは外部コマンドと同じ経路で渡す（set_gaze_targetを保留中のコマンドに追加し、
+ヘッドレスのアプリケーションのrun_frame()で、フレームの更新より前に適用する）。
+フレーム時計の取得元は仮想時刻（VirtualClock）に差し替え、各フレームレートの間隔で進める。
+差がTOLERANCE_PXを超えた場合は失敗として終了コード1を返す。比較のため、以前の
+1フレームごとに一定の割合（3%）だけ近づける方式での差も表示する。
+
+使用方法:
+    python benchmarks/check_gaze_timing.py
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from main import RobotFaceApp
+from utils.config import config
+from utils.frame_clock import frame_clock, VirtualClock
+
+FRAME_RATES = (60, 30, 20, 15, 10)
+SAMPLE_INTERVAL_MS = 200
+DURATION_MS = 2000
+TOLERANCE_PX = 0.5
+
+# (時刻（ミリ秒）, 視線ターゲット)
+# ターゲットを変える時刻は、どのフレームレートでもフレームの時刻になるよう200ミリ秒の倍数にする
+TARGETS = [
+    (0, (60, -30)),
+    (600, (-50, 20)),
+    (1000, (10, 40))
+]
+
+# 以前の方式の1フレームあたりの割合
+LEGACY_MOVE_SPEED = 0.03
+
+
+def replay(fps: int, profile: str) -> dict:
+    """指定フレームレートで再生し、サンプル時刻ごとの目の位置を返す
+
+    Args:
+        profile: move_profile（legacyは以前の1フレームごとの方式）
+    """
+    clock = VirtualClock()
+    frame_clock.set_time_source(clock)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = RobotFaceApp(enable_command_interface=False, headless=True)
+        controller = app.animation_controller.eye_movement_controller
+        controller.animation_config = dict(
+            controller.animation_config,
+            move_profile=profile,
+            look_interval_min=10 ** 9,
+            look_interval_max=10 ** 9
+        )
+        controller.next_look_interval = 10 ** 9
+        if profile == 'legacy':
+            # 以前の方式: 経過時間によらず1フレームごとに一定の割合だけ近づける
+            # （set_target()とupdate()の両方から呼ばれるため、同じフレームでは1回だけ）
+            moved_frames = set()
+
+            def move_per_frame(current_time):
+                controller.last_update_time = current_time
+                if current_time not in moved_frames:
+                    moved_frames.add(current_time)
+                    controller.eye_offset = controller.eye_offset.lerp(controller.target_offset, LEGACY_MOVE_SPEED)
+            controller._advance = move_per_frame
+
+        positions = {}
+        targets = list(TARGETS)
+        frame = 0
+        frame_clock.reset()
+        while True:
+            current_time = round(frame * 1000 / fps)
+            if current_time > DURATION_MS:
+                break
+            clock.time_ms = current_time
+            # 前のフレーム以降に届いたコマンドとして、次のrun_frame()で更新より前に適用される
+            while targets and targets[0][0] <= current_time:
+                x, y = targets.pop(0)[1]
+                app.pending_commands.append(
+                    ({'command': 'set_gaze_target', 'x': x, 'y': y}, time.perf_counter())
+                )
+            app.run_frame()
+            if current_time % SAMPLE_INTERVAL_MS == 0:
+                positions[current_time] = pygame.math.Vector2(controller.eye_offset)
+            frame += 1
+        return positions
+    finally:
+        frame_clock.set_time_source(None)
+        pygame.quit()
+
+
+def main() -> int:
+    # ウィンドウは開かない（アプリケーションはヘッドレスで起動する）
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+    failed = False
+    print(f"60FPSとの位置の最大差（{SAMPLE_INTERVAL_MS}msごと、{DURATION_MS}msまで、ピクセル）")
+    print(f"{'方式':10s} " + ' '.join(f"{fps:>6d}FPS" for fps in FRAME_RATES[1:]))
+    for profile in ('smooth', 'saccade', 'legacy'):
+        reference = replay(FRAME_RATES[0], profile)
+        errors = []
+        for fps in FRAME_RATES[1:]:
+            positions = replay(fps, profile)
+            errors.append(max(positions[sample_time].distance_to(reference[sample_time]) for sample_time in reference))
+
+        if profile == 'legacy':
+            status = '（以前の方式、参考）'
+        else:
+            ok = max(errors) <= TOLERANCE_PX
+            failed |= not ok
+            status = 'OK' if ok else 'NG'
+        print(f"{profile:10s} " + ' '.join(f"{error:9.3f}" for error in errors) + f"  {status}")
+
+    settings = config.get_animation_config()
+    print(f"設定: move_profile={settings['move_profile']}, move_half_life_ms={settings['move_half_life_ms']}, "
+          f"saccade_max_speed={settings['saccade_max_speed']}, saccade_max_accel={settings['saccade_max_accel']}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
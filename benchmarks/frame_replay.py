@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""各状態を決定的に再生してフレームの処理時間とメモリを計測し、ベースラインと比較する
+
+状態（idle / thinking / speaking / sleeping）ごとに、乱数のシードを固定し、
+フレーム時計の取得元を仮想時刻（VirtualClock）に差し替えたヘッドレスのアプリケーションで
+Nフレームを再生する。仮想時刻はフレームスケジューラーが選んだフレームレートの間隔で
+進めるため、実機と同じ間隔でアニメーションが進み、何度実行しても同じフレーム列になる。
+
+状態ごとに次の再生を行う:
+    処理時間: フレームの処理時間（平均・p95・p99）と段階ごとの平均時間を計測する。
+              他のプロセスの影響を除くため--repeat回再生し、指標ごとに最小値を採る
+    メモリ:   計測用のプロファイラーを外して再生し、tracemallocでPythonのメモリ使用量の
+              ピーク（再生開始時からの増分）と、描画結果のチェックサム
+              （全フレームの画素のCRC32）を計測する
+
+ベースライン（既定はbenchmarks/baselines.json）と比べ、処理時間とメモリが許容範囲を
+超えて増えた場合や描画結果が変わった場合は、終了コード1を返す。処理時間は
+マシンに依存するため、ベースラインは計測対象のマシン（実機）で--updateを付けて作り直す。
+
+使用方法:
+    python benchmarks/frame_replay.py [--frames N] [--seed S] [--repeat 3] [--tolerance 0.25] [--update]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tracemalloc
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from main import RobotFaceApp
+from utils.frame_clock import frame_clock, VirtualClock
+
+# 再生する状態と、移行時のパラメータ
+STATES = {
+    'idle': {},
+    'thinking': {'intensity': 1.0},
+    'speaking': {'intensity': 1.0},
+    'sleeping': {}
+}
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+# 比較する指標と、許容範囲に加える絶対値の余裕（小さな値の揺らぎで失敗しないように）
+METRICS = {
+    'mean_ms': 0.05,
+    'p95_ms': 0.05,
+    'p99_ms': 0.1,
+    'peak_kb': 16.0
+}
+
+
+def replay(state: str, frames: int, warmup: int, seed: int, measure_memory: bool) -> dict:
+    """状態を決定的に再生
+
+    Args:
+        state: 状態名
+        frames: 計測するフレーム数
+        warmup: 計測前に再生するフレーム数（初回描画時の読み込みなどを除く）
+        seed: 乱数のシード
+        measure_memory: Trueの場合はメモリのピークと描画結果のチェックサムを計測
+
+    Returns:
+        計測結果の辞書
+    """
+    clock = VirtualClock()
+    frame_clock.set_time_source(clock)
+    random.seed(seed)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            app = RobotFaceApp(enable_command_interface=False, headless=True)
+        if app.eye_renderer.warmup_thread:
+            app.eye_renderer.warmup_thread.join()
+        app.state_machine.change_state(state, **STATES[state])
+
+        frame_clock.reset()
+
+        def run_frame():
+            app.run_frame()
+            clock.advance(1000.0 / app.frame_scheduler.target_fps)
+
+        for _ in range(warmup):
+            run_frame()
+        app.profiler.reset()
+
+        if not measure_memory:
+            for _ in range(frames):
+                run_frame()
+            report = app.profiler.get_report()
+            return {
+                'mean_ms': report['frame_ms']['mean'],
+                'p95_ms': report['frame_ms']['p95'],
+                'p99_ms': report['frame_ms']['p99'],
+                'stages_ms': {
+                    stage: summary['mean'] for stage, summary in report['stages_ms'].items() if summary['count']
+                }
+            }
+
+        # プロファイラー自身の記録がメモリの計測に含まれないよう外す
+        app.profiler = None
+        checksum = 0
+        tracemalloc.start()
+        start_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in range(frames):
+            run_frame()
+            checksum = zlib.crc32(app.screen.get_view('2'), checksum)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {
+            'peak_kb': (peak_memory - start_memory) / 1024.0,
+            'checksum': f"{checksum:08x}"
+        }
+    finally:
+        frame_clock.set_time_source(None)
+        pygame.quit()
+
+
+def run_state(state: str, args: argparse.Namespace) -> dict:
+    runs = [replay(state, args.frames, args.warmup, args.seed, measure_memory=False)
+            for _ in range(args.repeat)]
+    result = {key: min(run[key] for run in runs) for key in ('mean_ms', 'p95_ms', 'p99_ms')}
+    result['stages_ms'] = {
+        stage: min(run['stages_ms'][stage] for run in runs) for stage in runs[0]['stages_ms']
+    }
+    result.update(replay(state, args.frames, args.warmup, args.seed, measure_memory=True))
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """ベースラインと比較し、問題の一覧を返す"""
+    problems = []
+    for state, result in results.items():
+        expected = baseline['states'].get(state)
+        if expected is None:
+            problems.append(f"{state}: ベースラインがありません")
+            continue
+        for metric, slack in METRICS.items():
+            limit = expected[metric] * (1.0 + tolerance) + slack
+            if result[metric] > limit:
+                problems.append(f"{state}: {metric} {result[metric]:.3f} > 許容値 {limit:.3f} "
+                                f"（ベースライン {expected[metric]:.3f}）")
+        if result['checksum'] != expected['checksum']:
+            problems.append(f"{state}: 描画結果が変わりました（チェックサム {result['checksum']}, "
+                            f"ベースライン {expected['checksum']}）")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='状態ごとのフレーム再生ベンチマーク')
+    parser.add_argument('--frames', type=int, default=600, help='状態ごとに計測するフレーム数')
+    parser.add_argument('--warmup', type=int, default=30, help='計測前に再生するフレーム数')
+    parser.add_argument('--seed', type=int, default=1234, help='乱数のシード')
+    parser.add_argument('--repeat', type=int, default=3, help='処理時間を計測する再生の回数')
+    parser.add_argument('--states', nargs='+', choices=list(STATES), default=list(STATES),
+                        help='再生する状態')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='ベースラインに対して許容する増加率（0.25: 25%%）')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='ベースラインのファイル')
+    parser.add_argument('--update', action='store_true', help='計測結果でベースラインを更新')
+    args = parser.parse_args()
+
+    # ウィンドウは開かない（アプリケーションはヘッドレスで起動する）
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+    conditions = {'frames': args.frames, 'warmup': args.warmup, 'seed': args.seed}
+    baseline = None
+    if not args.update and os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline['conditions'] != conditions:
+            print(f"ベースラインと計測条件が異なります（ベースライン: {baseline['conditions']}）")
+            return 1
+        if baseline['platform'] != platform.platform():
+            print(f"※ ベースラインは別の環境で計測されています: {baseline['platform']}")
+
+    print(f"{'状態':10s} {'平均':>8s} {'p95':>8s} {'p99':>8s} (ms)  {'メモリ':>9s}  "
+          f"{'チェックサム':>8s}  段階ごとの平均 (ms)")
+    results = {}
+    for state in args.states:
+        result = run_state(state, args)
+        results[state] = result
+        stages = ' '.join(f"{stage} {ms:.3f}" for stage, ms in result['stages_ms'].items())
+        print(f"{state:10s} {result['mean_ms']:8.3f} {result['p95_ms']:8.3f} {result['p99_ms']:8.3f}       "
+              f"{result['peak_kb']:7.1f}KB  {result['checksum']}  {stages}")
+
+    if args.update:
+        # 一部の状態だけを再生した場合は、同じ条件の既存のベースラインに上書きする
+        states = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            if previous['conditions'] == conditions:
+                states = previous['states']
+        for state, result in results.items():
+            states[state] = {key: result[key] for key in list(METRICS) + ['checksum']}
+        data = {'platform': platform.platform(), 'conditions': conditions, 'states': states}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"ベースラインを更新しました: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"ベースラインがありません（--updateで作成）: {args.baseline}")
+        return 1
+
+    problems = compare(results, baseline, args.tolerance)
+    for problem in problems:
+        print(f"NG {problem}")
+    if not problems:
+        print(f"OK（許容する増加率 {args.tolerance * 100:.0f}%）")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""高頻度制御用のコンパクトなバイナリコマンドプロトコル
+
+フレーム形式（ビッグエンディアン）:
+    [長さ: uint16][オペコード: uint8][ペイロード: 長さ-1 バイト]
+
+長さはオペコードとペイロードを合わせたバイト数。オペコードの最上位ビット（ACK_FLAG）が
+立っている場合、サーバーは処理結果を1バイトのステータスフレームで返す。
+デコードしたコマンドはJSONと同じ形式の辞書となり、同じハンドラーテーブルで処理される。
+"""
+
+import math
+import struct
+from typing import Any, Dict, Optional, Tuple
+from utils.constants import States
+
+# フレームヘッダー
+HEADER = struct.Struct('!H')
+OPCODE = struct.Struct('!B')
+
+# オペコード
+OP_CHANGE_STATE = 0x01     # ペイロード: 状態ID (uint8)
+OP_SET_INTENSITY = 0x02    # ペイロード: 強度 (float32)
+OP_SET_GAZE_TARGET = 0x03  # ペイロード: x, y (float32 x2, 目の中心からのオフセット・ピクセル)
+OP_LIP_SYNC_SAMPLE = 0x04  # ペイロード: リップシンク強度 (float32, 0.0-1.0)
+
+ACK_FLAG = 0x80
+
+# ステータスフレーム（ACK要求時の応答）
+STATUS_OK = 0x00
+STATUS_ERROR = 0x01
+
+# 状態ID（バイナリプロトコル上の番号）
+STATE_IDS = [States.IDLE, States.THINKING, States.SPEAKING, States.SLEEPING]
+
+_PAYLOADS = {
+    OP_CHANGE_STATE: struct.Struct('!B'),
+    OP_SET_INTENSITY: struct.Struct('!f'),
+    OP_SET_GAZE_TARGET: struct.Struct('!ff'),
+    OP_LIP_SYNC_SAMPLE: struct.Struct('!f'),
+}
+
+
+class ProtocolError(Exception):
+    """不正なバイナリフレームの例外"""
+    pass
+
+
+def _check_finite(opcode: int, values: tuple):
+    """float32のペイロードがNaN・無限大でないことを確認
+
+    Raises:
+        ProtocolError: 有限でない値が含まれる場合
+    """
+    if not all(math.isfinite(value) for value in values):
+        raise ProtocolError(f'有限でない値が含まれています: {opcode:#04x}')
+
+
+def decode_command(body: bytes) -> Tuple[Dict[str, Any], bool]:
+    """フレーム本体（オペコード＋ペイロード）をコマンド辞書にデコード
+
+    Args:
+        body: ヘッダーを除いたフレーム本体
+
+    Returns:
+        (コマンド辞書, ACK要求の有無)
+
+    Raises:
+        ProtocolError: 未知のオペコードやペイロード長の不一致、NaN・無限大の値
+    """
+    if not body:
+        raise ProtocolError('空のフレームです')
+
+    opcode = body[0] & ~ACK_FLAG
+    ack = bool(body[0] & ACK_FLAG)
+    payload_struct = _PAYLOADS.get(opcode)
+    if payload_struct is None:
+        raise ProtocolError(f'未知のオペコード: {opcode:#04x}')
+    if len(body) - 1 != payload_struct.size:
+        raise ProtocolError(f'ペイロード長が不正です: {opcode:#04x}')
+
+    values = payload_struct.unpack_from(body, 1)
+    _check_finite(opcode, values)
+
+    if opcode == OP_CHANGE_STATE:
+        state_id = values[0]
+        if state_id >= len(STATE_IDS):
+            raise ProtocolError(f'未知の状態ID: {state_id}')
+        return {'command': 'change_state', 'state': STATE_IDS[state_id]}, ack
+    if opcode == OP_SET_INTENSITY:
+        return {'command': 'set_parameter', 'parameters': {'intensity': values[0]}}, ack
+    if opcode == OP_SET_GAZE_TARGET:
+        return {'command': 'set_gaze_target', 'x': values[0], 'y': values[1]}, ack
+    return {'command': 'lip_sync_sample', 'intensity': values[0]}, ack
+
+
+def encode_frame(opcode: int, *values, ack: bool = False) -> bytes:
+    """コマンドをフレームにエンコード（クライアント用）
+
+    Args:
+        opcode: オペコード
+        *values: ペイロードの値
+        ack: 処理結果の応答を要求するかどうか
+
+    Returns:
+        ヘッダー付きのフレーム
+    """
+    payload = _PAYLOADS[opcode].pack(*values)
+    body = OPCODE.pack(opcode | (ACK_FLAG if ack else 0)) + payload
+    return HEADER.pack(len(body)) + body
+
+
+def encode_change_state(state: str, ack: bool = False) -> bytes:
+    """状態変更フレームを生成"""
+    return encode_frame(OP_CHANGE_STATE, STATE_IDS.index(state), ack=ack)
+
+
+def encode_set_intensity(intensity: float, ack: bool = False) -> bytes:
+    """強度設定フレームを生成"""
+    return encode_frame(OP_SET_INTENSITY, intensity, ack=ack)
+
+
+def encode_set_gaze_target(x: float, y: float, ack: bool = False) -> bytes:
+    """視線ターゲット設定フレームを生成"""
+    return encode_frame(OP_SET_GAZE_TARGET, x, y, ack=ack)
+
+
+def encode_lip_sync_sample(intensity: float, ack: bool = False) -> bytes:
+    """リップシンク強度フレームを生成"""
+    return encode_frame(OP_LIP_SYNC_SAMPLE, intensity, ack=ack)
+
+
+# UDPサンプル（1データグラム1サンプル、長さヘッダーなし）
+# [オペコード: uint8][送信側タイムスタンプ: float64 秒][ペイロード]
+UDP_SAMPLE_HEADER = struct.Struct('!Bd')
+UDP_SAMPLE_OPCODES = (OP_SET_GAZE_TARGET, OP_LIP_SYNC_SAMPLE)
+
+
+def encode_udp_sample(opcode: int, timestamp: float, *values) -> bytes:
+    """UDPで送るタイムスタンプ付きサンプルを生成（クライアント用）
+
+    Args:
+        opcode: OP_SET_GAZE_TARGET または OP_LIP_SYNC_SAMPLE
+        timestamp: 送信側の単調増加するタイムスタンプ（秒）
+        *values: ペイロードの値
+    """
+    return UDP_SAMPLE_HEADER.pack(opcode, timestamp) + _PAYLOADS[opcode].pack(*values)
+
+
+def decode_udp_sample(datagram: bytes) -> Tuple[int, float, tuple]:
+    """UDPサンプルをデコード
+
+    Returns:
+        (オペコード, 送信側タイムスタンプ, ペイロードの値)
+
+    Raises:
+        ProtocolError: 未対応のオペコードや長さの不一致、NaN・無限大の値
+    """
+    if len(datagram) < UDP_SAMPLE_HEADER.size:
+        raise ProtocolError('データグラムが短すぎます')
+
+    opcode, timestamp = UDP_SAMPLE_HEADER.unpack_from(datagram)
+    if opcode not in UDP_SAMPLE_OPCODES:
+        raise ProtocolError(f'UDPでは未対応のオペコード: {opcode:#04x}')
+
+    payload_struct = _PAYLOADS[opcode]
+    if len(datagram) - UDP_SAMPLE_HEADER.size != payload_struct.size:
+        raise ProtocolError(f'ペイロード長が不正です: {opcode:#04x}')
+
+    values = payload_struct.unpack_from(datagram, UDP_SAMPLE_HEADER.size)
+    _check_finite(opcode, values)
+    return opcode, timestamp, values
+
+
+def encode_status(success: bool) -> bytes:
+    """ステータスフレームを生成（サーバー用）"""
+    body = OPCODE.pack(STATUS_OK if success else STATUS_ERROR)
+    return HEADER.pack(len(body)) + body
+
+
+def decode_status(body: bytes) -> Optional[bool]:
+    """ステータスフレーム本体をデコード（クライアント用）
+
+    Returns:
+        成功ならTrue、失敗ならFalse、不正な本体ならNone
+    """
+    if len(body) != 1:
+        return None
+    return body[0] == STATUS_OK
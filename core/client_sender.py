@@ -0,0 +1,182 @@
+import asyncio
+from collections import deque
+from typing import Any, Dict, Optional
+
+class ClientSender:
+    """1クライアント分の有界送信キューと、それを書き出す送信タスク
+
+    ブロードキャストやpush通知はput()でキューに追加するだけで、ソケットへの書き込みと
+    drain()の待機は各クライアント専用の送信タスクが行う。そのため遅いクライアントが
+    他のクライアントやブロードキャスト元を待たせることはない。
+    未送信がなく送信バッファに余裕がある場合は、送信タスクを介さずにその場で書き込む。
+    キューが満杯の場合の動作はpolicyで指定する:
+        drop_oldest: 最も古い未送信メッセージを破棄して追加
+        drop_newest: 追加しようとしたメッセージを破棄
+        disconnect:  クライアントを切断
+    コマンドへの応答はsend()で送り、送信完了まで待機する。応答はpush通知とは別のキューに
+    保持され、容量にも数えず、ポリシーによる破棄や切断の対象にもならない。未送信の応答は
+    push通知より先に書き出す。すべての操作はサーバーのイベントループ上で行う。
+    """
+
+    DROP_OLDEST = 'drop_oldest'
+    DROP_NEWEST = 'drop_newest'
+    DISCONNECT = 'disconnect'
+    POLICIES = (DROP_OLDEST, DROP_NEWEST, DISCONNECT)
+
+    def __init__(self, writer: asyncio.StreamWriter, maxsize: int = 64, policy: str = DISCONNECT):
+        if policy not in self.POLICIES:
+            raise ValueError(f"未知の送信キューポリシー: {policy}")
+
+        self.writer = writer
+        self.maxsize = maxsize
+        self.policy = policy
+        self.closed = False
+
+        self._items: deque = deque()      # push通知・ブロードキャスト（maxsizeで制限）
+        self._responses: deque = deque()  # (コマンドへの応答, 送信完了を通知するFuture)
+        self._ready = asyncio.Event()  # 未送信のメッセージがある
+        self._idle = asyncio.Event()   # すべて送信済み（drain完了）
+        self._idle.set()
+        self._task: Optional[asyncio.Task] = None
+
+        # 統計
+        self.enqueued_count = 0
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.sent_bytes = 0
+        self.max_depth = 0
+
+    def start(self):
+        """送信タスクを開始"""
+        self._task = asyncio.create_task(self._run())
+
+    def put(self, data: bytes) -> bool:
+        """メッセージを送信キューに追加（待機しない）
+
+        Returns:
+            追加できた場合はTrue、ポリシーにより破棄・切断した場合はFalse
+        """
+        if self.closed:
+            return False
+        if self._write_direct(data):
+            return True
+
+        if len(self._items) >= self.maxsize:
+            self.dropped_count += 1
+            if self.policy == self.DROP_NEWEST:
+                return False
+            if self.policy == self.DISCONNECT:
+                self.abort()
+                return False
+            self._items.popleft()
+
+        self._items.append(data)
+        self._enqueued()
+        return True
+
+    async def send(self, data: bytes):
+        """応答を破棄せずに追加し、その応答の送信完了まで待機（コマンドへの応答用）
+
+        切断された場合は未送信のまま待機を終える。
+        """
+        if self.closed:
+            raise ConnectionResetError("クライアントは切断済みです")
+        if self._write_direct(data):
+            return
+        written = asyncio.get_running_loop().create_future()
+        self._responses.append((data, written))
+        self._enqueued()
+        await written
+
+    def _write_direct(self, data: bytes) -> bool:
+        """未送信がなく送信バッファに余裕がある場合は、送信タスクを介さずに書き込む
+
+        drain()は待たないため、送信タスクのdrain()と競合しない。
+        """
+        if self._items or self._responses or not self._idle.is_set():
+            return False
+        transport = self.writer.transport
+        if transport.is_closing() or transport.get_write_buffer_size() >= transport.get_write_buffer_limits()[1]:
+            return False
+
+        self.writer.write(data)
+        self.enqueued_count += 1
+        self.sent_count += 1
+        self.sent_bytes += len(data)
+        return True
+
+    def _enqueued(self):
+        self.enqueued_count += 1
+        self.max_depth = max(self.max_depth, len(self._items))
+        self._idle.clear()
+        self._ready.set()
+
+    async def _run(self):
+        """キューのメッセージを順に書き出す（応答を優先）"""
+        written = None
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                while self._responses or self._items:
+                    if self._responses:
+                        data, written = self._responses.popleft()
+                    else:
+                        data = self._items.popleft()
+                    self.writer.write(data)
+                    await self.writer.drain()
+                    self.sent_count += 1
+                    self.sent_bytes += len(data)
+                    if written is not None:
+                        written.set_result(None)
+                        written = None
+                self._idle.set()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.closed = True
+            self._items.clear()
+            if written is not None and not written.done():
+                written.set_result(None)
+            self._release_responses()
+            self._idle.set()
+
+    def _release_responses(self):
+        """未送信の応答を破棄し、送信を待っている呼び出し元の待機を終える"""
+        while self._responses:
+            _, written = self._responses.popleft()
+            if not written.done():
+                written.set_result(None)
+
+    def abort(self):
+        """未送信のメッセージを破棄してクライアントを切断"""
+        self.closed = True
+        self.writer.transport.abort()
+        self._release_responses()
+        if self._task:
+            self._task.cancel()
+
+    def close(self):
+        """送信タスクを停止（未送信のメッセージは破棄）"""
+        self.closed = True
+        self._release_responses()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def __len__(self) -> int:
+        return len(self._items) + len(self._responses)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """送信キューの統計を取得"""
+        return {
+            'depth': len(self._items),
+            'pending_responses': len(self._responses),
+            'maxsize': self.maxsize,
+            'policy': self.policy,
+            'enqueued': self.enqueued_count,
+            'sent': self.sent_count,
+            'dropped': self.dropped_count,
+            'sent_bytes': self.sent_bytes,
+            'max_depth': self.max_depth
+        }
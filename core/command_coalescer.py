@@ -0,0 +1,99 @@
+from typing import Any, Dict, Iterable, List, Optional
+
+class CommandCoalescer:
+    """1フレーム分のコマンドを、最終的な適用結果が変わらない範囲でまとめるクラス
+
+    短時間に大量のコマンドが届いても、状態の終了・開始やイベント発行を
+    1フレームに1回までに抑える。
+        - batchは展開して通常のコマンドとして扱う
+        - change_stateは最終的な遷移先の1件のみ残す（途中の状態には遷移しない）。
+          その時点の状態への変更はStateMachineで無視されるため破棄し、最終的な
+          遷移先が現在の状態と同じ場合は遷移しない。この場合も、その状態へ戻る
+          change_stateのparametersはset_parameterとして適用する
+          （未知の状態への変更はコマンドインターフェースで拒否されるため、ここには来ない）
+        - 残したchange_stateより前のset_parameter・lip_sync_sampleは、
+          遷移前の状態に対するものなので破棄する
+        - set_parameterはキーごとに最後の値へ統合して1件にする（parametersが辞書でないものは破棄）
+        - set_gaze_target・lip_sync_sampleは最後の1件のみ残す
+        - それ以外のコマンド（shutdownなど）は受信順のまま残す
+    """
+
+    def __init__(self):
+        # 統計
+        self.received_count = 0
+        self.coalesced_count = 0
+
+    def coalesce(self, commands: Iterable[Dict[str, Any]], current_state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """コマンドをまとめる
+
+        Args:
+            commands: 受信順のコマンドデータ
+            current_state: 現在の状態名
+
+        Returns:
+            適用するコマンドのリスト（状態変更、パラメータ、視線、リップシンク、その他の順）
+        """
+        flattened = list(self._flatten(commands))
+
+        state = current_state
+        change_state = None
+        parameters: Dict[str, Any] = {}
+        gaze_target = None
+        lip_sync_sample = None
+        others = []
+
+        for command_data in flattened:
+            command = command_data.get('command')
+            if command == 'change_state':
+                if command_data.get('state') == state:
+                    # その時点の状態への変更は無視される
+                    continue
+                state = command_data.get('state')
+                change_state = command_data
+                parameters = {}
+                lip_sync_sample = None
+            elif command == 'set_parameter':
+                # 検証はコマンドインターフェースで行うが、辞書以外が渡されても例外にしない
+                if isinstance(command_data.get('parameters'), dict):
+                    parameters.update(command_data['parameters'])
+            elif command == 'set_gaze_target':
+                gaze_target = command_data
+            elif command == 'lip_sync_sample':
+                lip_sync_sample = command_data
+            else:
+                others.append(command_data)
+
+        coalesced = []
+        if change_state and state != current_state:
+            coalesced.append(change_state)
+        elif change_state and isinstance(change_state.get('parameters'), dict):
+            # 別の状態を経由して現在の状態へ戻る場合は、戻る際のパラメータを
+            # 後から届いたset_parameterより前の値として適用する
+            parameters = {**change_state['parameters'], **parameters}
+        if parameters:
+            coalesced.append({'command': 'set_parameter', 'parameters': parameters})
+        if gaze_target:
+            coalesced.append(gaze_target)
+        if lip_sync_sample:
+            coalesced.append(lip_sync_sample)
+        coalesced.extend(others)
+
+        self.received_count += len(flattened)
+        self.coalesced_count += len(flattened) - len(coalesced)
+        return coalesced
+
+    def _flatten(self, commands: Iterable[Dict[str, Any]]):
+        """batchを展開"""
+        for command_data in commands:
+            if command_data.get('command') == 'batch':
+                yield from self._flatten(command_data.get('commands', []))
+            else:
+                yield command_data
+
+    def get_stats(self) -> Dict[str, Any]:
+        """統計を取得"""
+        return {
+            'received': self.received_count,
+            'coalesced': self.coalesced_count,
+            'coalesce_ratio': self.coalesced_count / self.received_count if self.received_count else 0.0
+        }
@@ -1,23 +1,259 @@
 import asyncio
+import contextvars
 import json
 import logging
-from typing import Dict, Any, Callable, Optional
+import math
+import threading
+import time
+from typing import Dict, Any, Callable, Optional, Tuple
 from utils.config import config
 from utils.events import event_system, EventType
+from core import binary_protocol
+from core.client_sender import ClientSender
+from utils.constants import States
+
+# バッチ処理中のタスクで、サブコマンドの受け渡しを1つにまとめるための収集先
+_batch_collector: contextvars.ContextVar = contextvars.ContextVar('batch_collector', default=None)
+
+# コマンドを処理中のJSONクライアント（subscribeの登録先）
+_current_client: contextvars.ContextVar = contextvars.ContextVar('current_client', default=None)
+
+# subscribeで購読できるトピック
+PUSH_TOPICS = ('state', 'telemetry')
+
+# set_parameter / change_stateで受け付ける状態パラメータと値の種類
+# （number: 有限の数値, optional_number: 有限の数値またはnull, number_list: 有限の数値のリスト）
+PARAMETER_TYPES = {
+    'intensity': 'number',
+    'duration': 'optional_number',
+    'lip_sync_pattern': 'number_list'
+}
+
+def is_finite_number(value: Any) -> bool:
+    """有限の数値（boolを除く）かどうか"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+def validate_parameters(parameters: Any) -> Optional[str]:
+    """状態パラメータを検証
+    
+    パラメータは描画スレッドで状態に適用されるため、不正な値で例外にならないよう
+    ディスパッチ前に検証する。未知のキーは状態側で無視されるため検証しない。
+    
+    Returns:
+        不正な場合はエラーメッセージ、問題ない場合はNone
+    """
+    if not isinstance(parameters, dict):
+        return 'パラメータはオブジェクトで指定してください'
+    
+    for key, kind in PARAMETER_TYPES.items():
+        if key not in parameters:
+            continue
+        value = parameters[key]
+        if kind == 'number_list':
+            valid = isinstance(value, list) and all(is_finite_number(item) for item in value)
+        else:
+            valid = is_finite_number(value) or (kind == 'optional_number' and value is None)
+        if not valid:
+            return f'パラメータ{key}が不正です'
+    return None
+
+class FrameTooLargeError(Exception):
+    """1行のコマンドが最大フレームサイズを超えた場合の例外"""
+    pass
+
+class LiveSampleBuffer:
+    """UDPで受信したストリーミングサンプルのうち最新のものだけを保持するバッファ
+    
+    チャンネル（視線・リップシンク強度）ごとに1つのスロットを持ち、送信側タイムスタンプが
+    同じ送信元から既に受け付けたサンプル以前のもの（遅延・順序逆転）は破棄する。
+    タイムスタンプの基準は送信元ごとに異なってよく、送信元から最後に受け付けたサンプルが
+    max_age_msより古い場合は順序の判定をやり直す（送信側の再起動でタイムスタンプが
+    0に戻った場合など）。描画側は1フレームに1回take()で新しいサンプルを取り出し、
+    max_age_ms以上消費されなかったサンプルは古いとして破棄する。
+    受信（サーバースレッド）と取り出し（描画スレッド）が別スレッドでも安全なようにロックで保護する。
+    """
+    
+    GAZE = 'gaze'
+    LIP = 'lip'
+    
+    # 順序の判定用に記録する送信元の数の上限（超えた場合は古いものから忘れる）
+    MAX_SENDERS = 64
+    
+    def __init__(self, max_age_ms: float = 100.0):
+        self.max_age_ms = max_age_ms
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Tuple[Any, float]] = {}
+        # (チャンネル, 送信元) -> (最後に受け付けたタイムスタンプ, 受け付けた時刻)
+        self._last_accepted: Dict[Tuple[str, Any], Tuple[float, float]] = {}
+        
+        # 統計
+        self.accepted_count = 0
+        self.out_of_order_count = 0
+        self.stale_count = 0
+        self.malformed_count = 0
+    
+    def offer(self, channel: str, timestamp: float, value: Any, sender: Any = None) -> bool:
+        """サンプルを追加（受信側から呼び出す）
+        
+        Args:
+            channel: チャンネル名
+            timestamp: 送信側タイムスタンプ（秒）
+            value: サンプルの値
+            sender: 送信元（UDPの送信元アドレスなど、順序の判定は送信元ごとに行う）
+            
+        Returns:
+            受け付けた場合はTrue、遅延・順序逆転で破棄した場合はFalse
+        """
+        now = time.perf_counter()
+        key = (channel, sender)
+        with self._lock:
+            last = self._last_accepted.get(key)
+            if last is not None and timestamp <= last[0] and not self._is_expired(last[1], now):
+                self.out_of_order_count += 1
+                return False
+            self._last_accepted[key] = (timestamp, now)
+            if len(self._last_accepted) > self.MAX_SENDERS:
+                self._forget_senders(now)
+            self._latest[channel] = (value, now)
+            self.accepted_count += 1
+            return True
+    
+    def _is_expired(self, accepted_at: float, now: float) -> bool:
+        return (now - accepted_at) * 1000.0 > self.max_age_ms
+    
+    def _forget_senders(self, now: float):
+        """古い送信元の記録を削除し、それでも上限を超える場合は最も古いものを削除（ロック内で呼び出す）"""
+        for key, (_, accepted_at) in list(self._last_accepted.items()):
+            if self._is_expired(accepted_at, now):
+                del self._last_accepted[key]
+        while len(self._last_accepted) > self.MAX_SENDERS:
+            oldest = min(self._last_accepted, key=lambda key: self._last_accepted[key][1])
+            del self._last_accepted[oldest]
+    
+    def take(self, channel: str) -> Optional[Any]:
+        """前回の取り出し以降に届いた最新のサンプルを取り出す（描画側から呼び出す）
+        
+        Returns:
+            サンプルの値（新しいサンプルがない、または古すぎる場合はNone）
+        """
+        with self._lock:
+            sample = self._latest.pop(channel, None)
+        if sample is None:
+            return None
+        
+        value, received_at = sample
+        if self._is_expired(received_at, time.perf_counter()):
+            self.stale_count += 1
+            return None
+        return value
+    
+    def get_stats(self) -> Dict[str, int]:
+        """受信統計を取得"""
+        return {
+            'accepted': self.accepted_count,
+            'out_of_order': self.out_of_order_count,
+            'stale': self.stale_count,
+            'malformed': self.malformed_count
+        }
+
+class LiveSampleProtocol(asyncio.DatagramProtocol):
+    """タイムスタンプ付きの視線・リップシンク強度サンプルを受信するUDPプロトコル"""
+    
+    def __init__(self, buffer: LiveSampleBuffer):
+        self.buffer = buffer
+    
+    def datagram_received(self, data: bytes, addr):
+        try:
+            opcode, timestamp, values = binary_protocol.decode_udp_sample(data)
+        except binary_protocol.ProtocolError:
+            self.buffer.malformed_count += 1
+            return
+        
+        # NaN・無限大のサンプルはdecode_udp_sampleで不正として破棄される
+        if opcode == binary_protocol.OP_SET_GAZE_TARGET:
+            self.buffer.offer(LiveSampleBuffer.GAZE, timestamp, values, addr)
+        else:
+            self.buffer.offer(LiveSampleBuffer.LIP, timestamp, max(0.0, min(1.0, values[0])), addr)
+
+class Subscription:
+    """push通知を購読しているクライアントの状態
+    
+    未送信の更新はトピックごとに最新の1件だけを保持し（古い更新は上書き）、
+    min_interval秒に1回まとめて送信する。
+    """
+    
+    def __init__(self, topics: Tuple[str, ...], min_interval: float):
+        self.topics = topics
+        self.min_interval = min_interval
+        self.pending: Dict[str, Any] = {}
+        self.last_sent = 0.0
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        
+        # 統計
+        self.sent_count = 0
+        self.coalesced_count = 0
+    
+    def cancel(self):
+        """予約済みの送信を取り消す"""
+        if self.flush_handle:
+            self.flush_handle.cancel()
+            self.flush_handle = None
 
 class CommandInterface:
-    """外部コマンドを受信するTCP/IPインターフェース"""
+    """外部コマンドを受信するTCP/IPインターフェース
+    
+    コマンドは改行区切りのJSON（1行1コマンド）で受信する。1つの接続で応答を待たずに
+    複数のコマンドを連続送信（パイプライン化）でき、応答は受信順に1行ずつ返す。
+    
+    スレッド安全性:
+        - 通常モードではサーバーと描画ループが同じイベントループ（同一スレッド）で動作し、
+          コマンドはCOMMAND_RECEIVEDイベントとして発行される。
+        - スレッドモード（start_server_thread）ではサーバーが専用スレッドで動作する。
+          この場合、検証済みのコマンドはcommand_queueに追加されるだけで、サーバースレッドは
+          event_systemへの発行も、StateMachineや描画系オブジェクトへのアクセスも行わない。
+          それらは描画スレッドがフレームごとにキューを取り出して操作する。
+        - event_systemへのリスナー登録は、サーバースレッドの開始前に済ませること。
+        - publish()はどのスレッドからでも呼び出せる。push通知の集約と送信は
+          サーバーのイベントループ上で行い、描画側がソケットの送信を待つことはない。
+        - クライアントへの送信はクライアントごとの送信キュー（ClientSender）を経由し、
+          ソケットへの書き込みは各クライアント専用の送信タスクが行う。
+    """
     
     def __init__(self):
         self.command_config = config.get_command_interface_config()
         self.host = self.command_config.get('host', '0.0.0.0')
         self.port = self.command_config.get('port', 8888)
-        self.buffer_size = self.command_config.get('buffer_size', 1024)
+        self.max_frame_size = self.command_config.get('max_frame_size', 65536)
+        self.binary_port = self.command_config.get('binary_port')
+        self.udp_port = self.command_config.get('udp_port')
         
         # サーバー管理
         self.server = None
+        self.binary_server = None
+        self.udp_transport = None
+        
+        # UDPで受信した最新のサンプル（描画ループが毎フレーム取り出す）
+        self.live_samples = LiveSampleBuffer(self.command_config.get('udp_max_age_ms', 100))
         self.is_running = False
-        self.clients = set()
+        self.clients: Dict[asyncio.StreamWriter, ClientSender] = {}  # JSONクライアントと送信キュー
+        self.send_queue_size = self.command_config.get('send_queue_size', 64)
+        self.send_queue_policy = self.command_config.get('send_queue_policy', ClientSender.DISCONNECT)
+        
+        # push通知（subscribeしたクライアントごとの購読状態）
+        self.subscriptions: Dict[asyncio.StreamWriter, Subscription] = {}
+        self.push_max_rate_hz = self.command_config.get('push_max_rate_hz', 10)
+        self.latest_status: Dict[str, Any] = {}  # トピックごとの最新の通知内容
+        self.latest_metrics: Optional[Dict[str, Any]] = None  # 段階ごとの計測結果（計測無効時はNone）
+        
+        # change_stateで受け付ける状態名（描画側がset_available_statesで登録済みの状態を設定する）
+        self.available_states: Tuple[str, ...] = (
+            States.IDLE, States.THINKING, States.SPEAKING, States.SLEEPING
+        )
+        
+        # スレッドモード用（Noneの場合はCOMMAND_RECEIVEDイベントを直接発行）
+        self.command_queue = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.server_thread: Optional[threading.Thread] = None
         
         # コマンドハンドラー
         self.command_handlers: Dict[str, Callable] = {}
@@ -26,59 +262,199 @@ class CommandInterface:
         # ログ設定
         self.logger = logging.getLogger(__name__)
         
+        event_system.subscribe(EventType.STATE_CHANGED, self._on_state_changed)
+        
     def setup_default_handlers(self):
         """デフォルトのコマンドハンドラーを設定"""
         self.command_handlers = {
             'change_state': self._handle_change_state,
             'set_parameter': self._handle_set_parameter,
             'get_status': self._handle_get_status,
+            'get_metrics': self._handle_get_metrics,
             'shutdown': self._handle_shutdown,
-            'ping': self._handle_ping
+            'ping': self._handle_ping,
+            'batch': self._handle_batch,
+            'set_gaze_target': self._handle_set_gaze_target,
+            'lip_sync_sample': self._handle_lip_sync_sample,
+            'subscribe': self._handle_subscribe,
+            'unsubscribe': self._handle_unsubscribe
         }
     
     async def start_server(self):
         """コマンドサーバーを開始"""
+        self.loop = asyncio.get_running_loop()
         try:
             self.server = await asyncio.start_server(
                 self._handle_client,
                 self.host,
-                self.port
+                self.port,
+                limit=self.max_frame_size
             )
             self.is_running = True
             
             addr = self.server.sockets[0].getsockname()
             self.logger.info(f"コマンドサーバーを開始しました: {addr[0]}:{addr[1]}")
-            print(f"コマンドサーバーを開始しました: {addr[0]}:{addr[1]}")
             
-            async with self.server:
-                await self.server.serve_forever()
+            # バイナリプロトコル用のリスナー（同じハンドラーテーブルを使用）
+            if self.binary_port is not None:
+                self.binary_server = await asyncio.start_server(
+                    self._handle_binary_client,
+                    self.host,
+                    self.binary_port
+                )
+                addr = self.binary_server.sockets[0].getsockname()
+                self.logger.info(f"バイナリコマンドサーバーを開始しました: {addr[0]}:{addr[1]}")
+            
+            # ストリーミングサンプル用のUDPエンドポイント
+            if self.udp_port is not None:
+                self.udp_transport, _ = await self.loop.create_datagram_endpoint(
+                    lambda: LiveSampleProtocol(self.live_samples),
+                    local_addr=(self.host, self.udp_port)
+                )
+                addr = self.udp_transport.get_extra_info('sockname')
+                self.logger.info(f"UDPサンプル受信を開始しました: {addr[0]}:{addr[1]}")
+            
+            try:
+                async with self.server:
+                    await self.server.serve_forever()
+            finally:
+                self._close_servers()
                 
         except Exception as e:
             self.logger.error(f"サーバー開始エラー: {e}")
-            print(f"サーバー開始エラー: {e}")
             self.is_running = False
     
+    def _close_servers(self):
+        """すべてのリスナーを閉じる"""
+        if self.udp_transport:
+            self.udp_transport.close()
+        if self.binary_server:
+            self.binary_server.close()
+        if self.server:
+            self.server.close()
+    
     async def stop_server(self):
         """コマンドサーバーを停止"""
         if self.server:
-            self.server.close()
+            self._close_servers()
             await self.server.wait_closed()
+            if self.binary_server:
+                await self.binary_server.wait_closed()
             self.is_running = False
             self.logger.info("コマンドサーバーを停止しました")
-            print("コマンドサーバーを停止しました")
+    
+    def start_server_thread(self, command_queue):
+        """専用スレッドでコマンドサーバーを開始
+        
+        Args:
+            command_queue: 検証済みコマンドを描画スレッドへ渡すキュー（CommandQueue）
+        """
+        self.command_queue = command_queue
+        self.server_thread = threading.Thread(
+            target=self._run_server_thread,
+            name="CommandServer",
+            daemon=True
+        )
+        self.server_thread.start()
+    
+    def _run_server_thread(self):
+        """サーバースレッドのエントリーポイント"""
+        try:
+            asyncio.run(self.start_server())
+        except asyncio.CancelledError:
+            # stop_server_thread()によるserve_foreverの終了
+            pass
+    
+    def stop_server_thread(self, timeout: float = 2.0):
+        """専用スレッドのコマンドサーバーを停止（描画スレッドから呼び出す）"""
+        if self.loop and self.server:
+            self.loop.call_soon_threadsafe(self._close_servers)
+        if self.server_thread:
+            self.server_thread.join(timeout)
+            self.server_thread = None
+        self.is_running = False
+    
+    def _dispatch_command(self, command_data: Dict[str, Any]) -> bool:
+        """検証済みコマンドを描画側に渡す
+        
+        Args:
+            command_data: COMMAND_RECEIVEDとして渡すデータ
+            
+        Returns:
+            受け付けた場合はTrue（スレッドモードでキューが満杯の場合はFalse）
+        """
+        collector = _batch_collector.get()
+        if collector is not None:
+            # バッチ処理中はまとめて1回で渡す（_handle_batch参照）
+            collector.append(command_data)
+            return True
+        
+        if self.command_queue is not None:
+            return self.command_queue.put(command_data)
+        
+        event_system.emit(EventType.COMMAND_RECEIVED, command_data)
+        return True
+    
+    def _queue_full_response(self) -> Dict[str, Any]:
+        """キュー満杯時のエラーレスポンスを生成"""
+        return {
+            'error': 'queue_full',
+            'message': 'コマンドキューが満杯です'
+        }
+    
+    async def _read_frame(self, reader: asyncio.StreamReader) -> Optional[bytes]:
+        """改行区切りのフレームを1つ読み込む
+        
+        Returns:
+            フレームのバイト列（改行を含む）、接続終了時はNone。
+            最終行に改行がない場合はその内容を最後のフレームとして返す
+            
+        Raises:
+            FrameTooLargeError: フレームがmax_frame_sizeを超えた場合（残りは読み捨て済み）
+        """
+        try:
+            return await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as e:
+            return e.partial or None
+        except asyncio.LimitOverrunError as e:
+            await self._discard_frame(reader, e.consumed)
+            raise FrameTooLargeError()
+    
+    async def _discard_frame(self, reader: asyncio.StreamReader, consumed: int):
+        """サイズ超過したフレームを次の改行まで読み捨てる"""
+        while True:
+            await reader.read(consumed)
+            try:
+                await reader.readuntil(b'\n')
+                return
+            except asyncio.IncompleteReadError:
+                return
+            except asyncio.LimitOverrunError as e:
+                consumed = e.consumed
     
     async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """クライアント接続を処理"""
         client_addr = writer.get_extra_info('peername')
         self.logger.info(f"クライアント接続: {client_addr}")
-        print(f"クライアント接続: {client_addr}")
         
-        self.clients.add(writer)
+        sender = ClientSender(writer, self.send_queue_size, self.send_queue_policy)
+        sender.start()
+        self.clients[writer] = sender
+        _current_client.set(writer)
         
         try:
             while True:
-                # データ受信
-                data = await reader.read(self.buffer_size)
+                # データ受信（1行1コマンド）
+                try:
+                    data = await self._read_frame(reader)
+                except FrameTooLargeError:
+                    error_response = {
+                        'error': 'frame_too_large',
+                        'message': f'コマンドが最大サイズ（{self.max_frame_size}バイト）を超えています'
+                    }
+                    await sender.send(f"{json.dumps(error_response)}\n".encode('utf-8'))
+                    continue
+                
                 if not data:
                     break
                 
@@ -89,24 +465,22 @@ class CommandInterface:
                         continue
                         
                     command_data = json.loads(message)
-                    self.logger.debug(f"受信コマンド: {command_data}")
+                    self.logger.debug("受信コマンド: %s", command_data)
                     
                     # コマンド処理
                     response = await self._process_command(command_data)
                     
-                    # レスポンス送信
-                    if response:
+                    # レスポンス送信（no_replyが指定された場合は送信しない）
+                    if response and not self._is_no_reply(command_data):
                         response_json = json.dumps(response, ensure_ascii=False)
-                        writer.write(f"{response_json}\n".encode('utf-8'))
-                        await writer.drain()
+                        await sender.send(f"{response_json}\n".encode('utf-8'))
                         
                 except json.JSONDecodeError as e:
                     error_response = {
                         'error': 'invalid_json',
                         'message': f'JSONフォーマットエラー: {str(e)}'
                     }
-                    writer.write(f"{json.dumps(error_response)}\n".encode('utf-8'))
-                    await writer.drain()
+                    await sender.send(f"{json.dumps(error_response)}\n".encode('utf-8'))
                     
                 except Exception as e:
                     self.logger.error(f"コマンド処理エラー: {e}")
@@ -114,19 +488,65 @@ class CommandInterface:
                         'error': 'processing_error',
                         'message': f'処理エラー: {str(e)}'
                     }
-                    writer.write(f"{json.dumps(error_response)}\n".encode('utf-8'))
-                    await writer.drain()
+                    await sender.send(f"{json.dumps(error_response)}\n".encode('utf-8'))
                     
         except asyncio.CancelledError:
             pass
         except Exception as e:
             self.logger.error(f"クライアント処理エラー: {e}")
         finally:
-            self.clients.discard(writer)
+            self.clients.pop(writer, None)
+            self._remove_subscription(writer)
+            sender.close()
             writer.close()
-            await writer.wait_closed()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
             self.logger.info(f"クライアント切断: {client_addr}")
-            print(f"クライアント切断: {client_addr}")
+    
+    async def _handle_binary_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """バイナリプロトコルのクライアント接続を処理
+        
+        長さ付きフレームをデコードし、JSONと同じ_process_commandで処理する。
+        ACKが要求された場合のみステータスフレームを返す。
+        """
+        client_addr = writer.get_extra_info('peername')
+        self.logger.info(f"バイナリクライアント接続: {client_addr}")
+        
+        try:
+            while True:
+                header = await reader.readexactly(binary_protocol.HEADER.size)
+                (length,) = binary_protocol.HEADER.unpack(header)
+                body = await reader.readexactly(length)
+                
+                try:
+                    command_data, ack = binary_protocol.decode_command(body)
+                except binary_protocol.ProtocolError as e:
+                    self.logger.warning(f"不正なバイナリフレーム: {e}")
+                    if body and body[0] & binary_protocol.ACK_FLAG:
+                        writer.write(binary_protocol.encode_status(False))
+                        await writer.drain()
+                    continue
+                
+                response = await self._process_command(command_data)
+                if ack:
+                    writer.write(binary_protocol.encode_status('error' not in response))
+                    await writer.drain()
+                    
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error(f"バイナリクライアント処理エラー: {e}")
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.logger.info(f"バイナリクライアント切断: {client_addr}")
     
     async def _process_command(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
         """コマンドを処理"""
@@ -166,14 +586,29 @@ class CommandInterface:
             }
         
         state_name = command_data['state']
+        if state_name not in self.available_states:
+            # 未知の状態はStateMachineで無視されるため、受け付けずにエラーを返す
+            # （集約時に有効な状態変更を上書きしないように）
+            return {
+                'error': 'invalid_state',
+                'message': f'未知の状態です: {state_name}',
+                'available_states': list(self.available_states)
+            }
         parameters = command_data.get('parameters', {})
+        error = validate_parameters(parameters)
+        if error:
+            return {
+                'error': 'invalid_parameters',
+                'message': error
+            }
         
         # 状態変更イベントを発行
-        event_system.emit(EventType.COMMAND_RECEIVED, {
+        if not self._dispatch_command({
             'command': 'change_state',
             'state': state_name,
             'parameters': parameters
-        })
+        }):
+            return self._queue_full_response()
         
         return {
             'success': True,
@@ -191,12 +626,19 @@ class CommandInterface:
             }
         
         parameters = command_data['parameters']
+        error = validate_parameters(parameters)
+        if error:
+            return {
+                'error': 'invalid_parameters',
+                'message': error
+            }
         
         # パラメータ設定イベントを発行
-        event_system.emit(EventType.COMMAND_RECEIVED, {
+        if not self._dispatch_command({
             'command': 'set_parameter',
             'parameters': parameters
-        })
+        }):
+            return self._queue_full_response()
         
         return {
             'success': True,
@@ -207,32 +649,270 @@ class CommandInterface:
     async def _handle_get_status(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
         """ステータス取得コマンドを処理"""
         # ステータス取得イベントを発行
-        event_system.emit(EventType.COMMAND_RECEIVED, {
+        self._dispatch_command({
             'command': 'get_status'
         })
         
-        # TODO: 実際のステータス情報を取得する仕組みを後で実装
         return {
             'success': True,
             'status': {
                 'server_running': self.is_running,
                 'clients_connected': len(self.clients),
-                'server_address': f"{self.host}:{self.port}"
+                'subscribers': len(self.subscriptions),
+                'client_queues': self.get_client_stats(),
+                'server_address': f"{self.host}:{self.port}",
+                **self.latest_status
+            }
+        }
+    
+    async def _handle_get_metrics(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """計測結果取得コマンドを処理（描画ループが1秒ごとにset_metricsした内容を返す）"""
+        metrics = self.latest_metrics
+        if metrics is None:
+            return {
+                'error': 'profiler_disabled',
+                'message': '計測が無効です（profiling.enabledを有効にするか、F3でオーバーレイを表示してください）'
             }
+        
+        return {
+            'success': True,
+            'metrics': metrics
         }
     
     async def _handle_shutdown(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
         """シャットダウンコマンドを処理"""
         # シャットダウンイベントを発行
-        event_system.emit(EventType.COMMAND_RECEIVED, {
+        if not self._dispatch_command({
             'command': 'shutdown'
-        })
+        }):
+            return self._queue_full_response()
         
         return {
             'success': True,
             'message': 'シャットダウンを開始します'
         }
     
+    async def _handle_set_gaze_target(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """視線ターゲット設定コマンドを処理（目の中心からのオフセット、ピクセル）"""
+        try:
+            x = float(command_data['x'])
+            y = float(command_data['y'])
+            if not (math.isfinite(x) and math.isfinite(y)):
+                raise ValueError('non-finite gaze target')
+        except (KeyError, TypeError, ValueError):
+            return {
+                'error': 'invalid_gaze_target',
+                'message': '視線ターゲット（x, y）が不正です'
+            }
+        
+        if not self._dispatch_command({
+            'command': 'set_gaze_target',
+            'x': x,
+            'y': y
+        }):
+            return self._queue_full_response()
+        
+        return {
+            'success': True,
+            'x': x,
+            'y': y
+        }
+    
+    async def _handle_lip_sync_sample(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """リップシンク強度サンプルを処理（発話中状態の口の動きを直接駆動）"""
+        try:
+            intensity = max(0.0, min(1.0, float(command_data['intensity'])))
+        except (KeyError, TypeError, ValueError):
+            return {
+                'error': 'invalid_intensity',
+                'message': 'リップシンク強度が不正です'
+            }
+        
+        if not self._dispatch_command({
+            'command': 'lip_sync_sample',
+            'intensity': intensity
+        }):
+            return self._queue_full_response()
+        
+        return {
+            'success': True,
+            'intensity': intensity
+        }
+    
+    async def _handle_batch(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """複数のコマンドをまとめて処理
+        
+        サブコマンドは順番に処理され、描画側へは1つのbatchコマンドとしてまとめて
+        渡されるため、同じフレームで受信順に適用される。
+        """
+        commands = command_data.get('commands')
+        if not isinstance(commands, list):
+            return {
+                'error': 'missing_commands',
+                'message': 'コマンドのリストが指定されていません'
+            }
+        
+        collected = []
+        results = []
+        token = _batch_collector.set(collected)
+        try:
+            for sub_command in commands:
+                if not isinstance(sub_command, dict):
+                    results.append({
+                        'error': 'invalid_command',
+                        'message': 'コマンドはオブジェクトで指定してください'
+                    })
+                elif sub_command.get('command') == 'batch':
+                    results.append({
+                        'error': 'nested_batch',
+                        'message': 'batchは入れ子にできません'
+                    })
+                else:
+                    results.append(await self._process_command(sub_command))
+        finally:
+            _batch_collector.reset(token)
+        
+        if collected and not self._dispatch_command({
+            'command': 'batch',
+            'commands': collected
+        }):
+            return self._queue_full_response()
+        
+        return {
+            'success': all('error' not in result for result in results),
+            'count': len(results),
+            'results': results
+        }
+    
+    async def _handle_subscribe(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """push通知の購読を登録
+        
+        topics（省略時はすべて）の更新が、max_rate_hz（省略時はpush_max_rate_hz）を
+        上限としてまとめて送られる。再度subscribeすると設定を置き換える。
+        """
+        writer = _current_client.get()
+        if writer is None:
+            return {
+                'error': 'subscribe_unsupported',
+                'message': 'この接続ではsubscribeを利用できません'
+            }
+        
+        topics = command_data.get('topics', list(PUSH_TOPICS))
+        if not isinstance(topics, list) or not topics or any(topic not in PUSH_TOPICS for topic in topics):
+            return {
+                'error': 'invalid_topics',
+                'message': f'トピックは{list(PUSH_TOPICS)}から指定してください'
+            }
+        
+        try:
+            max_rate_hz = float(command_data.get('max_rate_hz', self.push_max_rate_hz))
+        except (TypeError, ValueError):
+            max_rate_hz = 0.0
+        if max_rate_hz <= 0:
+            return {
+                'error': 'invalid_rate',
+                'message': 'max_rate_hzは正の数で指定してください'
+            }
+        max_rate_hz = min(max_rate_hz, self.push_max_rate_hz)
+        
+        self._remove_subscription(writer)
+        self.subscriptions[writer] = Subscription(tuple(topics), 1.0 / max_rate_hz)
+        
+        return {
+            'success': True,
+            'topics': topics,
+            'max_rate_hz': max_rate_hz
+        }
+    
+    async def _handle_unsubscribe(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """push通知の購読を解除"""
+        writer = _current_client.get()
+        return {
+            'success': True,
+            'subscribed': self._remove_subscription(writer) if writer is not None else False
+        }
+    
+    def _remove_subscription(self, writer: asyncio.StreamWriter) -> bool:
+        """購読を解除（購読していた場合はTrue）"""
+        subscription = self.subscriptions.pop(writer, None)
+        if subscription is None:
+            return False
+        subscription.cancel()
+        return True
+    
+    def _on_state_changed(self, event):
+        """状態変更をpush通知する（STATE_CHANGEDリスナー）"""
+        self.publish('state', {
+            'previous_state': event.data['previous_state'],
+            'current_state': event.data['current_state']
+        })
+    
+    def publish(self, topic: str, data: Dict[str, Any]):
+        """購読クライアントへ更新を通知（どのスレッドからでも呼び出せる）
+        
+        最新の内容はget_statusでも返す。送信はサーバーのイベントループ上で行う。
+        
+        Args:
+            topic: PUSH_TOPICSのいずれか
+            data: 通知内容
+        """
+        self.latest_status[topic] = data
+        if not self.subscriptions or self.loop is None:
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._queue_push, topic, data)
+        except RuntimeError:
+            # イベントループが既に終了している
+            pass
+    
+    def set_available_states(self, states):
+        """change_stateで受け付ける状態名を設定（サーバーの開始前に描画側から呼び出す）
+        
+        Args:
+            states: 状態名のリスト（StateMachine.get_available_states()）
+        """
+        self.available_states = tuple(states)
+    
+    def set_metrics(self, metrics: Optional[Dict[str, Any]]):
+        """get_metricsで返す計測結果を更新（どのスレッドからでも呼び出せる）
+        
+        Args:
+            metrics: FrameProfiler.get_metrics()の結果（計測無効時はNone）
+        """
+        self.latest_metrics = metrics
+    
+    def _queue_push(self, topic: str, data: Dict[str, Any]):
+        """購読クライアントごとに更新を集約し、送信を予約（イベントループ上で実行）"""
+        for writer, subscription in self.subscriptions.items():
+            if topic not in subscription.topics:
+                continue
+            if topic in subscription.pending:
+                subscription.coalesced_count += 1
+            subscription.pending[topic] = data
+            
+            if subscription.flush_handle is None:
+                delay = max(0.0, subscription.last_sent + subscription.min_interval - self.loop.time())
+                subscription.flush_handle = self.loop.call_later(delay, self._flush_subscription, writer)
+    
+    def _flush_subscription(self, writer: asyncio.StreamWriter):
+        """集約した更新を1メッセージで送信（イベントループ上で実行）"""
+        subscription = self.subscriptions.get(writer)
+        if subscription is None:
+            return
+        subscription.flush_handle = None
+        if not subscription.pending:
+            return
+        
+        message = {'event': 'update', 'updates': subscription.pending}
+        subscription.pending = {}
+        subscription.last_sent = self.loop.time()
+        subscription.sent_count += 1
+        self._write_to_clients(message, (writer,))
+    
+    def _is_no_reply(self, command_data: Any) -> bool:
+        """応答不要（fire-and-forget）のコマンドかどうか"""
+        return isinstance(command_data, dict) and bool(command_data.get('no_reply', False))
+    
     async def _handle_ping(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
         """Pingコマンドを処理"""
         return {
@@ -257,18 +937,28 @@ class CommandInterface:
         if not self.clients:
             return
         
-        message_json = json.dumps(message, ensure_ascii=False)
+        self._write_to_clients(message, self.clients)
+    
+    def _write_to_clients(self, message: Dict[str, Any], writers):
+        """メッセージを各クライアントの送信キューに追加（送信完了は待たない）
         
-        # 無効なクライアントを除去するためのセット
-        clients_to_remove = set()
+        キューが満杯の場合はsend_queue_policyに従い、古いメッセージの破棄・新しい
+        メッセージの破棄・切断のいずれかを行う。
+        """
+        data = f"{json.dumps(message, ensure_ascii=False)}\n".encode('utf-8')
         
-        for writer in self.clients:
-            try:
-                writer.write(f"{message_json}\n".encode('utf-8'))
-                await writer.drain()
-            except Exception as e:
-                self.logger.warning(f"ブロードキャスト送信エラー: {e}")
-                clients_to_remove.add(writer)
-        
-        # 無効なクライアントを除去
-        self.clients -= clients_to_remove
\ No newline at end of file
+        for writer in list(writers):
+            sender = self.clients.get(writer)
+            if sender is None or sender.closed:
+                continue
+            if not sender.put(data) and sender.closed:
+                self.logger.warning(f"送信キューが溢れたクライアントを切断しました: {writer.get_extra_info('peername')}")
+                self.clients.pop(writer, None)
+                self._remove_subscription(writer)
+    
+    def get_client_stats(self) -> list:
+        """クライアントごとの送信キューの統計を取得"""
+        return [
+            {'address': str(writer.get_extra_info('peername')), **sender.get_stats()}
+            for writer, sender in self.clients.items()
+        ]
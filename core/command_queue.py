@@ -0,0 +1,65 @@
+import time
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+class CommandQueue:
+    """コマンドサーバースレッドから描画スレッドへコマンドを渡す有界キュー
+
+    生産者（コマンドサーバースレッド）と消費者（描画スレッド）がそれぞれ1つの
+    SPSC構成を前提とする。deque.append / popleft はGILの下でアトミックなため
+    ロックは使用しない。容量を超えたコマンドは受け付けずに破棄数として数える。
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._items: deque = deque()
+
+        # 統計（putは生産者側、drainは消費者側のみが更新する）
+        self.enqueued_count = 0
+        self.dropped_count = 0
+        self.drained_count = 0
+
+    def put(self, command_data: Dict[str, Any]) -> bool:
+        """コマンドを追加（生産者スレッドから呼び出す）
+
+        Args:
+            command_data: 検証済みのコマンドデータ
+
+        Returns:
+            追加できた場合はTrue、キューが満杯の場合はFalse
+        """
+        if len(self._items) >= self.maxsize:
+            self.dropped_count += 1
+            return False
+
+        self._items.append((command_data, time.perf_counter()))
+        self.enqueued_count += 1
+        return True
+
+    def drain(self) -> List[Tuple[Dict[str, Any], float]]:
+        """キュー内のコマンドをすべて取り出す（消費者スレッドから1フレームに1回呼び出す）
+
+        Returns:
+            (コマンドデータ, 受信時刻（perf_counter）)のリスト
+        """
+        items = []
+        while True:
+            try:
+                items.append(self._items.popleft())
+            except IndexError:
+                break
+        self.drained_count += len(items)
+        return items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get_stats(self) -> Dict[str, int]:
+        """キューの統計を取得"""
+        return {
+            'depth': len(self._items),
+            'maxsize': self.maxsize,
+            'enqueued': self.enqueued_count,
+            'dropped': self.dropped_count,
+            'drained': self.drained_count
+        }
@@ -0,0 +1,56 @@
+from typing import Optional
+
+class FrameRateScheduler:
+    """状態とアニメーションに応じて目標フレームレートを選択するスケジューラー
+
+    通常は現在の状態が宣言するフレームレート（BaseState.get_target_fps）を使用し、
+    まばたきや視線移動（サッケード）の間と、その直後の一定時間は
+    ブーストフレームレートに引き上げる。上限はdisplay.fps。
+    """
+
+    def __init__(self, max_fps: int, boost_fps: Optional[int] = None,
+                 boost_hold_ms: int = 250, enabled: bool = True):
+        """
+        Args:
+            max_fps: フレームレートの上限（display.fps）
+            boost_fps: アニメーション中のフレームレート（省略時はmax_fps）
+            boost_hold_ms: アニメーション終了後もブーストを維持する時間（ミリ秒）
+            enabled: Falseの場合は常にmax_fpsを使用
+        """
+        self.max_fps = max_fps
+        self.boost_fps = min(boost_fps or max_fps, max_fps)
+        self.boost_hold_ms = boost_hold_ms
+        self.enabled = enabled
+
+        self.boost_until = 0
+        self.target_fps = max_fps
+
+    def update(self, current_time: int, state_fps: Optional[int], animating: bool) -> int:
+        """目標フレームレートを更新
+
+        Args:
+            current_time: 現在時刻（ミリ秒）
+            state_fps: 現在の状態が宣言するフレームレート（Noneは上限を使用）
+            animating: まばたきや視線移動が進行中かどうか
+
+        Returns:
+            このフレームの目標フレームレート
+        """
+        if not self.enabled:
+            self.target_fps = self.max_fps
+            return self.target_fps
+
+        if animating:
+            self.boost_until = current_time + self.boost_hold_ms
+
+        target = min(state_fps or self.max_fps, self.max_fps)
+        if current_time < self.boost_until:
+            target = max(target, self.boost_fps)
+
+        self.target_fps = max(1, target)
+        return self.target_fps
+
+    @property
+    def frame_budget_ms(self) -> float:
+        """現在の目標フレームレートでの1フレームあたりの時間（ミリ秒）"""
+        return 1000.0 / self.target_fps
@@ -1,4 +1,5 @@
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, List
+import logging
 import pygame
 from states.base_state import BaseState
 from utils.events import event_system, EventType
@@ -8,6 +9,7 @@ class StateMachine:
     """状態機械の管理クラス"""
     
     def __init__(self):
+        self.logger = logging.getLogger(__name__)
         self._states: Dict[str, BaseState] = {}
         self._current_state: Optional[BaseState] = None
         self._previous_state: Optional[str] = None
@@ -35,7 +37,7 @@ class StateMachine:
             状態変更が成功したかどうか
         """
         if state_name not in self._states:
-            print(f"未知の状態です: {state_name}")
+            self.logger.warning(f"未知の状態です: {state_name}")
             return False
             
         # 同じ状態への変更は無視
@@ -81,6 +83,24 @@ class StateMachine:
         if self._current_state:
             self._current_state.render(screen)
             
+    def get_target_fps(self) -> Optional[int]:
+        """現在の状態が希望するフレームレートを取得"""
+        if self._current_state:
+            return self._current_state.get_target_fps()
+        return None
+        
+    def get_overlay_rects(self) -> List[pygame.Rect]:
+        """現在の状態のオーバーレイ領域を取得"""
+        if self._current_state:
+            return self._current_state.get_overlay_rects()
+        return []
+            
+    def get_render_signature(self) -> Any:
+        """現在の状態のオーバーレイの見た目を表す値を取得（変化検出用）"""
+        if self._current_state:
+            return self._current_state.get_render_signature()
+        return None
+            
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベントを現在の状態に転送
         
@@ -3,32 +3,70 @@
 import pygame
 import sys
 import os
+import time
 import asyncio
+import logging
+from typing import Optional
 
 # パッケージのルートディレクトリをPythonパスに追加
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from core.state_machine import StateMachine
+from core.frame_scheduler import FrameRateScheduler
 from states.idle_state import IdleState
 from states.thinking_state import ThinkingState
 from states.speaking_state import SpeakingState
 from renderers.eye_renderer import EyeRenderer
 from renderers.border_renderer import BorderRenderer
+from renderers.dirty_rect_tracker import DirtyRectTracker
+from renderers.frame_change_detector import FrameChangeDetector
+from renderers.profiler_overlay import ProfilerOverlay
 from animation.controller import AnimationController
 from utils.config import config
 from utils.events import event_system, EventType
+from utils.frame_clock import frame_clock, VirtualClock
+from utils.logger import setup_logging
+from utils.profiler import FrameProfiler
+from utils.stats import RollingStats
 
 class RobotFaceApp:
     """ロボット顔表示アプリケーションのメインクラス"""
     
-    def __init__(self, enable_command_interface: bool = True):
+    def __init__(self, enable_command_interface: bool = True, headless: bool = False):
+        """
+        Args:
+            enable_command_interface: コマンドインターフェースを有効にするか
+            headless: ウィンドウを開かずにオフスクリーンのサーフェスへ描画するか
+                      （SDLのダミービデオドライバーを使用。ベンチマーク・CI用）
+        """
+        self.headless = headless
+        
+        # フレームの段階ごとの計測（無効時はNone。ヘッドレス時は常に計測）
+        self.profiling_config = config.get_profiling_config()
+        self.profiler = None
+        if headless:
+            self.profiler = FrameProfiler()
+        elif self.profiling_config['enabled']:
+            self.profiler = FrameProfiler(self.profiling_config['window'])
+        self.profiler_overlay = None
+        
+        # 起動時間の計測（最初のフレーム・全テクスチャでの最初のフレームまで）
+        self.started_at = time.perf_counter()
+        self.logger = logging.getLogger(__name__)
+        self.first_frame_at = None
+        self.full_quality_at = None
+        
         # 設定を読み込み
         self.display_config = config.get_display_config()
         self.eye_config = config.get_eye_config()
         self.color_config = config.get_color_config()
+        self.rendering_config = config.get_rendering_config()
         
-        # Pygame初期化
+        # Pygame初期化（ヘッドレス時はディスプレイのないマシンでも動くダミードライバーを使用）
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
         pygame.init()
+        frame_clock.reset()
         
         # ディスプレイ設定
         self.setup_display()
@@ -36,6 +74,12 @@ class RobotFaceApp:
         # クロック設定
         self.clock = pygame.time.Clock()
         self.fps = self.display_config['fps']
+        self.frame_scheduler = FrameRateScheduler(
+            max_fps=self.fps,
+            boost_fps=self.display_config['boost_fps'],
+            boost_hold_ms=self.display_config['boost_hold_ms'],
+            enabled=self.display_config['adaptive_fps']
+        )
         
         # 共通のレンダリングとアニメーションシステム
         self.setup_rendering_system()
@@ -46,23 +90,43 @@ class RobotFaceApp:
         
         # コマンドインターフェース
         self.command_interface = None
+        self.pending_commands = []  # 次のフレーム境界で適用するコマンド（受信時刻付き）
+        self.command_latency = RollingStats()  # コマンド受信から画面反映までの時間（ミリ秒）
+        self.frame_times = RollingStats()  # 1フレームの処理時間（ミリ秒、テレメトリ用）
+        self.telemetry_frames = 0
+        self.telemetry_started_at = time.perf_counter()
         self.enable_command_interface = enable_command_interface
+        self.command_queue = None
+        self.command_coalescer = None
         if enable_command_interface:
             from core.command_interface import CommandInterface
             self.command_interface = CommandInterface()
+            self.command_interface.set_available_states(self.state_machine.get_available_states())
+            command_config = config.get_command_interface_config()
+            if command_config['coalesce']:
+                from core.command_coalescer import CommandCoalescer
+                self.command_coalescer = CommandCoalescer()
+            if command_config['threaded']:
+                # サーバーを専用スレッドで動かし、コマンドはキュー経由で受け取る
+                from core.command_queue import CommandQueue
+                self.command_queue = CommandQueue(command_config['queue_size'])
         
         # イベントリスナーの設定
         self.setup_event_listeners()
         
+        if self.profiling_config['overlay'] and not headless:
+            self.toggle_profiler_overlay()
+        
         # 実行フラグ
         self.running = True
         
         print("ロボット顔表示システムを初期化しました")
         print(f"解像度: {self.display_config['width']}x{self.display_config['height']}")
-        print(f"FPS: {self.fps}")
+        print(f"FPS: {self.fps}" + ("（状態に応じて可変）" if self.frame_scheduler.enabled else ""))
         if self.command_interface:
             command_config = config.get_command_interface_config()
-            print(f"コマンドインターフェース: {command_config['host']}:{command_config['port']}")
+            mode = "（専用スレッド）" if self.command_queue is not None else ""
+            print(f"コマンドインターフェース: {command_config['host']}:{command_config['port']}{mode}")
         print("\n=== 操作方法 ===")
         print("ESC: 終了")
         print("F11: フルスクリーン切り替え")
@@ -72,6 +136,7 @@ class RobotFaceApp:
         print("4: 休止状態")
         print("R: アイドル状態にリセット")
         print("SPACE: まばたき")
+        print("F3: 計測結果の表示切り替え")
         print("↑/↓: 強度調整（思考中・発話中状態で）")
         print("ENTER: 発話停止/再開（発話中状態で）")
         print("================\n")
@@ -80,16 +145,35 @@ class RobotFaceApp:
         """ディスプレイを設定"""
         width = self.display_config['width']
         height = self.display_config['height']
-        fullscreen = self.display_config['fullscreen']
         
+        if self.headless:
+            # テクスチャのconvert_alphaに必要なため最小のディスプレイを設定し、
+            # 描画は同じ画素形式のオフスクリーンのサーフェスに対して行う
+            pygame.display.set_mode((1, 1))
+            self.screen = pygame.Surface((width, height)).convert()
+        else:
+            self.setup_window(width, height, self.display_config['fullscreen'])
+        
+        # 差分描画（有効時は変化した領域のみをディスプレイに転送）
+        self.dirty_rect_tracker = None
+        if self.rendering_config['dirty_rects']:
+            self.dirty_rect_tracker = DirtyRectTracker(self.screen.get_rect())
+        
+        # 変化検出（描画入力が前フレームと同じ場合は描画と転送を省略）
+        # ヘッドレス時は描画コストを計測するため毎フレーム描画する
+        self.frame_change_detector = None
+        if self.rendering_config['skip_unchanged_frames'] and not self.headless:
+            self.frame_change_detector = FrameChangeDetector()
+    
+    def setup_window(self, width: int, height: int, fullscreen: bool):
+        """ウィンドウ（またはフルスクリーン）を開く"""
         try:
             if fullscreen:
                 self.screen = pygame.display.set_mode((width, height), pygame.FULLSCREEN)
             else:
                 self.screen = pygame.display.set_mode((width, height))
         except pygame.error as e:
-            print(f"フルスクリーンモードでの初期化に失敗: {e}")
-            print("ウィンドウモードで実行します")
+            self.logger.warning(f"フルスクリーンモードでの初期化に失敗: {e}（ウィンドウモードで実行します）")
             self.screen = pygame.display.set_mode((width, height))
         
         pygame.display.set_caption("Communication Robot Face Display")
@@ -113,10 +197,14 @@ class RobotFaceApp:
             self.eye_config['height']
         )
         
-        # テクスチャの事前読み込み
-        self.eye_renderer.preload_all_textures(
+        # テクスチャの事前読み込み（バックグラウンドの場合は完了を待たずに描画を開始）
+        preload = (self.eye_renderer.start_background_preload
+                   if self.rendering_config['background_warmup']
+                   else self.eye_renderer.preload_all_textures)
+        preload(
             self.eye_config['width'],
-            self.eye_config['height']
+            self.eye_config['height'],
+            self.animation_controller.blink_controller.get_ratio_steps()
         )
     
     def setup_states(self):
@@ -140,49 +228,153 @@ class RobotFaceApp:
     def setup_event_listeners(self):
         """イベントリスナーを設定"""
         def on_state_changed(event):
-            print(f"状態変更: {event.data['previous_state']} -> {event.data['current_state']}")
+            self.logger.info(f"状態変更: {event.data['previous_state']} -> {event.data['current_state']}")
         
         def on_command_received(event):
-            """外部コマンド受信時の処理"""
-            command_data = event.data
-            command = command_data.get('command')
-            
-            if command == 'change_state':
-                state_name = command_data.get('state')
-                parameters = command_data.get('parameters', {})
-                
-                # 状態変更を実行
-                self.state_machine.change_state(state_name, **parameters)
-                print(f"コマンドで状態変更: {state_name}")
-                
-            elif command == 'set_parameter':
-                parameters = command_data.get('parameters', {})
-                # パラメータ設定を実行（現在の状態に応じて）
-                current_state = self.state_machine.get_current_state()
-                if current_state and hasattr(current_state, 'set_parameters'):
-                    current_state.set_parameters(parameters)
-                print(f"パラメータ設定: {parameters}")
-                
-            elif command == 'shutdown':
-                print("シャットダウンコマンドを受信しました")
-                self.running = False
+            """外部コマンド受信時の処理（次のフレーム境界で適用する）"""
+            self.pending_commands.append((event.data, time.perf_counter()))
         
         event_system.subscribe(EventType.STATE_CHANGED, on_state_changed)
         if self.command_interface:
             event_system.subscribe(EventType.COMMAND_RECEIVED, on_command_received)
     
+    def apply_command(self, command_data: dict):
+        """外部コマンドを適用
+        
+        Args:
+            command_data: COMMAND_RECEIVEDイベントのデータ
+        """
+        command = command_data.get('command')
+        
+        if command == 'change_state':
+            state_name = command_data.get('state')
+            parameters = command_data.get('parameters', {})
+            
+            # 状態変更を実行
+            self.state_machine.change_state(state_name, **parameters)
+            self.logger.info(f"コマンドで状態変更: {state_name}")
+            
+        elif command == 'set_parameter':
+            parameters = command_data.get('parameters', {})
+            # パラメータ設定を実行（現在の状態に応じて）
+            current_state = self.state_machine.get_current_state()
+            if current_state and hasattr(current_state, 'set_parameters'):
+                current_state.set_parameters(parameters)
+            self.logger.debug("パラメータ設定: %s", parameters)
+            
+        elif command == 'set_gaze_target':
+            # 視線ターゲットを設定（目の中心からのオフセット）
+            self.animation_controller.set_eye_target(
+                pygame.math.Vector2(command_data['x'], command_data['y'])
+            )
+            
+        elif command == 'lip_sync_sample':
+            # 発話中状態のリップシンク強度を直接駆動
+            current_state = self.state_machine.get_current_state()
+            if current_state and hasattr(current_state, 'set_live_lip_intensity'):
+                current_state.set_live_lip_intensity(command_data['intensity'])
+            
+        elif command == 'batch':
+            # バッチ内のコマンドを受信順に同じフレームで適用
+            for sub_command in command_data.get('commands', []):
+                self.apply_command(sub_command)
+            
+        elif command == 'shutdown':
+            self.logger.info("シャットダウンコマンドを受信しました")
+            self.running = False
+    
+    def apply_pending_commands(self) -> list:
+        """フレーム境界で保留中のコマンドを受信順に適用
+        
+        Returns:
+            適用したコマンドの受信時刻（perf_counter）のリスト
+        """
+        if self.command_queue is not None:
+            # スレッドモード: サーバースレッドが追加したコマンドを取り出す
+            self.pending_commands.extend(self.command_queue.drain())
+        
+        if not self.pending_commands:
+            return []
+        
+        commands = self.pending_commands
+        self.pending_commands = []
+        command_list = [command_data for command_data, _ in commands]
+        if self.command_coalescer:
+            # 同じフレーム内で上書きされるコマンドは適用しない
+            command_list = self.command_coalescer.coalesce(
+                command_list, self.state_machine.current_state_name
+            )
+        for command_data in command_list:
+            self.apply_command(command_data)
+        return [received_at for _, received_at in commands]
+    
+    def apply_live_samples(self):
+        """UDPで受信した最新の視線・リップシンク強度サンプルを適用"""
+        live_samples = self.command_interface.live_samples
+        
+        gaze = live_samples.take(live_samples.GAZE)
+        if gaze is not None:
+            self.animation_controller.set_eye_target(pygame.math.Vector2(gaze))
+        
+        lip_intensity = live_samples.take(live_samples.LIP)
+        if lip_intensity is not None:
+            current_state = self.state_machine.get_current_state()
+            if current_state and hasattr(current_state, 'set_live_lip_intensity'):
+                current_state.set_live_lip_intensity(lip_intensity)
+    
+    def record_command_latency(self, received_times: list):
+        """適用したコマンドの受信から画面反映までの時間を記録"""
+        if not received_times:
+            return
+        presented_at = time.perf_counter()
+        for received_at in received_times:
+            self.command_latency.add((presented_at - received_at) * 1000.0)
+    
+    def record_frame_telemetry(self, frame_start: float):
+        """フレームの処理時間を記録し、1秒ごとにテレメトリを通知
+        
+        Args:
+            frame_start: フレーム処理の開始時刻（perf_counter）
+        """
+        now = time.perf_counter()
+        self.frame_times.add((now - frame_start) * 1000.0)
+        self.telemetry_frames += 1
+        
+        elapsed = now - self.telemetry_started_at
+        if elapsed < 1.0:
+            return
+        
+        frame_times = self.frame_times.summary()
+        self.command_interface.publish('telemetry', {
+            'fps': round(self.telemetry_frames / elapsed, 1),
+            'target_fps': self.frame_scheduler.target_fps,
+            'frame_time_ms': {
+                key: round(frame_times[key], 2) for key in ('p50', 'p95', 'p99', 'max')
+            },
+            'queue_depth': len(self.command_queue) if self.command_queue is not None else len(self.pending_commands),
+            'coalesced_commands': self.command_coalescer.coalesced_count if self.command_coalescer else 0
+        })
+        self.command_interface.set_metrics(self.profiler.get_metrics() if self.profiler else None)
+        self.frame_times.clear()
+        self.telemetry_frames = 0
+        self.telemetry_started_at = now
+    
     def handle_events(self):
         """イベント処理"""
         for event in pygame.event.get():
             # 終了イベント
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # ウィンドウが再露出した場合は画面全体を再描画
+                self.invalidate_display()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 elif event.key == pygame.K_F11:
                     # フルスクリーン切り替え
                     pygame.display.toggle_fullscreen()
+                    self.invalidate_display()
                 elif event.key == pygame.K_1:
                     # アイドル状態に切り替え
                     self.state_machine.change_state("idle")
@@ -199,10 +391,13 @@ class RobotFaceApp:
                     # 現在の状態をリセットしてアイドルに戻る
                     current_state = self.state_machine.current_state_name
                     self.state_machine.change_state("idle")
-                    print(f"状態をリセットしました: {current_state} -> idle")
+                    self.logger.info(f"状態をリセットしました: {current_state} -> idle")
                 elif event.key == pygame.K_SPACE:
                     # 強制まばたき（全状態で共通）
                     self.animation_controller.force_blink()
+                elif event.key == pygame.K_F3:
+                    # 計測結果のオーバーレイを切り替え
+                    self.toggle_profiler_overlay()
             
             # 現在の状態にイベントを転送
             self.state_machine.handle_event(event)
@@ -214,33 +409,126 @@ class RobotFaceApp:
             dt: デルタタイム（秒）
         """
         # 共通のアニメーション更新
-        current_time = pygame.time.get_ticks()
+        current_time = frame_clock.now
         self.animation_controller.update(current_time)
         self.border_renderer.update(dt)
         
         # 状態固有の更新
         self.state_machine.update(dt)
+        
+        # 次フレームの目標フレームレートを選択（休止状態では目のアニメーションは描画されない）
+        eyes_animating = (self.state_machine.current_state_name != "sleeping" and
+                          self.animation_controller.is_animating())
+        self.frame_scheduler.update(
+            current_time,
+            self.state_machine.get_target_fps(),
+            eyes_animating
+        )
+    
+    def toggle_profiler_overlay(self):
+        """計測結果のオーバーレイの表示を切り替え
+        
+        表示中は計測を行い、非表示に戻したときはprofiling.enabledが無効なら計測も止める。
+        """
+        if self.profiler_overlay:
+            self.profiler_overlay = None
+            if not self.profiling_config['enabled']:
+                self.profiler = None
+        else:
+            if self.profiler is None:
+                self.profiler = FrameProfiler(self.profiling_config['window'])
+            self.profiler_overlay = ProfilerOverlay(self.profiling_config['overlay_interval_ms'])
+        self.invalidate_display()
+    
+    def draw_profiler_overlay(self) -> Optional[pygame.Rect]:
+        """計測結果のオーバーレイを描画
+        
+        Returns:
+            描画した領域
+        """
+        self.profiler_overlay.update(self.profiler, frame_clock.now, self.frame_scheduler.frame_budget_ms)
+        return self.profiler_overlay.draw(self.screen)
+    
+    def invalidate_display(self):
+        """次のフレームで画面全体を再描画する"""
+        if self.dirty_rect_tracker:
+            self.dirty_rect_tracker.invalidate()
+        if self.frame_change_detector:
+            self.frame_change_detector.invalidate()
     
     def render(self):
         """描画処理"""
+        if self.dirty_rect_tracker:
+            self.render_dirty_rects()
+            return
+        
         # 背景をクリア
         self.screen.fill(self.color_config['black'])
         
         # 共通の目の描画
         self.render_eyes()
+        if self.profiler:
+            self.profiler.mark('eyes')
         
         # 状態固有のオーバーレイ描画
         self.state_machine.render(self.screen)
+        if self.profiler:
+            self.profiler.mark('overlay')
+        
+        if self.profiler_overlay:
+            self.draw_profiler_overlay()
+            self.profiler.mark('profiler')
         
         pygame.display.flip()
+        if self.profiler:
+            self.profiler.mark('present')
     
-    def render_eyes(self):
-        """共通の目の描画"""
-        current_time = pygame.time.get_ticks()
-        current_state_name = self.state_machine.current_state_name
+    def render_dirty_rects(self):
+        """差分描画処理（前フレームと現フレームの描画領域のみを更新）"""
+        tracker = self.dirty_rect_tracker
+        background = self.color_config['black']
+        
+        # 前フレームの描画領域をクリア（全体再描画時は画面全体）
+        if tracker.full_redraw:
+            self.screen.fill(background)
+        else:
+            for rect in tracker.get_clear_rects():
+                self.screen.fill(background, rect)
         
+        # 共通の目の描画
+        tracker.add_all(self.render_eyes())
+        if self.profiler:
+            self.profiler.mark('eyes')
+        
+        # 状態固有のオーバーレイ描画
+        self.state_machine.render(self.screen)
+        tracker.add_all(self.state_machine.get_overlay_rects())
+        if self.profiler:
+            self.profiler.mark('overlay')
+        
+        if self.profiler_overlay:
+            tracker.add(self.draw_profiler_overlay())
+            self.profiler.mark('profiler')
+        
+        update_rects = tracker.end_frame()
+        if update_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(update_rects)
+        if self.profiler:
+            self.profiler.mark('present')
+    
+    def get_eye_render_inputs(self, current_time: int) -> tuple:
+        """目の描画入力を取得
+        
+        Args:
+            current_time: 現在時刻（ミリ秒）
+            
+        Returns:
+            (目のオフセット, まばたき比率) 休止状態ではまばたき比率はNone
+        """
         # 休止状態の場合は円弧を描画
-        if current_state_name == "sleeping":
+        if self.state_machine.current_state_name == "sleeping":
             # 休止状態の場合、呼吸アニメーションのオフセットを取得
             current_state = self.state_machine.get_current_state()
             breathing_offset = 0
@@ -248,10 +536,71 @@ class RobotFaceApp:
                 breathing_offset = current_state.get_breathing_offset()
             
             # 目のオフセット（休止状態では視線移動なし）
-            eye_offset = pygame.math.Vector2(0, breathing_offset)
-            
+            return pygame.math.Vector2(0, breathing_offset), None
+        
+        animation_state = self.animation_controller.get_animation_state(current_time)
+        return animation_state['eye_offset'], animation_state['blink_ratio']
+    
+    def get_render_signature(self) -> tuple:
+        """描画入力を画素単位に量子化した値を取得（変化検出用）"""
+        eye_offset, blink_ratio = self.get_eye_render_inputs(frame_clock.now)
+        
+        # 描画時と同じく整数化した目の中心座標
+        eye_centers = tuple(
+            (int(center[0] + eye_offset.x), int(center[1] + eye_offset.y))
+            for center in (self.left_eye_center, self.right_eye_center)
+        )
+        
+        # 計測結果のオーバーレイは更新間隔ごとに描き直す
+        overlay_period = None
+        if self.profiler_overlay:
+            overlay_period = frame_clock.now // self.profiler_overlay.interval_ms
+        
+        return (
+            self.state_machine.current_state_name,
+            eye_centers,
+            blink_ratio,
+            self.eye_renderer.texture_revision,
+            self.state_machine.get_render_signature(),
+            overlay_period
+        )
+    
+    def render_if_changed(self) -> bool:
+        """描画入力が前回表示したフレームから変化した場合のみ描画
+        
+        Returns:
+            描画したかどうか
+        """
+        if self.frame_change_detector:
+            if not self.frame_change_detector.should_render(self.get_render_signature()):
+                return False
+        
+        self.render()
+        if self.full_quality_at is None:
+            self.record_startup_timing()
+        return True
+    
+    def record_startup_timing(self):
+        """起動から最初のフレーム、全テクスチャで描画した最初のフレームまでの時間を記録"""
+        now = time.perf_counter()
+        if self.first_frame_at is None:
+            self.first_frame_at = now
+            self.logger.info(f"最初のフレームまで: {(now - self.started_at) * 1000:.0f}ms")
+        if not self.eye_renderer.warming_up:
+            self.full_quality_at = now
+            self.logger.info(f"全テクスチャでの描画まで: {(now - self.started_at) * 1000:.0f}ms")
+    
+    def render_eyes(self) -> list:
+        """共通の目の描画
+        
+        Returns:
+            描画した領域のリスト
+        """
+        eye_offset, blink_ratio = self.get_eye_render_inputs(frame_clock.now)
+        
+        if blink_ratio is None:
             # 両目を円弧で描画
-            self.eye_renderer.draw_sleeping_eye(
+            left_rect = self.eye_renderer.draw_sleeping_eye(
                 self.screen,
                 self.left_eye_center,
                 eye_offset,
@@ -259,7 +608,7 @@ class RobotFaceApp:
                 self.eye_config['height']
             )
             
-            self.eye_renderer.draw_sleeping_eye(
+            right_rect = self.eye_renderer.draw_sleeping_eye(
                 self.screen,
                 self.right_eye_center,
                 eye_offset,
@@ -268,13 +617,7 @@ class RobotFaceApp:
             )
         else:
             # 通常の楕円形の目を描画
-            animation_state = self.animation_controller.get_animation_state(current_time)
-            
-            eye_offset = animation_state['eye_offset']
-            blink_ratio = animation_state['blink_ratio']
-            
-            # 両目を描画
-            self.eye_renderer.draw_eye(
+            left_rect = self.eye_renderer.draw_eye(
                 self.screen,
                 self.left_eye_center,
                 eye_offset,
@@ -283,7 +626,7 @@ class RobotFaceApp:
                 blink_ratio
             )
             
-            self.eye_renderer.draw_eye(
+            right_rect = self.eye_renderer.draw_eye(
                 self.screen,
                 self.right_eye_center,
                 eye_offset,
@@ -291,10 +634,20 @@ class RobotFaceApp:
                 self.eye_config['height'],
                 blink_ratio
             )
+        
+        return [left_rect, right_rect]
     
     def run(self):
         """メインループ"""
-        if self.command_interface:
+        if self.command_queue is not None:
+            # コマンドサーバーを専用スレッドで実行し、描画はメインスレッドで行う
+            self.command_interface.start_server_thread(self.command_queue)
+            try:
+                self._run_game_loop()
+            finally:
+                self.command_interface.stop_server_thread()
+                self.cleanup()
+        elif self.command_interface:
             # asyncioでコマンドサーバーと同時実行
             import asyncio
             asyncio.run(self._run_with_command_interface())
@@ -333,54 +686,142 @@ class RobotFaceApp:
             self.cleanup()
     
     async def _run_async_game_loop(self):
-        """非同期ゲームループ"""
+        """非同期ゲームループ
+        
+        フレームの残り時間はイベントループ上で待機するため、その間に届いたコマンドは
+        即座に解析され、次のフレーム境界でまとめて適用される。
+        """
         print("アプリケーションを開始します...")
         
-        last_time = pygame.time.get_ticks()
+        frame_clock.reset()
+        next_frame_time = time.perf_counter()
         
         while self.running:
-            # デルタタイムを計算
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # 秒に変換
-            last_time = current_time
-            
-            # 処理
-            self.handle_events()
-            self.update(dt)
-            self.render()
-            
-            # フレームレート制御
-            self.clock.tick(self.fps)
+            frame_start = time.perf_counter()
+            applied_commands = self.run_frame()
+            self.record_command_latency(applied_commands)
+            if self.command_interface:
+                self.record_frame_telemetry(frame_start)
             
-            # 短時間の非同期待機（他のタスクに制御を譲る）
-            await asyncio.sleep(0.001)
+            # フレームレート制御（残り時間をイベントループ上で待機）
+            next_frame_time += self.frame_scheduler.frame_budget_ms / 1000.0
+            now = time.perf_counter()
+            if next_frame_time < now:
+                # 処理が予算を超えた場合は遅れを持ち越さない
+                next_frame_time = now
+            await asyncio.sleep(next_frame_time - now)
     
     def _run_game_loop(self):
         """通常のゲームループ"""
         print("アプリケーションを開始します...")
         
-        last_time = pygame.time.get_ticks()
+        frame_clock.reset()
         
         while self.running:
-            # デルタタイムを計算
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # 秒に変換
-            last_time = current_time
-            
-            # 処理
-            self.handle_events()
-            self.update(dt)
-            self.render()
+            frame_start = time.perf_counter()
+            applied_commands = self.run_frame()
+            self.record_command_latency(applied_commands)
+            if self.command_interface:
+                self.record_frame_telemetry(frame_start)
             
             # フレームレート制御
-            self.clock.tick(self.fps)
+            self.clock.tick(self.frame_scheduler.target_fps)
+    
+    def run_headless(self, frames: int, virtual_time: bool = False):
+        """ヘッドレスで指定フレーム数を待機なしで描画し、計測結果を表示
+        
+        Args:
+            frames: 描画するフレーム数
+            virtual_time: Trueの場合は実時間ではなく、フレームごとに目標フレームレートの
+                          間隔だけ進む仮想時刻でアニメーションを進める（実時間より速いシミュレーション）
+        """
+        print(f"ヘッドレスで{frames}フレームを描画します...")
+        
+        virtual_clock = None
+        if virtual_time:
+            virtual_clock = VirtualClock()
+            frame_clock.set_time_source(virtual_clock)
+        else:
+            frame_clock.reset()
+        
+        while self.running and self.profiler.frame_count < frames:
+            self.run_frame()
+            if virtual_clock:
+                virtual_clock.advance(1000.0 / self.frame_scheduler.target_fps)
+        
+        print(self.profiler.format_report())
+        self.cleanup()
+    
+    def run_frame(self) -> list:
+        """1フレームを処理（計測が有効な場合は段階ごとの時間を記録）
+        
+        Returns:
+            適用したコマンドの受信時刻（perf_counter）のリスト
+        """
+        # フレームの途中で計測が切り替わっても、このフレームは開始時の状態で扱う
+        profiler = self.profiler
+        if profiler:
+            profiler.begin_frame()
+        
+        # フレームの時刻を取得（このフレームの処理はすべてこの時刻を使う）
+        dt = frame_clock.tick()
+        
+        # フレーム境界で受信済みのコマンドとストリーミングサンプルを適用
+        applied_commands = self.apply_pending_commands()
+        if self.command_interface:
+            self.apply_live_samples()
+        
+        # 処理
+        self.handle_events()
+        if profiler:
+            profiler.mark('events')
+        self.update(dt)
+        if profiler:
+            profiler.mark('update')
+        self.render_if_changed()
+        if profiler:
+            profiler.end_frame()
+        return applied_commands
     
     def cleanup(self):
         """終了処理"""
         print("アプリケーションを終了します...")
+        if self.profiler and not self.headless:
+            print(self.profiler.format_report())
+        if self.frame_change_detector:
+            stats = self.frame_change_detector.get_stats()
+            print(f"描画フレーム: {stats['rendered_frames']}, "
+                  f"省略フレーム: {stats['skipped_frames']} ({stats['skip_ratio'] * 100:.1f}%)")
+        latency = self.command_latency.summary()
+        if latency['count']:
+            print(f"コマンド反映遅延: 平均 {latency['mean']:.1f}ms, p50 {latency['p50']:.1f}ms, "
+                  f"p95 {latency['p95']:.1f}ms, p99 {latency['p99']:.1f}ms, 最大 {latency['max']:.1f}ms "
+                  f"({latency['total_count']}件)")
+        if self.command_coalescer:
+            stats = self.command_coalescer.get_stats()
+            print(f"コマンド集約: {stats['received']}件中 {stats['coalesced']}件を省略 "
+                  f"({stats['coalesce_ratio'] * 100:.1f}%)")
         pygame.quit()
         sys.exit()
 
+def build_texture_cache(workers: int = 0):
+    """テクスチャキャッシュ（アトラス）を生成して保存（ウィンドウは開かない）
+    
+    既存のキャッシュがあっても作り直す。イメージのプロビジョニング時などに使用。
+    
+    Args:
+        workers: ワーカープロセス数（0はCPUコア数）
+    """
+    eye_config = config.get_eye_config()
+    eye_renderer = EyeRenderer()
+    eye_renderer.build_workers = workers
+    start = time.perf_counter()
+    eye_renderer.build_atlas(eye_config['width'], eye_config['height'])
+    print(f"テクスチャキャッシュを生成しました（{(time.perf_counter() - start) * 1000:.0f}ms）")
+
+# --headlessで描画する既定のフレーム数
+HEADLESS_FRAMES = 600
+
 def main():
     """メイン関数"""
     import argparse
@@ -389,9 +830,32 @@ def main():
     parser = argparse.ArgumentParser(description='ロボット顔表示システム')
     parser.add_argument('--no-server', action='store_true', 
                        help='コマンドインターフェースを無効化')
+    parser.add_argument('--build-cache', action='store_true',
+                       help='テクスチャキャッシュを生成して終了')
+    parser.add_argument('--workers', type=int, default=0,
+                       help='--build-cacheで使うワーカープロセス数（0: CPUコア数）')
+    parser.add_argument('--headless', action='store_true',
+                       help='ウィンドウを開かずに待機なしで描画し、FPSと段階ごとの処理時間を表示して終了'
+                            '（コマンドインターフェースは無効）')
+    parser.add_argument('--frames', type=int, default=HEADLESS_FRAMES,
+                       help=f'--headlessで描画するフレーム数（既定: {HEADLESS_FRAMES}）')
+    parser.add_argument('--virtual-time', action='store_true',
+                       help='--headlessで実時間の代わりに仮想時刻を使い、1フレームごとに'
+                            '目標フレームレートの間隔だけアニメーションを進める')
     args = parser.parse_args()
     
+    setup_logging(config.get_logging_config())
+    
+    if args.build_cache:
+        build_texture_cache(args.workers)
+        return
+    
     try:
+        if args.headless:
+            app = RobotFaceApp(enable_command_interface=False, headless=True)
+            app.run_headless(args.frames, args.virtual_time)
+            return
+        
         # コマンドインターフェースの有効/無効を設定
         enable_command_interface = not args.no_server
         app = RobotFaceApp(enable_command_interface=enable_command_interface)
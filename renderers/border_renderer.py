@@ -54,6 +54,29 @@ class BorderRenderer:
             self.screen_height - margin * 2
         )
     
+    def get_border_strip_rects(self, border_width: int = None, margin: int = None) -> List[pygame.Rect]:
+        """外枠が描画される帯状の領域（上下左右）を取得
+        
+        Args:
+            border_width: 枠の太さ
+            margin: 画面端からのマージン
+            
+        Returns:
+            上・下・左・右の矩形のリスト
+        """
+        if border_width is None:
+            border_width = self.default_border_width
+            
+        border_rect = self.get_border_rect(margin)
+        width = min(border_width, border_rect.width, border_rect.height)
+        
+        return [
+            pygame.Rect(border_rect.left, border_rect.top, border_rect.width, width),
+            pygame.Rect(border_rect.left, border_rect.bottom - width, border_rect.width, width),
+            pygame.Rect(border_rect.left, border_rect.top, width, border_rect.height),
+            pygame.Rect(border_rect.right - width, border_rect.top, width, border_rect.height)
+        ]
+    
     def draw_solid_border(self, surface: pygame.Surface, color: Tuple[int, int, int], 
                          border_width: int = None, margin: int = None):
         """単色の外枠を描画
@@ -70,21 +93,17 @@ class BorderRenderer:
         border_rect = self.get_border_rect(margin)
         pygame.draw.rect(surface, color, border_rect, border_width)
     
-    def draw_blinking_border(self, surface: pygame.Surface, color: Tuple[int, int, int],
-                           blink_speed: float = 1.0, border_width: int = None, 
-                           margin: int = None):
-        """点滅する外枠を描画
+    def get_blinking_color(self, color: Tuple[int, int, int],
+                           blink_speed: float = 1.0) -> Tuple[int, int, int]:
+        """点滅する外枠の現在の色を計算
         
         Args:
-            surface: 描画対象のサーフェス
             color: 基本色
             blink_speed: 点滅速度（倍率）
-            border_width: 枠の太さ
-            margin: 画面端からのマージン
-        """
-        if border_width is None:
-            border_width = self.default_border_width
             
+        Returns:
+            現在の描画色
+        """
         # 点滅のアルファ値を計算
         blink_phase = self.animation_time * blink_speed * 4.0  # 4倍速で点滅
         alpha_ratio = (math.sin(blink_phase) + 1.0) / 2.0  # 0.0 - 1.0
@@ -95,12 +114,28 @@ class BorderRenderer:
         max_alpha = 1.0
         alpha = lerp(min_alpha, max_alpha, alpha_ratio)
         
-        blinking_color = (
+        return (
             int(color[0] * alpha),
             int(color[1] * alpha),
             int(color[2] * alpha)
         )
+    
+    def draw_blinking_border(self, surface: pygame.Surface, color: Tuple[int, int, int],
+                           blink_speed: float = 1.0, border_width: int = None, 
+                           margin: int = None):
+        """点滅する外枠を描画
         
+        Args:
+            surface: 描画対象のサーフェス
+            color: 基本色
+            blink_speed: 点滅速度（倍率）
+            border_width: 枠の太さ
+            margin: 画面端からのマージン
+        """
+        if border_width is None:
+            border_width = self.default_border_width
+            
+        blinking_color = self.get_blinking_color(color, blink_speed)
         self.draw_solid_border(surface, blinking_color, border_width, margin)
     
     def draw_rainbow_border(self, surface: pygame.Surface, speed: float = 1.0,
@@ -129,17 +164,17 @@ class BorderRenderer:
         
         pygame.draw.rect(surface, color, border_rect, border_width)
     
-    def draw_pulsing_border(self, surface: pygame.Surface, color: Tuple[int, int, int],
-                          pulse_speed: float = 1.0, border_width: int = None,
-                          margin: int = None):
-        """パルス（呼吸）する外枠を描画
+    def get_pulsing_style(self, color: Tuple[int, int, int], pulse_speed: float = 1.0,
+                          border_width: int = None) -> Tuple[Tuple[int, int, int], int]:
+        """パルス（呼吸）する外枠の現在の色と太さを計算
         
         Args:
-            surface: 描画対象のサーフェス
             color: 基本色
             pulse_speed: パルス速度
             border_width: 基本の枠の太さ
-            margin: 画面端からのマージン
+            
+        Returns:
+            (描画色, 枠の太さ)
         """
         if border_width is None:
             border_width = self.default_border_width
@@ -164,6 +199,21 @@ class BorderRenderer:
             int(color[2] * intensity)
         )
         
+        return pulsing_color, current_width
+    
+    def draw_pulsing_border(self, surface: pygame.Surface, color: Tuple[int, int, int],
+                          pulse_speed: float = 1.0, border_width: int = None,
+                          margin: int = None):
+        """パルス（呼吸）する外枠を描画
+        
+        Args:
+            surface: 描画対象のサーフェス
+            color: 基本色
+            pulse_speed: パルス速度
+            border_width: 基本の枠の太さ
+            margin: 画面端からのマージン
+        """
+        pulsing_color, current_width = self.get_pulsing_style(color, pulse_speed, border_width)
         self.draw_solid_border(surface, pulsing_color, current_width, margin)
     
     def draw_gradient_border(self, surface: pygame.Surface, 
@@ -209,20 +259,15 @@ class BorderRenderer:
             if current_rect.width > 0 and current_rect.height > 0:
                 pygame.draw.rect(surface, color, current_rect, 1)
     
-    def draw_animated_thinking_border(self, surface: pygame.Surface, 
-                                    speed: float = 1.0, border_width: int = None,
-                                    margin: int = None):
-        """思考中状態用のアニメーション外枠（ランダム色切り替え）
+    def get_thinking_color(self, speed: float = 1.0) -> Tuple[int, int, int]:
+        """思考中状態用の外枠の現在の色を取得（ランダム色切り替え）
         
         Args:
-            surface: 描画対象のサーフェス
             speed: アニメーション速度
-            border_width: 枠の太さ
-            margin: 画面端からのマージン
-        """
-        if border_width is None:
-            border_width = self.default_border_width
             
+        Returns:
+            現在の基本色
+        """
         # ランダムな色のリスト（明るい色を追加）
         thinking_colors = [
             (100, 200, 255),  # 薄い青
@@ -241,12 +286,35 @@ class BorderRenderer:
         color_switch_interval = 0.01 / speed  # 色切り替え間隔（秒）
         time_index = int(self.animation_time / color_switch_interval)
         
-        # 時間インデックスをシードとして使用して、一貫したランダム性を確保
-        random.seed(time_index)
-        current_color = random.choice(thinking_colors)
+        # 時間インデックスをシードにした専用の乱数生成器で選ぶ（同じ時刻なら同じ色になり、
+        # グローバルな乱数の状態には影響しない）
+        return random.Random(time_index).choice(thinking_colors)
+    
+    def get_thinking_style(self, speed: float = 1.0,
+                           border_width: int = None) -> Tuple[Tuple[int, int, int], int]:
+        """思考中状態用の外枠の現在の色と太さを計算
         
-        # シードをリセット（他の処理に影響しないように）
-        random.seed()
+        Args:
+            speed: アニメーション速度
+            border_width: 枠の太さ
+            
+        Returns:
+            (描画色, 枠の太さ)
+        """
+        current_color = self.get_thinking_color(speed)
+        return self.get_pulsing_style(current_color, speed * 0.7, border_width)
+    
+    def draw_animated_thinking_border(self, surface: pygame.Surface, 
+                                    speed: float = 1.0, border_width: int = None,
+                                    margin: int = None):
+        """思考中状態用のアニメーション外枠（ランダム色切り替え）
         
+        Args:
+            surface: 描画対象のサーフェス
+            speed: アニメーション速度
+            border_width: 枠の太さ
+            margin: 画面端からのマージン
+        """
         # パルス効果と組み合わせ
-        self.draw_pulsing_border(surface, current_color, speed * 0.7, border_width, margin)
\ No newline at end of file
+        color, current_width = self.get_thinking_style(speed, border_width)
+        self.draw_solid_border(surface, color, current_width, margin)
\ No newline at end of file
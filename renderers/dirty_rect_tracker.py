@@ -0,0 +1,57 @@
+import pygame
+from typing import List, Optional, Iterable
+
+class DirtyRectTracker:
+    """差分描画用に前フレームと現フレームの描画領域を追跡するクラス
+
+    画面上の描画はすべて追跡された領域内に収まるため、前フレームの領域を
+    背景色でクリアすれば画面全体が背景色に戻る。その上で現フレームを描画し、
+    前フレームと現フレームの領域だけをディスプレイに転送する。
+    """
+
+    def __init__(self, screen_rect: pygame.Rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.previous_rects: List[pygame.Rect] = []
+        self.current_rects: List[pygame.Rect] = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        """次のフレームで画面全体を再描画する（初回・ウィンドウ露出・画面切り替え時）"""
+        self.full_redraw = True
+
+    def get_clear_rects(self) -> List[pygame.Rect]:
+        """フレーム開始時にクリアすべき領域（前フレームの描画領域）を取得"""
+        return self.previous_rects
+
+    def add(self, rect: Optional[pygame.Rect]):
+        """現フレームの描画領域を追加
+
+        Args:
+            rect: 描画した矩形（Noneや空の矩形は無視）
+        """
+        if rect is None:
+            return
+        clipped = self.screen_rect.clip(rect)
+        if clipped.width > 0 and clipped.height > 0:
+            self.current_rects.append(clipped)
+
+    def add_all(self, rects: Iterable[Optional[pygame.Rect]]):
+        """複数の描画領域を追加"""
+        for rect in rects:
+            self.add(rect)
+
+    def end_frame(self) -> Optional[List[pygame.Rect]]:
+        """フレームを終了し、ディスプレイに転送すべき領域を取得
+
+        Returns:
+            転送する矩形のリスト（画面全体を転送すべき場合はNone）
+        """
+        if self.full_redraw:
+            update_rects = None
+            self.full_redraw = False
+        else:
+            update_rects = self.previous_rects + self.current_rects
+
+        self.previous_rects = self.current_rects
+        self.current_rects = []
+        return update_rects
@@ -1,53 +1,109 @@
 import pygame
-import os
+import logging
+import math
 import colorsys
-from typing import Dict, Tuple
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple, Optional
 from utils.config import config
 from utils.constants import BLINK_PRESETS
+from utils.logger import SampledLogger
+from renderers.texture_atlas import TextureAtlas
+from renderers.texture_builder import build_textures
+from renderers.texture_cache import TextureCache
+
+try:
+    import numpy as np
+except ImportError:  # numpyが無い環境では従来の生成方式のみ利用可能
+    np = None
 
 class EyeRenderer:
     """目の描画を担当するレンダラー"""
     
     def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.frame_logger = SampledLogger(__name__)  # 毎フレーム通る処理用
         self.glow_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        self.atlas: Optional[TextureAtlas] = None  # 事前生成した全テクスチャ（preload_all_texturesで作成）
+        self.blink_frames: OrderedDict = OrderedDict()  # プリセット間の高さのテクスチャ（LRU）
+        
+        # バックグラウンド読み込み（start_background_preload）
+        self.warming_up = False
+        self.warm_textures: Dict[str, pygame.Surface] = {}  # アトラス完成前に生成済みのテクスチャ
+        self.warmup_thread: Optional[threading.Thread] = None
+        self.texture_revision = 0  # テクスチャが差し替わるたびに増加（変化検出用）
         self.cache_config = config.get_cache_config()
         self.color_config = config.get_color_config()
-        self.ensure_cache_dir()
-        
-    def ensure_cache_dir(self):
-        """キャッシュディレクトリを確保"""
-        cache_dir = self.cache_config['directory']
-        if not os.path.exists(cache_dir):
-            os.makedirs(cache_dir)
+        self.rendering_config = config.get_rendering_config()
+        self.glow_generator = self.rendering_config['glow_generator']
+        self.blink_frame_cache_size = self.rendering_config['blink_frame_cache_size']
+        self.build_workers = self.rendering_config['build_workers']
+        if self.glow_generator == 'vectorized' and np is None:
+            self.logger.warning("numpyが見つからないため、従来のグロー生成方式を使用します")
+            self.glow_generator = 'legacy'
+        self.texture_cache = TextureCache(
+            self.cache_config['directory'],
+            self.cache_config['max_size_mb'] * 1024 * 1024,
+            self.cache_config['format']
+        )
     
-    def get_cache_filename(self, width: int, height: int, blink_ratio: float) -> str:
-        """キャッシュファイル名を生成"""
-        closest_ratio = min(BLINK_PRESETS, key=lambda x: abs(x - blink_ratio))
-        cache_dir = self.cache_config['directory']
-        cache_version = self.cache_config['version']
-        return os.path.join(cache_dir, f"glow_{cache_version}_{width}x{height}_{int(closest_ratio*100)}.png")
-
-    def get_arc_cache_filename(self, cache_key: str) -> str:
-        """円弧用のキャッシュファイル名を生成"""
-        cache_dir = self.cache_config['directory']
-        cache_version = self.cache_config['version']
-        return os.path.join(cache_dir, f"{cache_version}_{cache_key}.png")
+    def get_glow_cache_params(self, width: int, height: int, blink_ratio: float) -> dict:
+        """グローテクスチャの画素に影響するパラメータ（キャッシュのキー）"""
+        return {
+            'texture': 'glow',
+            'version': self.cache_config['version'],
+            'generator': self.glow_generator,
+            'width': width,
+            'height': height,
+            'blink_ratio': blink_ratio,
+            'layers': self._get_eye_glow_layers()
+        }
+    
+    def get_arc_cache_params(self, width: int, height: int) -> dict:
+        """円弧テクスチャの画素に影響するパラメータ（キャッシュのキー）"""
+        return {
+            'texture': 'arc',
+            'version': self.cache_config['version'],
+            'width': width,
+            'height': height
+        }
     
-    def load_cached_texture(self, filename: str) -> pygame.Surface:
+    def get_atlas_cache_params(self, width: int, height: int) -> dict:
+        """アトラスの画素に影響するパラメータ（キャッシュのキー）"""
+        return {
+            'texture': 'atlas',
+            'version': self.cache_config['version'],
+            'generator': self.glow_generator,
+            'width': width,
+            'height': height,
+            'blink_presets': BLINK_PRESETS,
+            'layers': self._get_eye_glow_layers()
+        }
+    
+    def get_glow_key(self, width: int, current_height: int) -> str:
+        """グローテクスチャのキー（アトラス内の名前）"""
+        return f"glow_{width}x{current_height}"
+    
+    def get_arc_key(self, width: int, height: int) -> str:
+        """円弧テクスチャのキー（アトラス内の名前）"""
+        return f"arc_{width}_{height}_225_315"
+    
+    def load_cached_texture(self, prefix: str, params: dict) -> Optional[pygame.Surface]:
         """キャッシュされたテクスチャを読み込む"""
         try:
-            if os.path.exists(filename):
-                return pygame.image.load(filename).convert_alpha()
+            entry = self.texture_cache.load(prefix, params)
         except Exception as e:
-            print(f"キャッシュ読み込みエラー: {e}")
-        return None
+            self.logger.warning(f"キャッシュ読み込みエラー: {e}")
+            return None
+        return entry[0] if entry else None
     
-    def save_texture_cache(self, surface: pygame.Surface, filename: str):
+    def save_texture_cache(self, surface: pygame.Surface, prefix: str, params: dict):
         """テクスチャをキャッシュに保存"""
         try:
-            pygame.image.save(surface, filename)
+            self.texture_cache.save(prefix, params, surface)
         except Exception as e:
-            print(f"キャッシュ保存エラー: {e}")
+            self.logger.warning(f"キャッシュ保存エラー: {e}")
     
     def create_radial_gradient_surface(self, width: int, height: int, center_color: tuple, edge_color: tuple, steps: int = 20) -> pygame.Surface:
         """放射状グラデーションを持つサーフェスを作成"""
@@ -137,23 +193,42 @@ class EyeRenderer:
         return layers
     
     def create_glow_texture(self, width: int, height: int, blink_ratio: float = 1.0) -> pygame.Surface:
-        """新しいグローテクスチャを生成"""
-        current_height = int(height * blink_ratio)
+        """新しいグローテクスチャを生成（設定に応じて生成方式を切り替え）"""
+        if self.glow_generator == 'vectorized':
+            return self.create_glow_texture_vectorized(width, height, blink_ratio)
+        return self.create_glow_texture_legacy(width, height, blink_ratio)
+    
+    def _get_glow_geometry(self, width: int, height: int, blink_ratio: float) -> tuple:
+        """グローテクスチャの寸法を計算
         
-        # グロー用のサーフェスを作成
+        Returns:
+            (現在の高さ, グロー半径, テクスチャ幅, テクスチャ高さ)
+        """
+        current_height = int(height * blink_ratio)
         glow_radius = int(min(width, current_height) * 0.4)
         total_width = width + glow_radius * 2
         total_height = current_height + glow_radius * 2
+        return current_height, glow_radius, total_width, total_height
+    
+    def _get_eye_glow_layers(self) -> list:
+        """目のグローに使用するレイヤー定義を取得"""
+        return self.generate_glow_layers(
+            core_color=self.color_config['white'],
+            outer_color=self.color_config['cyan_glow'],
+            num_layers=8
+        )
+    
+    def create_glow_texture_legacy(self, width: int, height: int, blink_ratio: float = 1.0) -> pygame.Surface:
+        """レイヤーごとにサーフェスを合成してグローテクスチャを生成（従来方式）"""
+        current_height, glow_radius, total_width, total_height = self._get_glow_geometry(
+            width, height, blink_ratio
+        )
         
         # メインのグローサーフェス
         glow_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
         
         # 多層グローエフェクト
-        layers = self.generate_glow_layers(
-            core_color=self.color_config['white'],
-            outer_color=self.color_config['cyan_glow'],
-            num_layers=8
-        )
+        layers = self._get_eye_glow_layers()
         
         for size_ratio, alpha, color in layers:
             layer_width = int(width + glow_radius * 2 * size_ratio)
@@ -181,6 +256,54 @@ class EyeRenderer:
         
         return glow_surface
     
+    def create_glow_texture_vectorized(self, width: int, height: int, blink_ratio: float = 1.0) -> pygame.Surface:
+        """ピクセルグリッド上で解析的に計算してグローテクスチャを生成（numpy使用）
+        
+        従来方式ではcreate_radial_gradient_surfaceの最初のステップが不透明な楕円を描くため、
+        各レイヤーは実質的に単色・不透明な楕円として重ねられる。ここでは各ピクセルが
+        含まれる最も内側のレイヤーを全レイヤー分まとめて判定し、その色を書き込む。
+        従来方式との差は楕円の境界ピクセルでの隣接レイヤー1段分のみ。
+        """
+        current_height, glow_radius, total_width, total_height = self._get_glow_geometry(
+            width, height, blink_ratio
+        )
+        layers = self._get_eye_glow_layers()
+        
+        # レイヤーごとの楕円（外側から内側の順）
+        size_ratios = np.array([size_ratio for size_ratio, _, _ in layers])
+        layer_widths = (width + glow_radius * 2 * size_ratios).astype(int)
+        layer_heights = (current_height + glow_radius * 2 * size_ratios).astype(int)
+        valid = (layer_widths > 0) & (layer_heights > 0)
+        layer_widths = layer_widths[valid]
+        layer_heights = layer_heights[valid]
+        colors = [color for (_, _, color), ok in zip(layers, valid) if ok]
+        
+        # 楕円の中心と半径（形状: レイヤー x 1 x 1）
+        half_w = (layer_widths / 2.0)[:, None, None]
+        half_h = (layer_heights / 2.0)[:, None, None]
+        center_x = ((total_width - layer_widths) // 2)[:, None, None] + half_w
+        center_y = ((total_height - layer_heights) // 2)[:, None, None] + half_h
+        
+        # ピクセル中心座標（surfarrayに合わせて x, y の順）
+        xs = np.arange(total_width, dtype=np.float32)[None, :, None] + 0.5
+        ys = np.arange(total_height, dtype=np.float32)[None, None, :] + 0.5
+        
+        # 各ピクセルを含むレイヤー数 = 最も内側のレイヤー番号 + 1
+        inside = ((xs - center_x) / half_w) ** 2 + ((ys - center_y) / half_h) ** 2 <= 1.0
+        depth = inside.sum(axis=0)
+        
+        palette = np.array([(0, 0, 0)] + colors, dtype=np.uint8)
+        
+        glow_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
+        rgb = pygame.surfarray.pixels3d(glow_surface)
+        rgb[...] = palette[depth]
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(glow_surface)
+        alpha[...] = np.where(depth > 0, 255, 0).astype(np.uint8)
+        del alpha
+        
+        return glow_surface
+    
     def get_or_create_glow_texture(self, width: int, height: int, blink_ratio: float = 1.0) -> pygame.Surface:
         """グローテクスチャを取得またはキャッシュから生成"""
         # まばたき比率を最も近いプリセット値に丸める
@@ -188,104 +311,310 @@ class EyeRenderer:
         current_height = int(height * closest_ratio)
         cache_key = (width, current_height)
         
+        # アトラスをチェック
+        atlas_key = self.get_glow_key(width, current_height)
+        if self.atlas and atlas_key in self.atlas:
+            return self.atlas.get_texture(atlas_key)
+        
         # メモリキャッシュをチェック
         if cache_key in self.glow_cache:
             return self.glow_cache[cache_key]
         
         # ファイルキャッシュをチェック
-        cache_filename = self.get_cache_filename(width, height, closest_ratio)
-        cached_texture = self.load_cached_texture(cache_filename)
+        cache_params = self.get_glow_cache_params(width, height, closest_ratio)
+        cached_texture = self.load_cached_texture(atlas_key, cache_params)
         
         if cached_texture:
             self.glow_cache[cache_key] = cached_texture
             return cached_texture
         
         # 新規生成
-        print(f"グローテクスチャを生成中: {width}x{current_height}")
+        self.logger.info(f"グローテクスチャを生成中: {width}x{current_height}")
         glow_texture = self.create_glow_texture(width, height, closest_ratio)
         
         # ファイルに保存
-        self.save_texture_cache(glow_texture, cache_filename)
+        self.save_texture_cache(glow_texture, atlas_key, cache_params)
         
         # メモリキャッシュに保存
         self.glow_cache[cache_key] = glow_texture
         
         return glow_texture
     
-    def preload_all_textures(self, width: int, height: int):
-        """全てのテクスチャを事前読み込み"""
-        print("テクスチャを事前読み込み中...")
-        for ratio in BLINK_PRESETS:
-            self.get_or_create_glow_texture(width, height, ratio)
-        print("テクスチャの読み込み完了")
+    def preload_all_textures(self, width: int, height: int, blink_ratios: Optional[list] = None):
+        """全てのテクスチャを1枚のアトラスとして事前読み込み（完了まで待機）
+        
+        Args:
+            width: 目の幅
+            height: 目の高さ
+            blink_ratios: まばたき中に使う比率（プリセット間の高さのテクスチャも用意する）
+        """
+        self.logger.info("テクスチャを事前読み込み中...")
+        self._load_textures(width, height, blink_ratios)
+        self.logger.info("テクスチャの読み込み完了")
     
-    def draw_smooth_glow_ellipse(self, surface: pygame.Surface, center: tuple, width: int, height: int, blink_ratio: float = 1.0):
-        """滑らかなグローエフェクト付きの楕円を描画"""
-        current_height = int(height * blink_ratio)
+    def start_background_preload(self, width: int, height: int, blink_ratios: Optional[list] = None):
+        """テクスチャの事前読み込みをワーカースレッドで開始
+        
+        読み込みが終わるまでは、生成済みのテクスチャはそのまま使い、未完成のものは
+        簡易的な楕円・円弧で代用する。描画スレッドがテクスチャの生成を待つことはない。
+        """
+        self.logger.info("テクスチャをバックグラウンドで読み込み中...")
+        self.warming_up = True
+        self.warmup_thread = threading.Thread(
+            target=self._run_background_preload,
+            args=(width, height, blink_ratios),
+            name="TextureWarmup",
+            daemon=True
+        )
+        self.warmup_thread.start()
+    
+    def _run_background_preload(self, width: int, height: int, blink_ratios: Optional[list]):
+        """ワーカースレッドのエントリーポイント"""
+        start = time.perf_counter()
+        try:
+            self._load_textures(width, height, blink_ratios, publish=True)
+            self.logger.info(f"テクスチャの読み込み完了（{(time.perf_counter() - start) * 1000:.0f}ms）")
+        except Exception as e:
+            self.logger.error(f"テクスチャ読み込みエラー: {e}")
+        finally:
+            self.warm_textures = {}
+            self.warming_up = False
+    
+    def _load_textures(self, width: int, height: int, blink_ratios: Optional[list], publish: bool = False):
+        """アトラスとプリセット間の高さのテクスチャを用意し、参照の差し替えで反映する
         
-        if current_height <= 5:
-            return
+        Args:
+            publish: Trueの場合、アトラスの完成前でも生成したテクスチャから順にwarm_texturesで公開する
+        """
+        try:
+            atlas = TextureAtlas.load(self.texture_cache, f"atlas_{width}x{height}", self.get_atlas_cache_params(width, height))
+        except Exception as e:
+            self.logger.warning(f"キャッシュ読み込みエラー: {e}")
+            atlas = None
+        
+        if atlas is None or not all(key in atlas for key in self.get_atlas_keys(width, height)):
+            atlas = self.build_atlas(width, height, publish)
+        
+        # プリセット間の高さはアトラスから縮小して用意しておき、まばたき中の負荷を一定に保つ
+        blink_frames = OrderedDict()
+        for ratio in blink_ratios or []:
+            current_height = int(height * ratio)
+            if current_height <= 5 or self.get_glow_key(width, current_height) in atlas:
+                continue
+            source_ratio = self._get_source_ratio(height, current_height)
+            source = atlas.get_texture(self.get_glow_key(width, int(height * source_ratio)))
+            blink_frames[(width, current_height)] = self._derive_blink_frame(width, height, ratio, source)
+        
+        # 描画スレッドからは参照の差し替えとして一度に反映される
+        self.blink_frames = blink_frames
+        self.atlas = atlas
+        self.texture_revision += 1
+    
+    def build_atlas(self, width: int, height: int, publish: bool = False) -> TextureAtlas:
+        """アトラスの全テクスチャを生成してキャッシュに保存（起動時と--build-cacheで使用）
+        
+        各テクスチャの生成はbuild_workers個のワーカープロセスに分散する。
+        
+        Args:
+            publish: Trueの場合、完成したテクスチャから順にwarm_texturesで公開する
+        """
+        self.logger.info(f"テクスチャアトラスを生成中: {width}x{height}")
+        specs = self.get_atlas_texture_specs(width, height)
+        textures = {}
+        for key, texture in build_textures(self, specs, self.build_workers):
+            textures[key] = texture
+            if publish:
+                # 辞書ごと差し替え、描画スレッドが更新途中の辞書を参照しないようにする
+                self.warm_textures = {**self.warm_textures, key: texture}
+                self.texture_revision += 1
+        
+        # 完成順によらず同じ配置になるよう、定義順に並べてからまとめる
+        atlas = TextureAtlas.build({key: textures[key] for key, _, _ in specs})
+        try:
+            atlas.save(self.texture_cache, f"atlas_{width}x{height}", self.get_atlas_cache_params(width, height))
+        except Exception as e:
+            self.logger.warning(f"キャッシュ保存エラー: {e}")
+        return atlas
+    
+    def get_blink_frame(self, width: int, height: int, blink_ratio: float) -> pygame.Surface:
+        """プリセット間の高さのグローテクスチャを取得
         
-        # グローテクスチャを取得
-        glow_texture = self.get_or_create_glow_texture(width, height, blink_ratio)
+        1段階大きいプリセットのテクスチャを目標の寸法に縮小して作る（グローを生成する
+        よりはるかに安価）。作成したテクスチャは最大blink_frame_cache_size個までLRUで保持する。
+        """
+        current_height = int(height * blink_ratio)
+        cache_key = (width, current_height)
+        frame = self.blink_frames.get(cache_key)
+        if frame is not None:
+            self.blink_frames.move_to_end(cache_key)
+            return frame
+        
+        source_ratio = self._get_source_ratio(height, current_height)
+        source = self.get_or_create_glow_texture(width, height, source_ratio)
+        frame = self._derive_blink_frame(width, height, blink_ratio, source)
+        
+        self.blink_frames[cache_key] = frame
+        if len(self.blink_frames) > self.blink_frame_cache_size:
+            self.blink_frames.popitem(last=False)
+        return frame
+    
+    def _get_source_ratio(self, height: int, current_height: int) -> float:
+        """縮小元にするプリセット（目標の高さ以上で最も低いもの）を取得"""
+        return min(
+            (ratio for ratio in BLINK_PRESETS if int(height * ratio) >= current_height),
+            default=max(BLINK_PRESETS)
+        )
+    
+    def _derive_blink_frame(self, width: int, height: int, blink_ratio: float, source: pygame.Surface) -> pygame.Surface:
+        """プリセットのテクスチャを目標の高さのグロー寸法に縮小"""
+        _, _, total_width, total_height = self._get_glow_geometry(width, height, blink_ratio)
+        return pygame.transform.smoothscale(source, (total_width, total_height))
+    
+    def get_atlas_keys(self, width: int, height: int) -> list:
+        """アトラスに含めるテクスチャのキー一覧"""
+        return [key for key, _, _ in self.get_atlas_texture_specs(width, height)]
+    
+    def get_atlas_texture_specs(self, width: int, height: int) -> list:
+        """アトラスに含めるテクスチャの (キー, 生成メソッド名, 引数) の一覧
+        
+        ワーカープロセスに渡せるよう、生成関数ではなくメソッド名と引数で表す。
+        大きいもの（開いた目）から順に並べる。
+        """
+        specs = [
+            (self.get_glow_key(width, int(height * ratio)), 'create_glow_texture', (width, height, ratio))
+            for ratio in BLINK_PRESETS
+        ]
+        specs.append((self.get_arc_key(width, height), 'create_arc_glow_texture', (width, height)))
+        return specs
+    
+    def create_atlas_textures(self, width: int, height: int) -> Dict[str, pygame.Surface]:
+        """アトラスに含める全テクスチャを生成（まばたきの各段階と休止状態の円弧）"""
+        return dict(build_textures(self, self.get_atlas_texture_specs(width, height), self.build_workers))
+    
+    def _blit_centered(self, surface: pygame.Surface, center: tuple, atlas_key: str, get_texture, draw_placeholder) -> pygame.Rect:
+        """テクスチャを中心座標に加算合成で描画
+        
+        アトラスにあればアトラスの領域から直接描画し、なければget_texture()で取得した
+        個別のテクスチャを描画する。バックグラウンド読み込み中で未完成の場合は
+        draw_placeholder()で簡易描画する。
+        """
+        atlas = self.atlas
+        if atlas and atlas_key in atlas:
+            texture_width, texture_height = atlas.get_size(atlas_key)
+            dest = (center[0] - texture_width // 2, center[1] - texture_height // 2)
+            return atlas.blit(surface, atlas_key, dest, special_flags=pygame.BLEND_ADD)
+        
+        glow_texture = self.warm_textures.get(atlas_key)
+        if glow_texture is None:
+            if self.warming_up:
+                return draw_placeholder()
+            glow_texture = get_texture()
         
         # 描画位置を計算
         x = center[0] - glow_texture.get_width() // 2
         y = center[1] - glow_texture.get_height() // 2
         
         # メインサーフェスに描画
-        surface.blit(glow_texture, (x, y), special_flags=pygame.BLEND_ADD)
+        return surface.blit(glow_texture, (x, y), special_flags=pygame.BLEND_ADD)
     
-    def draw_eye(self, surface: pygame.Surface, center: tuple, offset: pygame.math.Vector2, width: int, height: int, blink_ratio: float = 1.0):
-        """片目を描画する関数"""
+    def _draw_placeholder_ellipse(self, surface: pygame.Surface, center: tuple, width: int, current_height: int) -> pygame.Rect:
+        """テクスチャの読み込み中に代用するグローなしの楕円を描画"""
+        rect = pygame.Rect(0, 0, width, current_height)
+        rect.center = center
+        pygame.draw.ellipse(surface, self.color_config['white'], rect)
+        return rect
+    
+    def _draw_placeholder_arc(self, surface: pygame.Surface, center: tuple, width: int, height: int) -> pygame.Rect:
+        """テクスチャの読み込み中に代用するグローなしの円弧を描画"""
+        circle_size = min(width, height)
+        rect = pygame.Rect(0, 0, circle_size, circle_size)
+        rect.center = center
+        line_thickness = max(3, int(height * 0.05))
+        pygame.draw.arc(surface, self.color_config['white'], rect, math.radians(15), math.radians(165), line_thickness)
+        return rect
+    
+    def draw_smooth_glow_ellipse(self, surface: pygame.Surface, center: tuple, width: int, height: int, blink_ratio: float = 1.0) -> Optional[pygame.Rect]:
+        """滑らかなグローエフェクト付きの楕円を描画
+        
+        Returns:
+            描画した領域（描画しなかった場合はNone）
+        """
+        current_height = int(height * blink_ratio)
+        
+        if current_height <= 5:
+            return None
+        
+        # プリセットの高さはアトラスから、それ以外は縮小したテクスチャで描画
+        return self._blit_centered(
+            surface, center,
+            self.get_glow_key(width, current_height),
+            lambda: self.get_blink_frame(width, height, blink_ratio),
+            lambda: self._draw_placeholder_ellipse(surface, center, width, current_height)
+        )
+    
+    def draw_eye(self, surface: pygame.Surface, center: tuple, offset: pygame.math.Vector2, width: int, height: int, blink_ratio: float = 1.0) -> Optional[pygame.Rect]:
+        """片目を描画する関数
+        
+        Returns:
+            描画した領域（描画しなかった場合はNone）
+        """
         eye_center = (int(center[0] + offset.x), int(center[1] + offset.y))
-        self.draw_smooth_glow_ellipse(surface, eye_center, width, height, blink_ratio)
+        return self.draw_smooth_glow_ellipse(surface, eye_center, width, height, blink_ratio)
 
-    def draw_sleeping_eye(self, surface: pygame.Surface, center: tuple, offset: pygame.math.Vector2, width: int, height: int):
-        """休止状態の目（円弧）を描画する関数"""
-        print(f"DEBUG: draw_sleeping_eye called with width={width}, height={height}")
+    def draw_sleeping_eye(self, surface: pygame.Surface, center: tuple, offset: pygame.math.Vector2, width: int, height: int) -> pygame.Rect:
+        """休止状態の目（円弧）を描画する関数
+        
+        Returns:
+            描画した領域
+        """
+        self.frame_logger.debug("draw_sleeping_eye", "draw_sleeping_eye: width=%d, height=%d", width, height)
         eye_center = (int(center[0] + offset.x), int(center[1] + offset.y))
-        self.draw_smooth_glow_arc(surface, eye_center, width, height)
+        return self.draw_smooth_glow_arc(surface, eye_center, width, height)
     
-    def draw_smooth_glow_arc(self, surface: pygame.Surface, center: tuple, width: int, height: int):
-        """滑らかなグローエフェクト付きの円弧を描画"""
-        print(f"DEBUG: draw_smooth_glow_arc called with center={center}, width={width}, height={height}")
-        # 円弧用のグローテクスチャを取得
-        glow_texture = self.get_or_create_arc_glow_texture(width, height)
-        
-        # 描画位置を計算
-        x = center[0] - glow_texture.get_width() // 2
-        y = center[1] - glow_texture.get_height() // 2
-        
-        # メインサーフェスに描画
-        surface.blit(glow_texture, (x, y), special_flags=pygame.BLEND_ADD)
+    def draw_smooth_glow_arc(self, surface: pygame.Surface, center: tuple, width: int, height: int) -> pygame.Rect:
+        """滑らかなグローエフェクト付きの円弧を描画
+        
+        Returns:
+            描画した領域
+        """
+        self.frame_logger.debug("draw_smooth_glow_arc", "draw_smooth_glow_arc: center=%s, width=%d, height=%d", center, width, height)
+        # 円弧用のグローテクスチャを描画
+        return self._blit_centered(
+            surface, center,
+            self.get_arc_key(width, height),
+            lambda: self.get_or_create_arc_glow_texture(width, height),
+            lambda: self._draw_placeholder_arc(surface, center, width, height)
+        )
     
     def get_or_create_arc_glow_texture(self, width: int, height: int):
         """円弧用のグローテクスチャを取得または作成"""
         # キャッシュキーを生成（円弧用）
-        cache_key = f"arc_{width}_{height}_225_315"
-        print(f"DEBUG: get_or_create_arc_glow_texture cache_key={cache_key}")
+        cache_key = self.get_arc_key(width, height)
+        self.frame_logger.debug("get_or_create_arc_glow_texture", "get_or_create_arc_glow_texture: cache_key=%s", cache_key)
+        
+        # アトラスから取得を試みる
+        if self.atlas and cache_key in self.atlas:
+            return self.atlas.get_texture(cache_key)
         
         # キャッシュから取得を試みる
         if cache_key in self.glow_cache:
-            print(f"DEBUG: Found in memory cache")
             return self.glow_cache[cache_key]
         
         # キャッシュファイルから読み込みを試みる
-        cache_filename = self.get_arc_cache_filename(cache_key)
-        cached_texture = self.load_cached_texture(cache_filename)
+        cache_params = self.get_arc_cache_params(width, height)
+        cached_texture = self.load_cached_texture(cache_key, cache_params)
         if cached_texture:
-            print(f"DEBUG: Found in file cache")
+            self.logger.debug(f"円弧テクスチャをファイルキャッシュから読み込みました: {cache_key}")
             self.glow_cache[cache_key] = cached_texture
             return cached_texture
         
         # 新規作成
-        print(f"DEBUG: Creating new arc texture")
+        self.logger.debug(f"円弧テクスチャを生成中: {cache_key}")
         texture = self.create_arc_glow_texture(width, height)
         
         # キャッシュに保存
         self.glow_cache[cache_key] = texture
-        self.save_texture_cache(texture, cache_filename)
+        self.save_texture_cache(texture, cache_key, cache_params)
         
         return texture
     
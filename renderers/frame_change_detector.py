@@ -0,0 +1,46 @@
+from typing import Any
+
+class FrameChangeDetector:
+    """描画入力の変化を検出し、見た目が変わらないフレームの描画を省略するクラス
+
+    描画入力（整数化した目の中心座標、まばたきプリセット、呼吸オフセット、
+    外枠の色・太さなど）をまとめた比較可能な値をシグネチャとして受け取り、
+    最後に表示したフレームと一致する場合は描画不要と判定する。
+    """
+
+    _NOTHING_PRESENTED = object()
+
+    def __init__(self):
+        self.last_signature: Any = self._NOTHING_PRESENTED
+        self.rendered_frames = 0
+        self.skipped_frames = 0
+
+    def invalidate(self):
+        """次のフレームを必ず描画する（画面の再露出や全体再描画が必要な場合）"""
+        self.last_signature = self._NOTHING_PRESENTED
+
+    def should_render(self, signature: Any) -> bool:
+        """フレームを描画すべきか判定し、カウンターを更新
+
+        Args:
+            signature: 現フレームの描画入力を表す値
+
+        Returns:
+            描画すべき場合はTrue（最後に表示したフレームと同じならFalse）
+        """
+        if signature == self.last_signature:
+            self.skipped_frames += 1
+            return False
+
+        self.last_signature = signature
+        self.rendered_frames += 1
+        return True
+
+    def get_stats(self) -> dict:
+        """描画・省略したフレーム数を取得"""
+        total = self.rendered_frames + self.skipped_frames
+        return {
+            'rendered_frames': self.rendered_frames,
+            'skipped_frames': self.skipped_frames,
+            'skip_ratio': self.skipped_frames / total if total else 0.0
+        }
@@ -0,0 +1,103 @@
+import pygame
+from typing import Optional, Tuple
+
+from utils.profiler import FrameProfiler
+
+class ProfilerOverlay:
+    """FrameProfilerの計測結果を画面の左上に表示するオーバーレイ
+
+    FPSとフレーム全体・段階ごとの処理時間（平均/p95/p99、ミリ秒）と、直近のフレームの
+    処理時間のグラフ（破線はフレームの予算）を表示する。文字の描画は重いため、
+    表示内容はinterval_msごとにサーフェスへ描き直し、それ以外のフレームでは
+    作成済みのサーフェスを転送するだけにする。
+    """
+
+    TEXT_COLOR = (220, 220, 220)
+    WARNING_COLOR = (255, 120, 80)
+    BACKGROUND_COLOR = (0, 0, 0, 180)
+    BAR_COLOR = (80, 200, 120)
+    FONT_SIZE = 18
+    LINE_HEIGHT = 15
+    PADDING = 6
+    WIDTH = 300
+    GRAPH_HEIGHT = 40
+
+    def __init__(self, interval_ms: int = 500, position: Tuple[int, int] = (8, 8)):
+        """
+        Args:
+            interval_ms: 表示内容を更新する間隔（ミリ秒）
+            position: 表示位置（左上の座標）
+        """
+        self.interval_ms = interval_ms
+        self.position = position
+        self.font = pygame.font.Font(None, self.FONT_SIZE)
+        self.surface: Optional[pygame.Surface] = None
+        self.updated_at: Optional[int] = None
+
+    def update(self, profiler: FrameProfiler, current_time: int, budget_ms: float):
+        """更新間隔が経過していれば表示内容を描き直す
+
+        Args:
+            profiler: 表示する計測結果
+            current_time: 現在時刻（ミリ秒）
+            budget_ms: 1フレームの予算（ミリ秒、グラフの目安線）
+        """
+        if self.updated_at is not None and current_time - self.updated_at < self.interval_ms:
+            return
+        self.updated_at = current_time
+        self.surface = self._render(profiler, budget_ms)
+
+    def _render(self, profiler: FrameProfiler, budget_ms: float) -> pygame.Surface:
+        """計測結果を描いたサーフェスを作成"""
+        report = profiler.get_report()
+        lines = [
+            (f"{report['fps']:5.1f} FPS   budget {budget_ms:.1f} ms", self.TEXT_COLOR),
+            (f"{'':8s} {'mean':>6s} {'p95':>6s} {'p99':>6s}", self.TEXT_COLOR)
+        ]
+        rows = [('frame', report['frame_ms'])] + list(report['stages_ms'].items())
+        for name, summary in rows:
+            if not summary['count']:
+                continue
+            color = self.WARNING_COLOR if name == 'frame' and summary['p95'] > budget_ms else self.TEXT_COLOR
+            lines.append((f"{name:8s} {summary['mean']:6.2f} {summary['p95']:6.2f} "
+                          f"{summary['p99']:6.2f} ms", color))
+        blocks = report['allocated_blocks']
+        if blocks['count']:
+            lines.append((f"blocks/frame {blocks['mean']:+.1f}  gc {report['gc_collections']}",
+                          self.TEXT_COLOR))
+
+        height = self.PADDING * 3 + len(lines) * self.LINE_HEIGHT + self.GRAPH_HEIGHT
+        surface = pygame.Surface((self.WIDTH, height), pygame.SRCALPHA)
+        surface.fill(self.BACKGROUND_COLOR)
+        y = self.PADDING
+        for text, color in lines:
+            surface.blit(self.font.render(text, True, color), (self.PADDING, y))
+            y += self.LINE_HEIGHT
+
+        self._draw_graph(surface, profiler, budget_ms, y + self.PADDING)
+        return surface
+
+    def _draw_graph(self, surface: pygame.Surface, profiler: FrameProfiler, budget_ms: float, top: int):
+        """直近のフレームの処理時間を棒グラフで描画（予算の2倍を上端とする）"""
+        width = self.WIDTH - self.PADDING * 2
+        samples = list(profiler.frame_times.samples)[-width:]
+        scale = self.GRAPH_HEIGHT / (budget_ms * 2)
+        bottom = top + self.GRAPH_HEIGHT
+        for x, value in enumerate(samples, self.PADDING):
+            bar_height = min(self.GRAPH_HEIGHT, max(1, int(value * scale)))
+            color = self.WARNING_COLOR if value > budget_ms else self.BAR_COLOR
+            pygame.draw.line(surface, color, (x, bottom), (x, bottom - bar_height))
+
+        budget_y = bottom - int(budget_ms * scale)
+        for x in range(self.PADDING, self.PADDING + width, 6):
+            pygame.draw.line(surface, self.TEXT_COLOR, (x, budget_y), (x + 2, budget_y))
+
+    def draw(self, screen: pygame.Surface) -> Optional[pygame.Rect]:
+        """オーバーレイを描画
+
+        Returns:
+            描画した領域（まだ描いていない場合はNone）
+        """
+        if self.surface is None:
+            return None
+        return screen.blit(self.surface, self.position)
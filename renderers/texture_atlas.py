@@ -0,0 +1,89 @@
+import logging
+import pygame
+from typing import Any, Dict, Optional, Tuple
+from renderers.texture_cache import TextureCache
+
+logger = logging.getLogger(__name__)
+
+class TextureAtlas:
+    """複数のテクスチャを1枚のサーフェスにまとめたアトラス
+
+    まばたきの各段階や休止状態の円弧など、目のテクスチャをすべて1枚に詰めて保持し、
+    描画時は領域（area）を指定してアトラスから直接blitする。ファイルキャッシュも
+    アトラス画像と領域の索引（JSON）の2ファイルだけになる。
+    """
+
+    def __init__(self, surface: pygame.Surface, rects: Dict[str, pygame.Rect]):
+        self.surface = surface
+        self.rects = rects
+
+    @classmethod
+    def build(cls, textures: Dict[str, pygame.Surface], max_width: int = 2048) -> 'TextureAtlas':
+        """テクスチャを棚詰め（高さ順に行へ並べる）で1枚のアトラスにまとめる
+
+        Args:
+            textures: キーとテクスチャの辞書
+            max_width: アトラスの最大幅（これを超える場合は次の行に並べる）
+        """
+        # 高さの大きい順に並べると行ごとの無駄が少ない
+        order = sorted(textures, key=lambda key: textures[key].get_height(), reverse=True)
+
+        rects: Dict[str, pygame.Rect] = {}
+        x = y = row_height = atlas_width = 0
+        for key in order:
+            width, height = textures[key].get_size()
+            if x > 0 and x + width > max_width:
+                x = 0
+                y += row_height
+                row_height = 0
+            rects[key] = pygame.Rect(x, y, width, height)
+            x += width
+            row_height = max(row_height, height)
+            atlas_width = max(atlas_width, x)
+
+        surface = pygame.Surface((max(atlas_width, 1), max(y + row_height, 1)), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        for key, rect in rects.items():
+            # 透明な背景とのアルファ合成で画素が変わらないよう、そのままコピーする
+            surface.blit(textures[key], rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        return cls(surface, rects)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.rects
+
+    def get_size(self, key: str) -> Tuple[int, int]:
+        """テクスチャのサイズを取得"""
+        return self.rects[key].size
+
+    def get_texture(self, key: str) -> pygame.Surface:
+        """テクスチャをアトラスを参照するサブサーフェスとして取得（コピーしない）"""
+        return self.surface.subsurface(self.rects[key])
+
+    def blit(self, target: pygame.Surface, key: str, dest: Tuple[int, int], special_flags: int = 0) -> pygame.Rect:
+        """アトラスからテクスチャを描画
+
+        Returns:
+            描画した領域
+        """
+        return target.blit(self.surface, dest, area=self.rects[key], special_flags=special_flags)
+
+    def save(self, cache: TextureCache, prefix: str, params: Dict[str, Any]):
+        """アトラス画像を領域の索引とともにキャッシュに保存"""
+        rects = {key: list(rect) for key, rect in self.rects.items()}
+        cache.save(prefix, params, self.surface, {'rects': rects})
+
+    @classmethod
+    def load(cls, cache: TextureCache, prefix: str, params: Dict[str, Any]) -> Optional['TextureAtlas']:
+        """キャッシュからアトラスを読み込む（存在しない・壊れている場合はNone）"""
+        entry = cache.load(prefix, params)
+        if entry is None:
+            return None
+
+        surface, extra = entry
+        rects = {key: pygame.Rect(rect) for key, rect in extra.get('rects', {}).items()}
+        bounds = surface.get_rect()
+        if not all(bounds.contains(rect) for rect in rects.values()):
+            logger.warning("アトラスの索引が画像と一致しないため再生成します")
+            return None
+        return cls(surface, rects)
@@ -0,0 +1,87 @@
+import logging
+import multiprocessing
+import multiprocessing.pool
+import os
+import pygame
+from typing import Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# pygame 2.1.3より前はtostringのみ
+_image_to_bytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+
+# ワーカープロセス内でテクスチャを生成するレンダラー（_init_workerで作成）
+_worker_renderer = None
+
+
+def _init_worker(glow_generator: str):
+    """ワーカープロセスの初期化"""
+    global _worker_renderer
+    from renderers.eye_renderer import EyeRenderer
+    _worker_renderer = EyeRenderer()
+    _worker_renderer.glow_generator = glow_generator
+
+
+def _build_texture(spec: tuple) -> Tuple[str, Tuple[int, int], bytes]:
+    """ワーカープロセスでテクスチャを1枚生成し、RGBAのバイト列として返す"""
+    key, method_name, args = spec
+    texture = getattr(_worker_renderer, method_name)(*args)
+    return key, texture.get_size(), _image_to_bytes(texture, 'RGBA')
+
+
+def get_worker_count(workers: int, task_count: int) -> int:
+    """使用するワーカープロセス数を決定（0はCPUコア数）"""
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, task_count))
+
+
+def build_textures(renderer, specs: List[tuple], workers: int = 0) -> Iterator[Tuple[str, pygame.Surface]]:
+    """テクスチャ生成をプロセスプールに分散し、完成したものから順に返す
+
+    ワーカーは生成したテクスチャを生のRGBAバイト列で返し、メインプロセスで
+    pygame.image.frombufferによりサーフェスに戻す。ワーカーが1つの場合や
+    プロセスを起動できない環境では、このプロセス内で順に生成する。
+
+    Args:
+        renderer: テクスチャ生成メソッドを持つEyeRenderer
+        specs: (キー, 生成メソッド名, 引数のタプル) のリスト
+        workers: ワーカープロセス数（0はCPUコア数）
+
+    Yields:
+        (キー, テクスチャ)（完成順のため、specsの順とは限らない）
+    """
+    workers = get_worker_count(workers, len(specs))
+    pool = _create_pool(workers, renderer.glow_generator) if workers > 1 else None
+
+    if pool is None:
+        for key, method_name, args in specs:
+            yield key, getattr(renderer, method_name)(*args)
+        return
+
+    with pool:
+        for key, size, data in pool.imap_unordered(_build_texture, specs):
+            yield key, pygame.image.frombuffer(data, size, 'RGBA')
+
+
+def _create_pool(workers: int, glow_generator: str) -> Optional[multiprocessing.pool.Pool]:
+    """ワーカープロセスのプールを作成（作成できない場合はNone）
+
+    ディスプレイの初期化前（--build-cacheなど）はforkで起動する（再importが不要で速い）。
+    初期化後にforkするとワーカーが停止することがあるため、forkserverのサーバー
+    プロセス（モジュールはそこで1回だけimportする）からforkする。
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if 'fork' in methods and not pygame.display.get_init():
+        context = multiprocessing.get_context('fork')
+    elif 'forkserver' in methods:
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload(['renderers.eye_renderer'])
+    else:
+        context = multiprocessing.get_context('spawn')
+
+    try:
+        return context.Pool(workers, initializer=_init_worker, initargs=(glow_generator,))
+    except (OSError, ValueError) as e:
+        logger.warning(f"ワーカープロセスを起動できないため、順に生成します: {e}")
+        return None
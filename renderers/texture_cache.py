@@ -0,0 +1,243 @@
+import hashlib
+import io
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+import pygame
+from typing import Any, Dict, Optional, Tuple
+
+class TextureCache:
+    """テクスチャのディスクキャッシュ
+
+    ファイル名は、画素に影響するすべてのパラメータ（色・レイヤー定義・生成方式・寸法など）の
+    ハッシュで決まるため、設定を変えると別のエントリになり古い画像は使われない。
+        - 画像とメタデータ（JSON）は一時ファイルに書いてからrenameするため、
+          書き込み途中の電源断で不完全なファイルが残ることはない
+        - メタデータは画像の後に書き、サイズ・パラメータを記録する。読み込み時に
+          これらと画像のチェックサムを検証し、一致しないエントリは削除する
+        - 合計サイズがmax_bytesを超えた場合は、最後に使われた時刻（mtime）が古い
+          エントリから削除する（LRU）
+
+    画像の形式はimage_formatで選ぶ:
+        png: PNG（SHA-256はメタデータに記録）。読み込み時に展開と形式変換が必要
+        raw: 小さなヘッダー付きの無圧縮のピクセル列。mmapしたファイルをそのまま
+             pygame.image.frombufferでサーフェスにするため、展開もコピーも不要
+    """
+
+    FORMATS = ('png', 'raw')
+    IMAGE_EXTENSIONS = {'png': '.png', 'raw': '.rgba'}
+    META_EXTENSION = '.json'
+    TEMP_SUFFIX = '.tmp'
+
+    # rawのヘッダー: マジック, 形式のバージョン, 幅, 高さ, チャンネル順, ピクセル列のCRC32
+    RAW_HEADER = struct.Struct('<4sHxxII4sI')
+    RAW_MAGIC = b'RTEX'
+    RAW_VERSION = 1
+    # SDLのSRCALPHAサーフェス（convert_alpha後と同じ）のバイト順。読み込み後の変換が不要になる。
+    # BLEND_ADDはアルファを使わずRGBをそのまま加算するため、プリマルチプライドにはしない
+    RAW_CHANNELS = 'BGRA'
+
+    def __init__(self, directory: str, max_bytes: int, image_format: str = 'png'):
+        if image_format not in self.FORMATS:
+            raise ValueError(f"未知のキャッシュ形式: {image_format}")
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.image_format = image_format
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(directory, exist_ok=True)
+
+        # 統計
+        self.hit_count = 0
+        self.miss_count = 0
+        self.invalid_count = 0
+        self.evicted_count = 0
+
+    @staticmethod
+    def get_digest(params: Dict[str, Any]) -> str:
+        """パラメータのハッシュ（キーの順序によらない）"""
+        encoded = json.dumps(params, sort_keys=True, separators=(',', ':')).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:16]
+
+    def get_path(self, prefix: str, params: Dict[str, Any], extension: Optional[str] = None) -> str:
+        """エントリのファイルパス（prefixは人が見分けるための名前、省略時は画像の拡張子）"""
+        extension = extension or self.IMAGE_EXTENSIONS[self.image_format]
+        return os.path.join(self.directory, f"{prefix}_{self.get_digest(params)}{extension}")
+
+    def load(self, prefix: str, params: Dict[str, Any]) -> Optional[Tuple[pygame.Surface, Dict[str, Any]]]:
+        """テクスチャを読み込む
+
+        Returns:
+            (テクスチャ, 保存時のextra)。存在しない・検証に失敗した場合はNone
+        """
+        image_path = self.get_path(prefix, params)
+        meta_path = self.get_path(prefix, params, self.META_EXTENSION)
+        if not (os.path.exists(meta_path) and os.path.exists(image_path)):
+            self.miss_count += 1
+            return None
+
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('params') != json.loads(json.dumps(params)):
+                raise ValueError("パラメータが一致しません")
+            if self.image_format == 'raw':
+                surface = self._load_raw(image_path)
+            else:
+                surface = self._load_png(image_path, meta)
+            if list(surface.get_size()) != meta.get('size'):
+                raise ValueError("画像のサイズが一致しません")
+        except (OSError, ValueError, struct.error, pygame.error) as e:
+            return self._discard(image_path, meta_path, str(e))
+
+        self._touch(image_path, meta_path)
+        self.hit_count += 1
+        return surface, meta.get('extra', {})
+
+    def _load_png(self, path: str, meta: Dict[str, Any]) -> pygame.Surface:
+        """PNGを検証して読み込む"""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if meta.get('sha256') != hashlib.sha256(data).hexdigest():
+            raise ValueError("画像のハッシュが一致しません")
+
+        surface = pygame.image.load(io.BytesIO(data), os.path.basename(path))
+        # ディスプレイ初期化後は描画用の形式に変換しておく
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def _load_raw(self, path: str) -> pygame.Surface:
+        """rawをmmapし、ピクセル列をコピーせずにサーフェスとして参照する
+
+        ACCESS_COPYで割り当てるため、サーフェスへの書き込みはファイルに反映されない。
+        キャッシュの更新はrenameで別のファイルに置き換わるので、割り当て済みの内容は変わらない。
+        """
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+        magic, version, width, height, channels, checksum = self.RAW_HEADER.unpack_from(mapped)
+        if magic != self.RAW_MAGIC or version != self.RAW_VERSION:
+            raise ValueError("ヘッダーが不正です")
+        pixels = memoryview(mapped)[self.RAW_HEADER.size:]
+        if len(pixels) != width * height * 4:
+            raise ValueError("ピクセル列の長さが一致しません")
+        if zlib.crc32(pixels) != checksum:
+            raise ValueError("ピクセル列のチェックサムが一致しません")
+        return pygame.image.frombuffer(pixels, (width, height), channels.decode('ascii'))
+
+    def save(self, prefix: str, params: Dict[str, Any], surface: pygame.Surface, extra: Optional[Dict[str, Any]] = None):
+        """テクスチャを保存し、上限を超えた分を古いものから削除
+
+        Args:
+            extra: テクスチャと一緒に保存する任意の情報（アトラスの索引など）
+        """
+        image_path = self.get_path(prefix, params)
+        meta_path = self.get_path(prefix, params, self.META_EXTENSION)
+
+        meta = {
+            'params': params,
+            'size': list(surface.get_size()),
+            'extra': extra or {}
+        }
+        if self.image_format == 'raw':
+            pixels = pygame.image.tostring(surface, self.RAW_CHANNELS)
+            header = self.RAW_HEADER.pack(
+                self.RAW_MAGIC, self.RAW_VERSION, surface.get_width(), surface.get_height(),
+                self.RAW_CHANNELS.encode('ascii'), zlib.crc32(pixels)
+            )
+            data = header + pixels
+        else:
+            buffer = io.BytesIO()
+            pygame.image.save(surface, buffer, os.path.basename(image_path))
+            data = buffer.getvalue()
+            meta['sha256'] = hashlib.sha256(data).hexdigest()
+
+        # 画像を先に置き、メタデータの配置をもってエントリの完成とする
+        self._write_atomic(image_path, data)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        self.evict(keep=self._get_stem(image_path))
+
+    def _write_atomic(self, path: str, data: bytes):
+        """一時ファイルに書き込んでfsyncし、renameで置き換える"""
+        temp_path = f"{path}.{os.getpid()}{self.TEMP_SUFFIX}"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+    def evict(self, keep: Optional[str] = None):
+        """合計サイズがmax_bytes以下になるまで、最後に使われた時刻が古いエントリを削除
+
+        Args:
+            keep: 削除しないエントリ（保存したばかりのものなど）
+        """
+        entries: Dict[str, list] = {}  # 拡張子を除いた名前 -> [合計サイズ, 最終使用時刻, パス一覧]
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if not os.path.isfile(path):
+                continue
+            entry = entries.setdefault(self._get_stem(path), [0, 0.0, []])
+            entry[0] += stat.st_size
+            entry[1] = max(entry[1], stat.st_mtime)
+            entry[2].append(path)
+
+        total = sum(size for size, _, _ in entries.values())
+        for stem, (size, _, paths) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            if stem == keep:
+                continue
+            for path in paths:
+                self._remove(path)
+            total -= size
+            self.evicted_count += 1
+
+    def _get_stem(self, path: str) -> str:
+        """エントリ名（画像・メタデータ・一時ファイルで共通の、拡張子を除いた名前）"""
+        return os.path.basename(path).split('.', 1)[0]
+
+    def _discard(self, image_path: str, meta_path: str, reason: str) -> None:
+        """検証に失敗したエントリを削除"""
+        self.logger.warning(f"テクスチャキャッシュを破棄します（{reason}）: {os.path.basename(image_path)}")
+        self._remove(meta_path)
+        self._remove(image_path)
+        self.invalid_count += 1
+        self.miss_count += 1
+        return None
+
+    def _touch(self, *paths: str):
+        """LRUのために最終使用時刻を更新"""
+        for path in paths:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """統計を取得"""
+        return {
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'invalid': self.invalid_count,
+            'evicted': self.evicted_count
+        }
@@ -1,20 +1,27 @@
 from abc import ABC, abstractmethod
+import logging
 import pygame
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from utils.config import config
+from utils.frame_clock import frame_clock
 
 class BaseState(ABC):
     """状態の基底クラス（State パターン）"""
     
     def __init__(self, name: str):
         self.name = name
+        self.logger = logging.getLogger(type(self).__module__)
         self.is_active = False
         self.start_time = 0
         
+        # 状態が希望するフレームレート（Noneの場合はdisplay.fps）
+        self.target_fps: Optional[int] = config.get_state_target_fps(name)
+        
     @abstractmethod
     def enter(self, previous_state: str = None, **kwargs):
         """状態開始時の処理"""
         self.is_active = True
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = frame_clock.now
         
     @abstractmethod
     def update(self, dt: float) -> Dict[str, Any]:
@@ -53,10 +60,34 @@ class BaseState(ABC):
         """
         return False
         
+    def get_target_fps(self) -> Optional[int]:
+        """この状態で希望するフレームレートを取得
+        
+        Returns:
+            フレームレート（Noneの場合は上限のdisplay.fpsを使用）
+        """
+        return self.target_fps
+        
+    def get_overlay_rects(self) -> List[pygame.Rect]:
+        """render()で描画するオーバーレイの領域を取得（差分描画用）
+        
+        Returns:
+            オーバーレイが描画されうる矩形のリスト（オーバーレイなしの場合は空）
+        """
+        return []
+        
+    def get_render_signature(self) -> Any:
+        """オーバーレイの見た目を表す比較可能な値を取得（変化検出用）
+        
+        Returns:
+            前フレームと等しければ描画結果が変わらない値（オーバーレイが静的な場合はNone）
+        """
+        return None
+        
     def get_elapsed_time(self) -> int:
         """状態開始からの経過時間を取得（ミリ秒）"""
         if self.is_active:
-            return pygame.time.get_ticks() - self.start_time
+            return frame_clock.now - self.start_time
         return 0
         
     def __repr__(self):
@@ -12,7 +12,7 @@ class IdleState(BaseState):
     def enter(self, previous_state: str = None, **kwargs):
         """アイドル状態開始時の処理"""
         super().enter(previous_state, **kwargs)
-        print(f"アイドル状態に移行しました（前の状態: {previous_state}）")
+        self.logger.info(f"アイドル状態に移行しました（前の状態: {previous_state}）")
     
     def update(self, dt: float) -> Dict[str, Any]:
         """アイドル状態の更新処理
@@ -41,7 +41,7 @@ class IdleState(BaseState):
     def exit(self):
         """アイドル状態終了時の処理"""
         super().exit()
-        print(f"アイドル状態を終了しました")
+        self.logger.info(f"アイドル状態を終了しました")
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理
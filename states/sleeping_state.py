@@ -25,7 +25,7 @@ class SleepingState(BaseState):
         # アニメーションをリセット
         self.breathing_phase = 0.0
         
-        print(f"休止状態に移行しました（前の状態: {previous_state}）")
+        self.logger.info(f"休止状態に移行しました（前の状態: {previous_state}）")
     
     def update(self, dt: float) -> Dict[str, Any]:
         """休止状態の更新処理
@@ -58,7 +58,7 @@ class SleepingState(BaseState):
     def exit(self):
         """休止状態終了時の処理"""
         super().exit()
-        print(f"休止状態を終了しました")
+        self.logger.info(f"休止状態を終了しました")
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理
@@ -3,6 +3,7 @@ from typing import Dict, Any, List
 from states.base_state import BaseState
 from renderers.border_renderer import BorderRenderer
 from utils.config import config
+from utils.frame_clock import frame_clock
 from utils.constants import States
 
 class SpeakingState(BaseState):
@@ -22,6 +23,7 @@ class SpeakingState(BaseState):
         self.border_width = self.speaking_config.get('border_width', 8)
         self.blink_speed = self.speaking_config.get('blink_speed', 4.0)
         self.intensity_default = self.speaking_config.get('intensity_default', 1.0)
+        self.live_lip_timeout_ms = self.speaking_config.get('live_lip_timeout_ms', 300)
         
         # 発話状態
         self.speaking_intensity = self.intensity_default
@@ -32,6 +34,10 @@ class SpeakingState(BaseState):
         # 疑似リップシンク用のデータ
         self.lip_sync_pattern = []
         self.lip_sync_index = 0
+        
+        # 外部から逐次送られるリップシンク強度（パターンより優先）
+        self.live_lip_intensity = 0.0
+        self.live_lip_time = None
     
     def enter(self, previous_state: str = None, **kwargs):
         """発話中状態開始時の処理"""
@@ -48,11 +54,12 @@ class SpeakingState(BaseState):
         
         # リップシンクをリセット
         self.lip_sync_index = 0
+        self.live_lip_time = None
         self.is_speaking = True
         
-        print(f"発話中状態に移行しました（前の状態: {previous_state}, 強度: {self.speaking_intensity}）")
+        self.logger.info(f"発話中状態に移行しました（前の状態: {previous_state}, 強度: {self.speaking_intensity}）")
         if self.duration:
-            print(f"発話時間: {self.duration/1000:.1f}秒")
+            self.logger.info(f"発話時間: {self.duration/1000:.1f}秒")
     
     def _generate_random_lip_sync_pattern(self):
         """ランダムな疑似リップシンクパターンを生成"""
@@ -100,8 +107,10 @@ class SpeakingState(BaseState):
             should_return_to_idle = True
             self.is_speaking = False
         
-        # リップシンクパターンが終了した場合
-        if self.lip_sync_index >= len(self.lip_sync_pattern):
+        # リップシンクパターンが終了した場合（外部から強度が送られている間は継続）
+        if self.is_live_lip_sync_active():
+            self.is_speaking = True
+        elif self.lip_sync_index >= len(self.lip_sync_pattern):
             should_return_to_idle = True
             self.is_speaking = False
         
@@ -129,8 +138,26 @@ class SpeakingState(BaseState):
         else:
             self.lip_sync_index = len(self.lip_sync_pattern)
     
+    def set_live_lip_intensity(self, intensity: float):
+        """外部から送られたリップシンク強度を設定（TTSの音量などで直接駆動）
+        
+        Args:
+            intensity: リップシンク強度（0.0-1.0）
+        """
+        self.live_lip_intensity = max(0.0, min(1.0, intensity))
+        self.live_lip_time = frame_clock.now
+    
+    def is_live_lip_sync_active(self) -> bool:
+        """外部からのリップシンク強度が有効期間内かどうか"""
+        if self.live_lip_time is None:
+            return False
+        return frame_clock.now - self.live_lip_time <= self.live_lip_timeout_ms
+    
     def get_current_lip_intensity(self) -> float:
         """現在のリップシンク強度を取得"""
+        if self.is_live_lip_sync_active():
+            return self.live_lip_intensity
+        
         if (not self.lip_sync_pattern or 
             self.lip_sync_index >= len(self.lip_sync_pattern)):
             return 0.0
@@ -145,22 +172,37 @@ class SpeakingState(BaseState):
         """
         # 発話中の白い点滅外枠を描画（オーバーレイ）
         if self.is_speaking:
-            lip_intensity = self.get_current_lip_intensity()
-            # 基本速度を3倍にして高速化
-            base_speed = self.blink_speed * 3.0
-            adjusted_speed = base_speed * self.speaking_intensity * (0.5 + lip_intensity * 0.5)
-            
             self.border_renderer.draw_blinking_border(
                 screen,
                 self.color_config['white'],
-                blink_speed=adjusted_speed,
+                blink_speed=self._get_border_blink_speed(),
                 border_width=self.border_width
             )
     
+    def _get_border_blink_speed(self) -> float:
+        """発話強度とリップシンク強度を反映した点滅速度を取得"""
+        lip_intensity = self.get_current_lip_intensity()
+        # 基本速度を3倍にして高速化
+        base_speed = self.blink_speed * 3.0
+        return base_speed * self.speaking_intensity * (0.5 + lip_intensity * 0.5)
+    
+    def get_overlay_rects(self) -> List[pygame.Rect]:
+        """外枠オーバーレイの領域を取得"""
+        return self.border_renderer.get_border_strip_rects(self.border_width)
+    
+    def get_render_signature(self) -> Any:
+        """外枠の現在の色を取得（変化検出用）"""
+        if not self.is_speaking:
+            return None
+        return self.border_renderer.get_blinking_color(
+            self.color_config['white'],
+            self._get_border_blink_speed()
+        )
+    
     def exit(self):
         """発話中状態終了時の処理"""
         super().exit()
-        print(f"発話中状態を終了しました（経過時間: {self.get_elapsed_time()/1000:.1f}秒）")
+        self.logger.info(f"発話中状態を終了しました（経過時間: {self.get_elapsed_time()/1000:.1f}秒）")
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理
@@ -175,17 +217,17 @@ class SpeakingState(BaseState):
             if event.key == pygame.K_UP:
                 # 発話強度を上げる
                 self.speaking_intensity = min(2.0, self.speaking_intensity + 0.1)
-                print(f"発話強度: {self.speaking_intensity:.1f}")
+                self.logger.info(f"発話強度: {self.speaking_intensity:.1f}")
                 return True
             elif event.key == pygame.K_DOWN:
                 # 発話強度を下げる
                 self.speaking_intensity = max(0.1, self.speaking_intensity - 0.1)
-                print(f"発話強度: {self.speaking_intensity:.1f}")
+                self.logger.info(f"発話強度: {self.speaking_intensity:.1f}")
                 return True
             elif event.key == pygame.K_RETURN:
                 # 発話の停止/再開
                 self.is_speaking = not self.is_speaking
-                print(f"発話状態: {'ON' if self.is_speaking else 'OFF'}")
+                self.logger.info(f"発話状態: {'ON' if self.is_speaking else 'OFF'}")
                 return True
         
         return False
@@ -198,6 +240,19 @@ class SpeakingState(BaseState):
         """
         self.speaking_intensity = max(0.1, min(2.0, intensity))
     
+    def set_parameters(self, parameters: Dict[str, Any]):
+        """外部コマンドからパラメータを設定
+        
+        Args:
+            parameters: intensity（発話強度）、duration（ミリ秒）、lip_sync_pattern（強度のリスト）
+        """
+        if 'intensity' in parameters:
+            self.set_speaking_intensity(float(parameters['intensity']))
+        if 'duration' in parameters:
+            self.set_duration(parameters['duration'])
+        if 'lip_sync_pattern' in parameters:
+            self.set_lip_sync_pattern(parameters['lip_sync_pattern'])
+    
     def set_lip_sync_pattern(self, pattern: List[float]):
         """リップシンクパターンを設定
         
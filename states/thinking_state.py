@@ -1,5 +1,5 @@
 import pygame
-from typing import Dict, Any
+from typing import Dict, Any, List
 from states.base_state import BaseState
 from renderers.border_renderer import BorderRenderer
 from utils.config import config
@@ -34,9 +34,9 @@ class ThinkingState(BaseState):
         self.thinking_intensity = kwargs.get('intensity', 1.0)
         self.duration = kwargs.get('duration', None)  # ミリ秒
         
-        print(f"思考中状態に移行しました（前の状態: {previous_state}, 強度: {self.thinking_intensity}）")
+        self.logger.info(f"思考中状態に移行しました（前の状態: {previous_state}, 強度: {self.thinking_intensity}）")
         if self.duration:
-            print(f"思考時間: {self.duration/1000:.1f}秒")
+            self.logger.info(f"思考時間: {self.duration/1000:.1f}秒")
     
     def update(self, dt: float) -> Dict[str, Any]:
         """思考中状態の更新処理
@@ -69,17 +69,28 @@ class ThinkingState(BaseState):
             screen: 描画対象のサーフェス
         """
         # 思考中の外枠アニメーションを描画（オーバーレイ）
-        adjusted_speed = self.color_change_speed * self.thinking_intensity
         self.border_renderer.draw_animated_thinking_border(
             screen,
-            speed=adjusted_speed,
+            speed=self._get_border_speed(),
             border_width=self.border_width
         )
     
+    def _get_border_speed(self) -> float:
+        """強度を反映した外枠アニメーション速度を取得"""
+        return self.color_change_speed * self.thinking_intensity
+    
+    def get_overlay_rects(self) -> List[pygame.Rect]:
+        """外枠オーバーレイの領域を取得（パルスで最大2倍の太さになる）"""
+        return self.border_renderer.get_border_strip_rects(self.border_width * 2)
+    
+    def get_render_signature(self) -> Any:
+        """外枠の現在の色と太さを取得（変化検出用）"""
+        return self.border_renderer.get_thinking_style(self._get_border_speed(), self.border_width)
+    
     def exit(self):
         """思考中状態終了時の処理"""
         super().exit()
-        print(f"思考中状態を終了しました（経過時間: {self.get_elapsed_time()/1000:.1f}秒）")
+        self.logger.info(f"思考中状態を終了しました（経過時間: {self.get_elapsed_time()/1000:.1f}秒）")
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """イベント処理
@@ -94,12 +105,12 @@ class ThinkingState(BaseState):
             if event.key == pygame.K_UP:
                 # 思考強度を上げる
                 self.thinking_intensity = min(2.0, self.thinking_intensity + 0.1)
-                print(f"思考強度: {self.thinking_intensity:.1f}")
+                self.logger.info(f"思考強度: {self.thinking_intensity:.1f}")
                 return True
             elif event.key == pygame.K_DOWN:
                 # 思考強度を下げる
                 self.thinking_intensity = max(0.1, self.thinking_intensity - 0.1)
-                print(f"思考強度: {self.thinking_intensity:.1f}")
+                self.logger.info(f"思考強度: {self.thinking_intensity:.1f}")
                 return True
         
         return False
@@ -112,6 +123,17 @@ class ThinkingState(BaseState):
         """
         self.thinking_intensity = max(0.1, min(2.0, intensity))
     
+    def set_parameters(self, parameters: Dict[str, Any]):
+        """外部コマンドからパラメータを設定
+        
+        Args:
+            parameters: intensity（思考強度）、duration（ミリ秒）
+        """
+        if 'intensity' in parameters:
+            self.set_thinking_intensity(float(parameters['intensity']))
+        if 'duration' in parameters:
+            self.set_duration(parameters['duration'])
+    
     def set_duration(self, duration_ms: int):
         """思考時間を設定
         
@@ -87,6 +87,15 @@ class RobotFaceClient:
             print(f"ステータス: {response}")
         return response
     
+    def get_metrics(self):
+        """計測結果取得コマンドを送信"""
+        command = {'command': 'get_metrics'}
+        
+        response = self.send_command(command)
+        if response:
+            print(f"計測結果: {response}")
+        return response
+    
     def ping(self):
         """Pingコマンドを送信"""
         command = {'command': 'ping'}
@@ -120,6 +129,7 @@ def interactive_mode():
         print("  3: 発話中状態に変更")
         print("  4: 休止状態に変更")
         print("  s: ステータス取得")
+        print("  m: 計測結果取得")
         print("  p: Ping送信")
         print("  q: 終了")
         print("  x: シャットダウン送信")
@@ -139,6 +149,8 @@ def interactive_mode():
                     client.change_state('sleeping')
                 elif cmd == 's':
                     client.get_status()
+                elif cmd == 'm':
+                    client.get_metrics()
                 elif cmd == 'p':
                     client.ping()
                 elif cmd == 'q':
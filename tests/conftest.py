@@ -0,0 +1,10 @@
+import os
+import sys
+
+# ウィンドウを開かずに描画する（pygameの初期化より前に設定する必要がある）
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+# config.yamlはカレントディレクトリから読み込まれる
+os.chdir(ROOT)
@@ -0,0 +1,100 @@
+import asyncio
+
+from core.client_sender import ClientSender
+
+
+class FakeTransport:
+    """送信バッファが常に満杯のトランスポート（すべてのメッセージがキューを経由する）"""
+
+    def __init__(self):
+        self.aborted = False
+
+    def is_closing(self) -> bool:
+        return self.aborted
+
+    def get_write_buffer_size(self) -> int:
+        return 1
+
+    def get_write_buffer_limits(self):
+        return 0, 1
+
+    def abort(self):
+        self.aborted = True
+
+
+class FakeWriter:
+    """drain()がgateの開放まで待機するStreamWriter"""
+
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.written = []
+        self.gate = asyncio.Event()
+
+    def write(self, data: bytes):
+        self.written.append(data)
+
+    async def drain(self):
+        await self.gate.wait()
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+def test_drop_oldest_never_drops_pending_response():
+    async def scenario():
+        writer = FakeWriter()
+        sender = ClientSender(writer, maxsize=2, policy=ClientSender.DROP_OLDEST)
+        sender.start()
+        sender.put(b'push0')
+        await asyncio.sleep(0)  # 送信タスクがpush0のdrainで待機する
+        response = asyncio.create_task(sender.send(b'response'))
+        await asyncio.sleep(0)
+        for index in range(1, 10):
+            sender.put(f'push{index}'.encode())
+        writer.gate.set()
+        await response
+        sender.close()
+        return writer.written, sender
+
+    written, sender = run(scenario())
+    assert b'response' in written
+    # 応答はキューに残っているpush通知より先に書き出される
+    assert written[:2] == [b'push0', b'response']
+    assert written[2:] == [b'push8', b'push9']
+    assert sender.dropped_count == 7
+
+
+def test_responses_do_not_count_toward_disconnect_limit():
+    async def scenario():
+        writer = FakeWriter()
+        sender = ClientSender(writer, maxsize=2, policy=ClientSender.DISCONNECT)
+        sender.start()
+        await asyncio.sleep(0)
+        responses = [asyncio.create_task(sender.send(f'response{index}'.encode())) for index in range(5)]
+        await asyncio.sleep(0)
+        sender.put(b'push0')
+        sender.put(b'push1')
+        aborted_before_overflow = writer.transport.aborted
+        sender.put(b'push2')  # push通知が容量を超えた場合のみ切断する
+        await asyncio.gather(*responses)
+        return aborted_before_overflow, writer.transport.aborted
+
+    aborted_before_overflow, aborted = run(scenario())
+    assert not aborted_before_overflow
+    assert aborted
+
+
+def test_close_releases_waiting_send():
+    async def scenario():
+        writer = FakeWriter()
+        sender = ClientSender(writer, maxsize=2)
+        sender.start()
+        await asyncio.sleep(0)
+        response = asyncio.create_task(sender.send(b'response'))
+        await asyncio.sleep(0)
+        sender.close()
+        await response
+        return len(sender)
+
+    assert run(scenario()) == 0
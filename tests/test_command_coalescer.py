@@ -0,0 +1,56 @@
+import asyncio
+
+from core.command_coalescer import CommandCoalescer
+from core.command_interface import CommandInterface
+from core.command_queue import CommandQueue
+
+
+def test_set_parameter_is_merged_by_key():
+    commands = [
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.5, 'duration': 1000}},
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.8}},
+    ]
+    assert CommandCoalescer().coalesce(commands, 'speaking') == [
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.8, 'duration': 1000}}
+    ]
+
+
+def test_non_dict_parameters_are_ignored():
+    commands = [
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.5}},
+        {'command': 'set_parameter', 'parameters': 5},
+        {'command': 'set_parameter'},
+        {'command': 'batch', 'commands': [{'command': 'set_parameter', 'parameters': ['intensity']}]},
+    ]
+    assert CommandCoalescer().coalesce(commands, 'speaking') == [
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.5}}
+    ]
+
+
+def test_unknown_state_does_not_override_valid_transition():
+    interface = CommandInterface()
+    interface.command_queue = CommandQueue(16)
+    burst = [
+        {'command': 'change_state', 'state': 'thinking'},
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.7}},
+        {'command': 'change_state', 'state': 'bogus'},
+    ]
+    responses = [asyncio.run(interface._process_command(command)) for command in burst]
+    assert responses[2]['error'] == 'invalid_state'
+
+    received = [command_data for command_data, _ in interface.command_queue.drain()]
+    assert CommandCoalescer().coalesce(received, 'idle') == [
+        {'command': 'change_state', 'state': 'thinking', 'parameters': {}},
+        {'command': 'set_parameter', 'parameters': {'intensity': 0.7}},
+    ]
+
+
+def test_parameters_of_return_to_current_state_are_applied():
+    commands = [
+        {'command': 'change_state', 'state': 'idle', 'parameters': {}},
+        {'command': 'change_state', 'state': 'speaking', 'parameters': {'intensity': 2.0, 'duration': 500}},
+        {'command': 'set_parameter', 'parameters': {'duration': 1000}},
+    ]
+    assert CommandCoalescer().coalesce(commands, 'speaking') == [
+        {'command': 'set_parameter', 'parameters': {'intensity': 2.0, 'duration': 1000}}
+    ]
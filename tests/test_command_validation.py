@@ -0,0 +1,94 @@
+import asyncio
+
+import pygame
+import pytest
+
+from animation.controller import EyeMovementController
+from core import binary_protocol
+from core.command_interface import CommandInterface
+from core.command_queue import CommandQueue
+from main import RobotFaceApp
+from utils.frame_clock import frame_clock, VirtualClock
+
+
+@pytest.fixture
+def interface():
+    """検証を通ったコマンドをキューで受け取るコマンドインターフェース"""
+    interface = CommandInterface()
+    interface.command_queue = CommandQueue(16)
+    return interface
+
+
+def process(interface: CommandInterface, command_data: dict) -> dict:
+    return asyncio.run(interface._process_command(command_data))
+
+
+@pytest.mark.parametrize('parameters', [
+    5,
+    'intensity',
+    [0.5],
+    {'intensity': 'abc'},
+    {'intensity': '0.5'},
+    {'intensity': True},
+    {'intensity': float('nan')},
+    {'intensity': float('inf')},
+    {'duration': 'long'},
+    {'lip_sync_pattern': 0.5},
+    {'lip_sync_pattern': [0.5, 'x']},
+    {'lip_sync_pattern': [0.5, None]},
+])
+@pytest.mark.parametrize('command', ['set_parameter', 'change_state'])
+def test_invalid_parameters_are_rejected_before_dispatch(interface, command, parameters):
+    response = process(interface, {'command': command, 'state': 'speaking', 'parameters': parameters})
+    assert response['error'] == 'invalid_parameters'
+    assert len(interface.command_queue) == 0
+
+
+def test_valid_parameters_are_dispatched(interface):
+    parameters = {'intensity': 1.5, 'duration': None, 'lip_sync_pattern': [0, 0.5, 1], 'unknown': 'x'}
+    response = process(interface, {'command': 'set_parameter', 'parameters': parameters})
+    assert response['success'] is True
+    assert interface.command_queue.drain()[0][0]['parameters'] == parameters
+
+
+@pytest.mark.parametrize('x, y', [('nan', 0), (0, 'inf'), (float('-inf'), 0), ('abc', 0)])
+def test_non_finite_gaze_target_is_rejected(interface, x, y):
+    response = process(interface, {'command': 'set_gaze_target', 'x': x, 'y': y})
+    assert response['error'] == 'invalid_gaze_target'
+    assert len(interface.command_queue) == 0
+
+
+@pytest.mark.parametrize('frame', [
+    binary_protocol.encode_set_gaze_target(float('nan'), 0.0),
+    binary_protocol.encode_set_gaze_target(0.0, float('inf')),
+    binary_protocol.encode_set_intensity(float('nan')),
+    binary_protocol.encode_lip_sync_sample(float('-inf')),
+])
+def test_binary_decoder_rejects_non_finite_values(frame):
+    with pytest.raises(binary_protocol.ProtocolError):
+        binary_protocol.decode_command(frame[binary_protocol.HEADER.size:])
+
+
+def test_gaze_target_is_clamped_to_eye_range():
+    controller = EyeMovementController(90, 200)
+    max_x, max_y = controller.get_max_offset()
+    controller.set_target(pygame.math.Vector2(1e30, -1e30))
+    assert controller.target_offset == pygame.math.Vector2(max_x, -max_y)
+    controller.set_target(pygame.math.Vector2(float('-inf'), 10))
+    assert controller.target_offset == pygame.math.Vector2(-max_x, 10)
+
+
+def test_out_of_range_gaze_target_renders():
+    clock = VirtualClock()
+    frame_clock.set_time_source(clock)
+    try:
+        app = RobotFaceApp(enable_command_interface=False, headless=True)
+        app.apply_command({'command': 'set_gaze_target', 'x': 1e30, 'y': -1e30})
+        for _ in range(30):
+            app.run_frame()
+            clock.advance(33)
+        max_x, max_y = app.animation_controller.eye_movement_controller.get_max_offset()
+        assert app.animation_controller.eye_movement_controller.eye_offset.x <= max_x
+    finally:
+        frame_clock.set_time_source(None)
+        pygame.quit()
@@ -0,0 +1,99 @@
+"""定常状態のフレームでログ出力（ログレコード・標準出力・標準エラーへの書き込み）が発生しないことの確認
+
+config.yamlのログ設定（既定はINFO）で各状態に移行した後、フレームを進めている間に
+出力されたログレコードと書き込みを調べる。あわせてDEBUGレベルでも、毎フレーム通るログが
+logging.sample_intervalに1回までに間引かれることを確認する。
+"""
+
+import logging
+import os
+import time
+
+import pygame
+import pytest
+
+from main import RobotFaceApp
+from utils.config import config
+from utils.frame_clock import frame_clock, VirtualClock
+from utils.logger import setup_logging
+
+STATES = ('idle', 'thinking', 'speaking', 'sleeping')
+
+# 状態ごとに進めるフレーム数（benchmarks/check_frame_logging.pyの引数で変更できる）
+FRAMES = int(os.environ.get('CHECK_FRAME_LOGGING_FRAMES', 300))
+
+
+@pytest.fixture(scope='module')
+def app():
+    # フレームごとの時刻を固定間隔で進める
+    clock = VirtualClock()
+    frame_clock.set_time_source(clock)
+    app = RobotFaceApp(enable_command_interface=False)
+    if app.eye_renderer.warmup_thread:
+        app.eye_renderer.warmup_thread.join()
+    app.virtual_clock = clock
+    yield app
+    app.running = False
+    frame_clock.set_time_source(None)
+    pygame.quit()
+
+
+@pytest.fixture
+def configured_logging(caplog):
+    """config.yamlのログ設定を適用（caplogのハンドラーは付け直す）"""
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    logging_config = config.get_logging_config()
+    setup_logging(logging_config)
+    root.addHandler(caplog.handler)
+    yield logging_config
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def run_frames(app: RobotFaceApp, count: int):
+    for _ in range(count):
+        app.virtual_clock.advance(33)
+        dt = frame_clock.tick()
+        app.apply_pending_commands()
+        app.update(dt)
+        app.render_if_changed()
+
+
+def enter_state(app: RobotFaceApp, state: str):
+    app.state_machine.change_state(state)
+    run_frames(app, 2)  # 移行直後のフレーム
+
+
+@pytest.mark.parametrize('state', STATES)
+def test_no_log_output_per_frame_at_configured_level(app, configured_logging, caplog, capsys, state):
+    enter_state(app, state)
+    caplog.clear()
+    capsys.readouterr()
+
+    run_frames(app, FRAMES)
+
+    records = [f"{record.levelname} {record.name}: {record.getMessage()}" for record in caplog.records]
+    assert records == [], f"ログレベル{configured_logging['level']}で毎フレームのログが出力されました"
+    captured = capsys.readouterr()
+    assert captured.out == '' and captured.err == ''
+
+
+def test_per_frame_debug_logs_are_sampled(app, configured_logging, caplog):
+    caplog.set_level(logging.DEBUG)
+    enter_state(app, 'idle')
+    caplog.clear()
+
+    # 移行時と移行直後のフレームも含め、同じキーは実時間のsample_interval内に1回まで
+    start = time.monotonic()
+    enter_state(app, 'sleeping')
+    run_frames(app, FRAMES)
+    elapsed = time.monotonic() - start
+
+    sampled = [record for record in caplog.records if hasattr(record, 'sample_key')]
+    keys = {record.sample_key for record in sampled}
+    assert keys, "毎フレーム通るDEBUGログがありません"
+    assert len(sampled) <= len(keys) * (1 + int(elapsed / configured_logging['sample_interval']))
@@ -0,0 +1,54 @@
+import time
+
+import pygame
+import pytest
+
+from main import RobotFaceApp
+from utils.frame_clock import frame_clock, VirtualClock
+
+# (時刻（ミリ秒）, 視線ターゲット)。どのフレームレートでもフレームの時刻になる200ミリ秒の倍数
+TARGETS = [(0, (60, -30)), (600, (-50, 20)), (1000, (10, 40))]
+
+
+def replay(fps: int, profile: str, via_udp: bool) -> dict:
+    """ターゲットを外部入力と同じ経路（run_frameの更新前）で渡し、200ミリ秒ごとの目の位置を返す"""
+    clock = VirtualClock()
+    frame_clock.set_time_source(clock)
+    try:
+        app = RobotFaceApp(headless=True)
+        controller = app.animation_controller.eye_movement_controller
+        controller.animation_config = dict(controller.animation_config, move_profile=profile)
+        controller.next_look_interval = 10 ** 9
+        live_samples = app.command_interface.live_samples
+
+        positions = {}
+        targets = list(TARGETS)
+        frame_clock.reset()
+        for frame in range(fps * 2 + 1):
+            current_time = round(frame * 1000 / fps)
+            clock.time_ms = current_time
+            while targets and targets[0][0] <= current_time:
+                x, y = targets.pop(0)[1]
+                if via_udp:
+                    live_samples.offer(live_samples.GAZE, current_time / 1000.0, (x, y))
+                else:
+                    app.pending_commands.append(
+                        ({'command': 'set_gaze_target', 'x': x, 'y': y}, time.perf_counter())
+                    )
+            app.run_frame()
+            if current_time % 200 == 0:
+                positions[current_time] = pygame.math.Vector2(controller.eye_offset)
+        return positions
+    finally:
+        frame_clock.set_time_source(None)
+        pygame.quit()
+
+
+@pytest.mark.parametrize('via_udp', [False, True], ids=['command', 'udp'])
+@pytest.mark.parametrize('profile', ['smooth', 'saccade'])
+def test_gaze_motion_is_frame_rate_independent(profile, via_udp):
+    reference = replay(60, profile, via_udp)
+    for fps in (30, 15, 10):
+        positions = replay(fps, profile, via_udp)
+        for sample_time, expected in reference.items():
+            assert positions[sample_time].distance_to(expected) <= 0.5, (fps, sample_time)
@@ -0,0 +1,55 @@
+import time
+
+import pytest
+
+from core import binary_protocol
+from core.command_interface import LiveSampleBuffer, LiveSampleProtocol
+
+SENDER_A = ('192.0.2.1', 5000)
+SENDER_B = ('192.0.2.2', 5000)
+
+
+@pytest.mark.parametrize('datagram', [
+    binary_protocol.encode_udp_sample(binary_protocol.OP_SET_GAZE_TARGET, 1.0, float('nan'), 0.0),
+    binary_protocol.encode_udp_sample(binary_protocol.OP_SET_GAZE_TARGET, 1.0, 0.0, float('inf')),
+    binary_protocol.encode_udp_sample(binary_protocol.OP_LIP_SYNC_SAMPLE, 1.0, float('nan')),
+])
+def test_non_finite_samples_are_dropped(datagram):
+    buffer = LiveSampleBuffer()
+    LiveSampleProtocol(buffer).datagram_received(datagram, SENDER_A)
+    assert buffer.get_stats()['malformed'] == 1
+    assert buffer.take(LiveSampleBuffer.GAZE) is None
+    assert buffer.take(LiveSampleBuffer.LIP) is None
+
+
+def test_out_of_order_sample_from_same_sender_is_dropped():
+    buffer = LiveSampleBuffer()
+    assert buffer.offer(LiveSampleBuffer.GAZE, 10.0, (1, 1), SENDER_A)
+    assert not buffer.offer(LiveSampleBuffer.GAZE, 9.0, (2, 2), SENDER_A)
+    assert buffer.take(LiveSampleBuffer.GAZE) == (1, 1)
+    assert buffer.get_stats()['out_of_order'] == 1
+
+
+def test_ordering_is_per_sender():
+    buffer = LiveSampleBuffer()
+    assert buffer.offer(LiveSampleBuffer.GAZE, 1000.0, (1, 1), SENDER_A)
+    # 別の送信元はタイムスタンプの基準が異なってよい
+    assert buffer.offer(LiveSampleBuffer.GAZE, 0.5, (2, 2), SENDER_B)
+    assert buffer.take(LiveSampleBuffer.GAZE) == (2, 2)
+
+
+def test_restarted_sender_is_accepted_after_timeout():
+    buffer = LiveSampleBuffer(max_age_ms=5)
+    assert buffer.offer(LiveSampleBuffer.LIP, 1000.0, 0.5, SENDER_A)
+    time.sleep(0.02)
+    # 送信側の再起動でタイムスタンプが0に戻っても、途切れた後は受け付ける
+    assert buffer.offer(LiveSampleBuffer.LIP, 0.0, 0.8, SENDER_A)
+    assert buffer.offer(LiveSampleBuffer.LIP, 0.1, 0.9, SENDER_A)
+    assert not buffer.offer(LiveSampleBuffer.LIP, 0.05, 0.1, SENDER_A)
+
+
+def test_sender_records_are_bounded():
+    buffer = LiveSampleBuffer()
+    for port in range(LiveSampleBuffer.MAX_SENDERS * 2):
+        buffer.offer(LiveSampleBuffer.GAZE, 1.0, (0, 0), ('192.0.2.1', port))
+    assert len(buffer._last_accepted) == LiveSampleBuffer.MAX_SENDERS
@@ -0,0 +1,54 @@
+import json
+import socket
+import time
+
+import pytest
+
+from main import RobotFaceApp
+from utils.config import config
+
+
+@pytest.fixture
+def threaded_config(monkeypatch):
+    """コマンドサーバーをスレッドモード・空きポートで起動する設定"""
+    command_config = dict(config.get('command_interface', {}) or {})
+    command_config.update(threaded=True, host='127.0.0.1', port=0, binary_port=None, udp_port=None)
+    monkeypatch.setitem(config._config, 'command_interface', command_config)
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("タイムアウトしました")
+        time.sleep(0.01)
+
+
+def test_threaded_mode_starts_server_thread(threaded_config):
+    app = RobotFaceApp(headless=True)
+    assert app.command_queue is not None
+    interface = app.command_interface
+    result = {}
+
+    def game_loop():
+        # サーバースレッドが起動し、受信したコマンドがキュー経由で描画側に適用されること
+        wait_for(lambda: interface.is_running)
+        result['thread'] = interface.server_thread
+        port = interface.server.sockets[0].getsockname()[1]
+        with socket.create_connection(('127.0.0.1', port), timeout=5) as sock:
+            sock.sendall(json.dumps({'command': 'change_state', 'state': 'thinking'}).encode() + b'\n')
+            result['response'] = json.loads(sock.makefile().readline())
+        wait_for(lambda: app.run_frame() is not None and app.state_machine.current_state_name == 'thinking')
+
+    async def asyncio_fallback():
+        raise AssertionError("スレッドモードなのにasyncioの実行経路が選ばれました")
+
+    app._run_game_loop = game_loop
+    app._run_with_command_interface = asyncio_fallback
+    with pytest.raises(SystemExit):
+        app.run()
+
+    assert result['thread'] is not None and result['thread'].name == 'CommandServer'
+    assert result['response']['success'] is True
+    assert app.command_queue.get_stats()['drained'] == 1
+    assert interface.server_thread is None
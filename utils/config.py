@@ -40,7 +40,10 @@ class Config:
             'width': self.get('display.width', SCREEN_WIDTH),
             'height': self.get('display.height', SCREEN_HEIGHT),
             'fps': self.get('display.fps', FPS),
-            'fullscreen': self.get('display.fullscreen', True)
+            'fullscreen': self.get('display.fullscreen', True),
+            'adaptive_fps': self.get('display.adaptive_fps', ADAPTIVE_FPS),
+            'boost_fps': self.get('display.boost_fps', None),
+            'boost_hold_ms': self.get('display.boost_hold_ms', BOOST_HOLD_MS)
         }
     
     def get_color_config(self) -> Dict[str, tuple]:
@@ -69,18 +72,35 @@ class Config:
         return {
             'look_interval_min': self.get('animation.look_interval_min', LOOK_INTERVAL_MIN),
             'look_interval_max': self.get('animation.look_interval_max', LOOK_INTERVAL_MAX),
-            'move_speed': self.get('animation.move_speed', MOVE_SPEED),
+            'move_profile': self.get('animation.move_profile', MOVE_PROFILE),
+            'move_half_life_ms': self.get('animation.move_half_life_ms', MOVE_HALF_LIFE_MS),
+            'saccade_max_speed': self.get('animation.saccade_max_speed', SACCADE_MAX_SPEED),
+            'saccade_max_accel': self.get('animation.saccade_max_accel', SACCADE_MAX_ACCEL),
             'blink_interval_min': self.get('animation.blink_interval_min', BLINK_INTERVAL_MIN),
             'blink_interval_max': self.get('animation.blink_interval_max', BLINK_INTERVAL_MAX),
             'blink_duration': self.get('animation.blink_duration', BLINK_DURATION),
-            'blink_height_ratio': self.get('animation.blink_height_ratio', BLINK_HEIGHT_RATIO)
+            'blink_height_ratio': self.get('animation.blink_height_ratio', BLINK_HEIGHT_RATIO),
+            'blink_steps': self.get('animation.blink_steps', BLINK_STEPS)
         }
     
     def get_cache_config(self) -> Dict[str, Any]:
         """キャッシュ設定を取得"""
         return {
             'directory': os.path.expanduser(self.get('cache.directory', CACHE_DIR)),
-            'version': self.get('cache.version', CACHE_VERSION)
+            'version': self.get('cache.version', CACHE_VERSION),
+            'max_size_mb': self.get('cache.max_size_mb', CACHE_MAX_SIZE_MB),
+            'format': self.get('cache.format', CACHE_FORMAT)
+        }
+    
+    def get_rendering_config(self) -> Dict[str, Any]:
+        """描画設定を取得"""
+        return {
+            'glow_generator': self.get('rendering.glow_generator', GLOW_GENERATOR),
+            'dirty_rects': self.get('rendering.dirty_rects', DIRTY_RECTS),
+            'skip_unchanged_frames': self.get('rendering.skip_unchanged_frames', SKIP_UNCHANGED_FRAMES),
+            'blink_frame_cache_size': self.get('rendering.blink_frame_cache_size', BLINK_FRAME_CACHE_SIZE),
+            'background_warmup': self.get('rendering.background_warmup', BACKGROUND_WARMUP),
+            'build_workers': self.get('rendering.build_workers', TEXTURE_BUILD_WORKERS)
         }
     
     def get_command_interface_config(self) -> Dict[str, Any]:
@@ -88,12 +108,43 @@ class Config:
         return {
             'host': self.get('command_interface.host', COMMAND_HOST),
             'port': self.get('command_interface.port', COMMAND_PORT),
-            'buffer_size': self.get('command_interface.buffer_size', COMMAND_BUFFER_SIZE)
+            'max_frame_size': self.get('command_interface.max_frame_size', COMMAND_MAX_FRAME_SIZE),
+            'binary_port': self.get('command_interface.binary_port', COMMAND_BINARY_PORT),
+            'udp_port': self.get('command_interface.udp_port', COMMAND_UDP_PORT),
+            'udp_max_age_ms': self.get('command_interface.udp_max_age_ms', COMMAND_UDP_MAX_AGE_MS),
+            'threaded': self.get('command_interface.threaded', COMMAND_THREADED),
+            'queue_size': self.get('command_interface.queue_size', COMMAND_QUEUE_SIZE),
+            'coalesce': self.get('command_interface.coalesce', COMMAND_COALESCE),
+            'push_max_rate_hz': self.get('command_interface.push_max_rate_hz', COMMAND_PUSH_MAX_RATE_HZ),
+            'send_queue_size': self.get('command_interface.send_queue_size', COMMAND_SEND_QUEUE_SIZE),
+            'send_queue_policy': self.get('command_interface.send_queue_policy', COMMAND_SEND_QUEUE_POLICY)
+        }
+    
+    def get_logging_config(self) -> Dict[str, Any]:
+        """ログ設定を取得"""
+        return {
+            'level': self.get('logging.level', LOG_LEVEL),
+            'format': self.get('logging.format', LOG_FORMAT),
+            'sample_interval': self.get('logging.sample_interval', LOG_SAMPLE_INTERVAL),
+            'levels': self.get('logging.levels', None) or {}
+        }
+    
+    def get_profiling_config(self) -> Dict[str, Any]:
+        """フレームの段階ごとの計測の設定を取得"""
+        return {
+            'enabled': self.get('profiling.enabled', PROFILING_ENABLED),
+            'overlay': self.get('profiling.overlay', PROFILING_OVERLAY),
+            'window': self.get('profiling.window', PROFILING_WINDOW),
+            'overlay_interval_ms': self.get('profiling.overlay_interval_ms', PROFILING_OVERLAY_INTERVAL_MS)
         }
     
     def get_state_config(self, state_name: str) -> Dict[str, Any]:
         """状態別設定を取得"""
         return self.get(f'states.{state_name}', {})
+    
+    def get_state_target_fps(self, state_name: str) -> Optional[int]:
+        """状態別の目標フレームレートを取得（未設定の場合はNone）"""
+        return self.get(f'states.{state_name}.target_fps', STATE_TARGET_FPS.get(state_name))
 
 # グローバル設定インスタンス
 config = Config()
\ No newline at end of file
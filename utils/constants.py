@@ -4,6 +4,8 @@ import os
 SCREEN_WIDTH = 720
 SCREEN_HEIGHT = 480
 FPS = 60
+ADAPTIVE_FPS = True  # 状態ごとに目標フレームレートを切り替える
+BOOST_HOLD_MS = 250  # まばたき・視線移動の終了後もブーストを維持する時間
 
 # 色定数
 BLACK = (0, 0, 0)
@@ -14,6 +16,16 @@ BLUE_WHITE = (180, 200, 255)
 # キャッシュ設定
 CACHE_DIR = os.path.expanduser("~/.cyber_eyes_cache")
 CACHE_VERSION = "v2.0"
+CACHE_MAX_SIZE_MB = 32  # キャッシュディレクトリの上限（超えた分は最後に使われた時刻が古いものから削除）
+CACHE_FORMAT = "raw"  # テクスチャの保存形式（raw: 無圧縮をmmapで読み込み / png）
+
+# 描画設定
+GLOW_GENERATOR = "vectorized"  # "vectorized"（numpy）または "legacy"
+DIRTY_RECTS = True  # 変化した領域のみをディスプレイに転送
+SKIP_UNCHANGED_FRAMES = True  # 見た目が変わらないフレームの描画を省略
+BLINK_FRAME_CACHE_SIZE = 64  # プリセット間のまばたきテクスチャを保持する数（LRU）
+BACKGROUND_WARMUP = True  # テクスチャをワーカースレッドで読み込み、完了までは簡易描画で代用
+TEXTURE_BUILD_WORKERS = 1  # 起動時のテクスチャ生成に使うワーカープロセス数（0でCPUコア数、1でプロセスを使わない）
 
 # 画面サイズに基づいた設定
 BASE_SIZE = min(SCREEN_WIDTH, SCREEN_HEIGHT) // 3
@@ -26,13 +38,17 @@ EYE_SPACING = int(BASE_SIZE * 1.2)
 # 動きの設定
 LOOK_INTERVAL_MIN = 1500
 LOOK_INTERVAL_MAX = 4000
-MOVE_SPEED = 0.03
+MOVE_PROFILE = "smooth"  # smooth: 指数関数的に近づく / saccade: 速度・加速度の上限付きで移動して止まる
+MOVE_HALF_LIFE_MS = 379  # smooth: 残りの距離が半分になる時間（60FPSで1フレームに3%近づくのと同じ）
+SACCADE_MAX_SPEED = 2000  # saccade: 最高速度（ピクセル/秒）
+SACCADE_MAX_ACCEL = 60000  # saccade: 加速度・減速度の上限（ピクセル/秒^2）
 
 # まばたき設定
 BLINK_INTERVAL_MIN = 2000
 BLINK_INTERVAL_MAX = 6000
 BLINK_DURATION = 200
 BLINK_HEIGHT_RATIO = 0.2
+BLINK_STEPS = 33  # まばたきの高さの段階数（0でBLINK_PRESETSに丸める）
 
 # まばたきのプリセット比率
 BLINK_PRESETS = [1.0, 0.8, 0.6, 0.4, 0.2]
@@ -44,7 +60,35 @@ class States:
     SPEAKING = "speaking"
     SLEEPING = "sleeping"
 
+# 状態別の目標フレームレート（display.fpsが上限）
+STATE_TARGET_FPS = {
+    States.IDLE: 30,
+    States.THINKING: 60,
+    States.SPEAKING: 60,
+    States.SLEEPING: 15,
+}
+
 # コマンドインターフェース設定
 COMMAND_HOST = "localhost"
 COMMAND_PORT = 8888
-COMMAND_BUFFER_SIZE = 1024
\ No newline at end of file
+COMMAND_BINARY_PORT = None  # バイナリプロトコル用ポート（Noneで無効）
+COMMAND_UDP_PORT = None  # 視線・リップシンク強度のUDPサンプル用ポート（Noneで無効）
+COMMAND_UDP_MAX_AGE_MS = 100  # これより古いUDPサンプルは適用しない
+COMMAND_MAX_FRAME_SIZE = 65536  # 改行区切りの1コマンドの最大サイズ（バイト）
+COMMAND_THREADED = False  # Trueでサーバーを専用スレッドで実行
+COMMAND_QUEUE_SIZE = 256  # スレッドモードでのコマンドキューの容量
+COMMAND_COALESCE = True  # 1フレーム内のコマンドを最終結果が同じになる範囲でまとめる
+COMMAND_PUSH_MAX_RATE_HZ = 10  # subscribeしたクライアントへのpush通知の最大頻度（1クライアントあたり）
+COMMAND_SEND_QUEUE_SIZE = 64  # クライアントごとの送信キューの容量（メッセージ数）
+COMMAND_SEND_QUEUE_POLICY = "disconnect"  # 送信キューが満杯の場合の動作（drop_oldest / drop_newest / disconnect）
+
+# ログ設定
+LOG_LEVEL = "INFO"  # DEBUG / INFO / WARNING / ERROR
+LOG_FORMAT = "text"  # text: 1行のテキスト / json: 1行1レコードのJSON
+LOG_SAMPLE_INTERVAL = 5.0  # 毎フレーム通る処理のログを出力する最小間隔（秒）
+
+# フレームの段階ごとの計測
+PROFILING_ENABLED = False  # 常に計測する（get_metricsで取得可能。無効時もF3でオーバーレイを表示すると計測する）
+PROFILING_OVERLAY = False  # 起動時に計測結果のオーバーレイを表示する
+PROFILING_WINDOW = 300  # 統計に使う直近のフレーム数
+PROFILING_OVERLAY_INTERVAL_MS = 500  # オーバーレイの表示内容を更新する間隔（ミリ秒）
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Dict, List, Callable, Any
 from enum import Enum
+import logging
 import time
 
 class EventType(Enum):
@@ -21,6 +22,7 @@ class EventSystem:
     """イベントシステム（Observer パターン）"""
     
     def __init__(self):
+        self.logger = logging.getLogger(__name__)
         self._listeners: Dict[EventType, List[Callable]] = {}
     
     def subscribe(self, event_type: EventType, callback: Callable[[Event], None]):
@@ -48,7 +50,7 @@ class EventSystem:
                 try:
                     callback(event)
                 except Exception as e:
-                    print(f"イベントリスナーでエラーが発生しました: {e}")
+                    self.logger.error(f"イベントリスナーでエラーが発生しました: {e}")
     
     def clear_listeners(self, event_type: EventType = None):
         """リスナーをクリア"""
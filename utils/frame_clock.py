@@ -0,0 +1,71 @@
+import pygame
+from typing import Callable, Optional
+
+class FrameClock:
+    """フレームの時刻を共有する時計
+
+    メインループがフレームの開始時にtick()で時刻を1回だけ取得し、アニメーションや
+    状態はframe_clock.nowを参照する。同じフレーム内の処理はすべて同じ時刻を使う。
+    時刻の取得元は差し替えられる（既定はpygame.time.get_ticks）。VirtualClockを
+    使うと実時間と無関係に時刻を進められるため、実時間より速いシミュレーションや
+    再現性のあるベンチマークに使える。
+    """
+
+    def __init__(self, time_source: Optional[Callable[[], int]] = None):
+        """
+        Args:
+            time_source: 現在時刻（ミリ秒）を返す関数（Noneの場合はpygame.time.get_ticks）
+        """
+        self.time_source = time_source
+        self.now = 0  # 現在のフレームの時刻（ミリ秒）
+        self.dt = 0.0  # 前のフレームからの経過時間（秒）
+
+    def set_time_source(self, time_source: Optional[Callable[[], int]]):
+        """時刻の取得元を差し替え、その時刻から計測し直す
+
+        Args:
+            time_source: 現在時刻（ミリ秒）を返す関数（Noneの場合はpygame.time.get_ticks）
+        """
+        self.time_source = time_source
+        self.reset()
+
+    def _read(self) -> int:
+        if self.time_source is None:
+            return pygame.time.get_ticks()
+        return self.time_source()
+
+    def reset(self):
+        """現在時刻を取得し直し、経過時間を0にする（ループの開始時など）"""
+        self.now = self._read()
+        self.dt = 0.0
+
+    def tick(self) -> float:
+        """フレームの開始時に時刻を取得
+
+        Returns:
+            前のフレームからの経過時間（秒）
+        """
+        now = self._read()
+        self.dt = (now - self.now) / 1000.0
+        self.now = now
+        return self.dt
+
+class VirtualClock:
+    """実時間と無関係にadvance()でのみ進む時刻の取得元（FrameClock用）"""
+
+    def __init__(self, start_ms: float = 0.0):
+        self.time_ms = start_ms
+
+    def __call__(self) -> int:
+        return int(self.time_ms)
+
+    def advance(self, milliseconds: float):
+        """時刻を進める
+
+        Args:
+            milliseconds: 進める時間（ミリ秒）
+        """
+        self.time_ms += milliseconds
+
+# グローバルなフレーム時計のインスタンス
+frame_clock = FrameClock()
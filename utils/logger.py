@@ -0,0 +1,91 @@
+import json
+import logging
+import sys
+import time
+from typing import Any, Dict
+
+# ログレコードの標準の属性（これ以外はextraで渡された構造化フィールド）
+_STANDARD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+# ホットパスのログの最小間隔（秒、setup_loggingで設定）
+_sample_interval = 5.0
+
+
+class JsonFormatter(logging.Formatter):
+    """1レコードを1行のJSONにするフォーマッター
+
+    extraで渡したフィールドはそのままキーとして出力する。
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging(logging_config: Dict[str, Any]):
+    """config.yamlのlogging設定でロガーを構成
+
+    Args:
+        logging_config: config.get_logging_config()の結果
+    """
+    global _sample_interval
+    _sample_interval = logging_config['sample_interval']
+
+    handler = logging.StreamHandler(sys.stdout)
+    if logging_config['format'] == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(logging_config['level'].upper())
+
+    for name, level in logging_config['levels'].items():
+        logging.getLogger(name).setLevel(str(level).upper())
+
+
+class SampledLogger:
+    """毎フレーム通る処理用のロガー
+
+    レベルが無効なら何もしない（メッセージの整形もしない）。有効な場合も、
+    同じキーのログは設定の間隔（logging.sample_interval）に1回までに間引き、
+    間引いた件数を次のログに付ける。
+    """
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(name)
+        self._last_logged: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = {}
+
+    def debug(self, key: str, message: str, *args):
+        """DEBUGレベルのログを間引いて出力"""
+        self.log(logging.DEBUG, key, message, *args)
+
+    def log(self, level: int, key: str, message: str, *args):
+        if not self.logger.isEnabledFor(level):
+            return
+
+        now = time.monotonic()
+        last = self._last_logged.get(key)
+        if last is not None and now - last < _sample_interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return
+
+        self._last_logged[key] = now
+        suppressed = self._suppressed.pop(key, 0)
+        if suppressed:
+            message += f"（前回から{suppressed}件省略）"
+        self.logger.log(level, message, *args, extra={'sample_key': key, 'suppressed': suppressed})
@@ -0,0 +1,156 @@
+from array import array
+import gc
+import sys
+import time
+from typing import Any, Dict, List
+
+from utils.stats import RollingStats
+
+class FrameProfiler:
+    """フレーム内の処理段階ごとの時間と、メモリ割り当ての増減を計測するクラス
+
+    begin_frame()でフレームを開始し、各段階の処理が終わるたびにmark(段階名)を呼ぶ。
+    前回のmark（またはbegin_frame）からの経過時間がその段階の時間になる。
+    begin_frame()より前のmark()は無視する（フレームの途中で計測を有効にした場合など）。
+    割り当ては、フレームの前後で生存しているメモリブロック数（sys.getallocatedblocks）の
+    差と、計測中に発生したGCの回数（世代ごと）で表す。計測自体が割り当ての増減に
+    含まれないよう、フレーム中の段階の時間はarrayに保持し、統計への追加は
+    ブロック数を数えた後に行う。
+    """
+
+    # 段階（イベント処理, 更新, 目の描画, 状態のオーバーレイ描画,
+    # 計測結果のオーバーレイ描画（表示中のみ）, 画面への転送）
+    STAGES = ('events', 'update', 'eyes', 'overlay', 'profiler', 'present')
+
+    def __init__(self, window: int = 10000):
+        """
+        Args:
+            window: 統計に使う直近のフレーム数
+        """
+        self.window = window
+        self.reset()
+
+    def reset(self):
+        """計測値をクリア"""
+        self.stage_times = {stage: RollingStats(self.window) for stage in self.STAGES}
+        self.frame_times = RollingStats(self.window)
+        self.frame_intervals = RollingStats(self.window)  # フレームの開始間隔（FPSの計算用）
+        self.allocated_blocks = RollingStats(self.window)
+        self.frame_count = 0
+        self.gc_collections_at_start = self._get_gc_collections()
+        self._in_frame = False
+        self._frame_start = None
+        self._last_mark = 0.0
+        self._blocks_at_start = 0
+        self._stage_index = {stage: index for index, stage in enumerate(self.STAGES)}
+        self._durations = array('d', [0.0] * len(self.STAGES))
+        self._marked = bytearray(len(self.STAGES))
+
+    @staticmethod
+    def _get_gc_collections() -> List[int]:
+        return [generation['collections'] for generation in gc.get_stats()]
+
+    def begin_frame(self):
+        """フレームの計測を開始"""
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame_intervals.add((now - self._frame_start) * 1000.0)
+        self._frame_start = now
+        self._last_mark = now
+        self._in_frame = True
+        self._blocks_at_start = sys.getallocatedblocks()
+
+    def mark(self, stage: str):
+        """段階の終わりを記録（前回の記録からの経過時間をその段階の時間とする）"""
+        if not self._in_frame:
+            return
+        now = time.perf_counter()
+        index = self._stage_index[stage]
+        self._durations[index] = (now - self._last_mark) * 1000.0
+        self._marked[index] = 1
+        self._last_mark = now
+
+    def end_frame(self):
+        """フレームの計測を終了"""
+        if not self._in_frame:
+            return
+        allocated_blocks = sys.getallocatedblocks() - self._blocks_at_start
+        now = time.perf_counter()
+        self.frame_times.add((now - self._frame_start) * 1000.0)
+        self.allocated_blocks.add(allocated_blocks)
+        for index, stage in enumerate(self.STAGES):
+            if self._marked[index]:
+                self.stage_times[stage].add(self._durations[index])
+                self._marked[index] = 0
+        self.frame_count += 1
+        self._in_frame = False
+
+    def get_fps(self) -> float:
+        """直近のフレームの開始間隔から求めた平均フレームレート"""
+        total_ms = sum(self.frame_intervals.samples)
+        if not total_ms:
+            return 0.0
+        return len(self.frame_intervals) * 1000.0 / total_ms
+
+    def get_report(self) -> Dict[str, Any]:
+        """計測結果を取得
+
+        Returns:
+            フレーム数・FPS・フレーム全体と段階ごとの時間（ミリ秒）の統計・
+            フレームごとのメモリブロック数の増減の統計・世代ごとのGC回数の辞書
+        """
+        gc_collections = [
+            count - start
+            for count, start in zip(self._get_gc_collections(), self.gc_collections_at_start)
+        ]
+        return {
+            'frames': self.frame_count,
+            'fps': self.get_fps(),
+            'frame_ms': self.frame_times.summary(),
+            'stages_ms': {stage: stats.summary() for stage, stats in self.stage_times.items()},
+            'allocated_blocks': self.allocated_blocks.summary(),
+            'gc_collections': gc_collections
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """外部に返す計測結果（get_report()の値を丸めたもの、計測していない段階は除く）"""
+        report = self.get_report()
+        return {
+            'frames': report['frames'],
+            'fps': round(report['fps'], 1),
+            'frame_ms': self._round_summary(report['frame_ms']),
+            'stages_ms': {
+                stage: self._round_summary(summary)
+                for stage, summary in report['stages_ms'].items() if summary['count']
+            },
+            'allocated_blocks': self._round_summary(report['allocated_blocks']),
+            'gc_collections': report['gc_collections']
+        }
+
+    @staticmethod
+    def _round_summary(summary: Dict[str, float]) -> Dict[str, float]:
+        return {key: round(value, 3) for key, value in summary.items()}
+
+    def format_report(self) -> str:
+        """計測結果を表形式の文字列にする"""
+        report = self.get_report()
+        lines = [
+            f"{report['frames']}フレーム, {report['fps']:.1f} FPS",
+            f"{'段階':10s} {'平均':>8s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'最大':>8s} (ms)"
+        ]
+        rows = list(report['stages_ms'].items()) + [('frame', report['frame_ms'])]
+        for name, summary in rows:
+            if not summary['count']:
+                continue
+            lines.append(f"{name:10s} " + ' '.join(
+                f"{summary[key]:8.3f}" for key in ('mean', 'p50', 'p95', 'p99', 'max')
+            ))
+
+        blocks = report['allocated_blocks']
+        if blocks['count']:
+            lines.append(f"メモリブロック数の増減/フレーム: 平均 {blocks['mean']:+.1f}, "
+                         f"p95 {blocks['p95']:+d}, 最大 {blocks['max']:+d}")
+        lines.append("GC回数: " + ', '.join(
+            f"世代{generation} {count}" for generation, count in enumerate(report['gc_collections'])
+        ))
+        return '\n'.join(lines)
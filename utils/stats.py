@@ -0,0 +1,61 @@
+from collections import deque
+from typing import Dict, Optional
+
+class RollingStats:
+    """直近N件の計測値から平均・パーセンタイルを計算するクラス"""
+
+    def __init__(self, maxlen: int = 1000):
+        self.samples = deque(maxlen=maxlen)
+        self.total_count = 0
+
+    def add(self, value: float):
+        """計測値を追加"""
+        self.samples.append(value)
+        self.total_count += 1
+
+    def clear(self):
+        """計測値をクリア"""
+        self.samples.clear()
+        self.total_count = 0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    @staticmethod
+    def _percentile(sorted_values: list, percent: float) -> float:
+        """ソート済みリストのパーセンタイル値を取得（最近傍法）"""
+        index = int(round(percent / 100.0 * (len(sorted_values) - 1)))
+        return sorted_values[index]
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """パーセンタイル値を取得
+
+        Args:
+            percent: パーセンタイル（0-100）
+
+        Returns:
+            パーセンタイル値（計測値がない場合はNone）
+        """
+        if not self.samples:
+            return None
+        return self._percentile(sorted(self.samples), percent)
+
+    def summary(self) -> Dict[str, float]:
+        """統計の要約を取得
+
+        Returns:
+            件数・平均・p50/p95/p99・最大値の辞書
+        """
+        if not self.samples:
+            return {'count': 0, 'total_count': self.total_count}
+
+        values = sorted(self.samples)
+        return {
+            'count': len(values),
+            'total_count': self.total_count,
+            'mean': sum(values) / len(values),
+            'p50': self._percentile(values, 50),
+            'p95': self._percentile(values, 95),
+            'p99': self._percentile(values, 99),
+            'max': values[-1]
+        }